@@ -22,32 +22,35 @@ export function useWebSocket(runId: string) {
     }
 
     ws.onmessage = (evt) => {
-      let data: Record<string, unknown>
+      let data: unknown
       try {
         data = JSON.parse(evt.data)
       } catch {
         return
       }
 
-      const event = data as {
+      // The server coalesces bursts into one frame: an array of events
+      const events = (Array.isArray(data) ? data : [data]) as {
         kind: string
         run_id: string
         iteration: number
         payload: Record<string, unknown>
         ts: number
-      }
+      }[]
 
-      // Dispatch to event store
-      eventStore.addEvent({
-        kind: event.kind as never,
-        run_id: event.run_id,
-        iteration: event.iteration,
-        payload: event.payload,
-        ts: event.ts,
-      })
+      for (const event of events) {
+        // Dispatch to event store
+        eventStore.addEvent({
+          kind: event.kind as never,
+          run_id: event.run_id,
+          iteration: event.iteration,
+          payload: event.payload,
+          ts: event.ts,
+        })
 
-      // Update run store based on event kind
-      handleEvent(event)
+        // Update run store based on event kind
+        handleEvent(event)
+      }
     }
 
     ws.onerror = () => {
@@ -1,4 +1,4 @@
-from retrai.cli.app import app
+from retrai.cli.__main__ import main
 
 if __name__ == "__main__":
-    app()
+    main()
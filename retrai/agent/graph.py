@@ -5,7 +5,7 @@ from __future__ import annotations
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, START, StateGraph
 
-from retrai.agent.nodes.act import act_node
+from retrai.agent.nodes.act import act_node, act_one_node
 from retrai.agent.nodes.evaluate import evaluate_node
 from retrai.agent.nodes.human_check import human_check_node
 from retrai.agent.nodes.plan import plan_node
@@ -22,12 +22,16 @@ def build_graph(hitl_enabled: bool = False):
                                            (hitl?) → human_check → plan
                                                    ↓ no hitl
                                                   plan
+
+    When every pending tool call is read-only, plan fans out with ``Send`` to
+    one ``act_one`` branch per call instead of going through ``act``.
     """
     builder = StateGraph(AgentState)
 
     # Add nodes
     builder.add_node("plan", plan_node)
     builder.add_node("act", act_node)
+    builder.add_node("act_one", act_one_node)
     builder.add_node("evaluate", evaluate_node)
     if hitl_enabled:
         builder.add_node("human_check", human_check_node)
@@ -40,6 +44,7 @@ def build_graph(hitl_enabled: bool = False):
         {"act": "act", "evaluate": "evaluate"},
     )
     builder.add_edge("act", "evaluate")
+    builder.add_edge("act_one", "evaluate")
     builder.add_conditional_edges(
         "evaluate",
         route_after_evaluate,
@@ -2,84 +2,236 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import os
+from collections import OrderedDict
+from collections.abc import Iterator
 
 from langchain_core.messages import ToolMessage
 from langchain_core.runnables import RunnableConfig
 
-from retrai.agent.state import AgentState, ToolResult
-from retrai.events.types import AgentEvent
-from retrai.tools.bash_exec import bash_exec
-from retrai.tools.file_patch import file_patch
-from retrai.tools.file_read import file_list, file_read
-from retrai.tools.file_write import file_write
-from retrai.tools.pytest_runner import run_pytest
+from retrai.agent.state import AgentState, ToolCall, ToolResult
+from retrai.events.types import TOOL_RESULT_PREVIEW_CHARS, AgentEvent
+from retrai.utils import jsonx
+
+# Tools that only read the project tree. Consecutive calls to these are
+# dispatched concurrently; anything else runs alone, in order.
+PARALLEL_SAFE_TOOLS = frozenset({"file_read", "file_list"})
+
+# Tools whose successful results are memoized per run. An entry is reused only
+# while the target's (mtime_ns, size) is unchanged, so edits made outside the
+# tools (HITL pauses, goal checks, builds) are seen too.
+_CACHEABLE_TOOLS = frozenset({"file_read", "file_list"})
+_MAX_CACHED_RUNS = 16
+
+# (tool name, resolved target path) -> (content, (mtime_ns, size) when read)
+_CacheKey = tuple[str, str]
+_CacheEntry = tuple[str, tuple[int, int]]
+_tool_caches: OrderedDict[str, dict[_CacheKey, _CacheEntry]] = OrderedDict()
 
 
 async def act_node(state: AgentState, config: RunnableConfig) -> dict:
-    """Execute all pending tool calls and return results."""
+    """Execute all pending tool calls and return results.
+
+    Runs of consecutive read-only calls are fanned out with ``asyncio.gather``
+    (bounded by the ``tool_concurrency`` config value, default 8). Results and
+    messages keep the order in which the LLM requested the calls, and each
+    batch's tool_call / tool_result events are published together. Successful
+    file_read / file_list results are reused within a run while the target is
+    unchanged on disk.
+    """
     cfg = config.get("configurable", {})
     event_bus = cfg.get("event_bus")
+    semaphore = asyncio.Semaphore(cfg.get("tool_concurrency", 8))
     run_id = state["run_id"]
     iteration = state["iteration"]
-    cwd = state["cwd"]
-
-    tool_results: list[ToolResult] = []
-    tool_messages: list[ToolMessage] = []
 
-    for tc in state["pending_tool_calls"]:
-        tool_name = tc["name"]
-        args = tc["args"]
-        tool_call_id = tc["id"]
+    pending = state["pending_tool_calls"]
+    n = len(pending)
+    tool_results: list[ToolResult] = [None] * n  # type: ignore[list-item]
+    tool_messages: list[ToolMessage] = [None] * n  # type: ignore[list-item]
+    episodic: dict[str, str] = {}
+    i = 0
 
+    for batch in _batches(pending):
         if event_bus:
-            await event_bus.publish(
-                AgentEvent(
-                    kind="tool_call",
-                    run_id=run_id,
-                    iteration=iteration,
-                    payload={"tool": tool_name, "args": args},
-                )
+            await event_bus.publish_many(
+                [
+                    AgentEvent(
+                        kind="tool_call",
+                        run_id=run_id,
+                        iteration=iteration,
+                        payload={"tool": tc["name"], "args": tc["args"]},
+                    )
+                    for tc in batch
+                ]
             )
 
-        content, error = await _dispatch(tool_name, args, cwd)
-
-        if event_bus:
-            await event_bus.publish(
-                AgentEvent(
-                    kind="tool_result",
-                    run_id=run_id,
-                    iteration=iteration,
-                    payload={
-                        "tool": tool_name,
-                        "content": content[:500],
-                        "error": error,
-                    },
+        coros = [_run_tool(tc, state, semaphore) for tc in batch]
+        outcomes = await asyncio.gather(*coros, return_exceptions=True)
+        post_events: list[AgentEvent] = []
+        for tc, outcome in zip(batch, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                outcome = f"Tool error: {type(outcome).__name__}: {outcome}", True
+            content, error = outcome
+            tool_results[i], tool_messages[i] = _make_outcome(tc, content, error)
+            i += 1
+            key, summary = _episode(tc, content, error)
+            episodic[key] = summary
+            if event_bus:
+                preview = content[:TOOL_RESULT_PREVIEW_CHARS]
+                post_events.append(
+                    AgentEvent(
+                        kind="tool_result",
+                        run_id=run_id,
+                        iteration=iteration,
+                        payload={"tool": tc["name"], "content": preview, "error": error},
+                    )
                 )
-            )
 
-        result = ToolResult(
-            tool_call_id=tool_call_id,
-            name=tool_name,
-            content=content,
-            error=error,
-        )
-        tool_results.append(result)
-        tool_messages.append(
-            ToolMessage(content=content, tool_call_id=tool_call_id, name=tool_name)
-        )
+        if event_bus:
+            await event_bus.publish_many(post_events)
 
     return {
         "messages": tool_messages,
         "tool_results": tool_results,
         "pending_tool_calls": [],
+        "episodic": episodic,
     }
 
 
+async def act_one_node(state: AgentState, config: RunnableConfig) -> dict:
+    """Execute the single tool call of a ``Send`` fan-out branch (see routers)."""
+    update = await act_node(state, config)
+    # Sibling branches finish in the same step and pending_tool_calls has no
+    # reducer; plan overwrites it on the next iteration anyway.
+    del update["pending_tool_calls"]
+    return update
+
+
+def _batches(tool_calls: list[ToolCall]) -> Iterator[list[ToolCall]]:
+    """Group consecutive parallel-safe calls; every other call is its own batch."""
+    batch: list[ToolCall] = []
+    for tc in tool_calls:
+        if tc["name"] in PARALLEL_SAFE_TOOLS:
+            batch.append(tc)
+            continue
+        if batch:
+            yield batch
+            batch = []
+        yield [tc]
+    if batch:
+        yield batch
+
+
+async def _run_tool(
+    tc: ToolCall,
+    state: AgentState,
+    semaphore: asyncio.Semaphore,
+) -> tuple[str, bool]:
+    """Run one tool call through the per-run result cache. Returns (content, is_error)."""
+    tool_name = tc["name"]
+    args = tc["args"]
+
+    cwd = state["cwd"]
+    cache = _run_cache(state["run_id"])
+    key: _CacheKey | None = None
+    stamp: tuple[int, int] | None = None
+    if tool_name in _CACHEABLE_TOOLS:
+        key = (tool_name, _resolve(args.get("path", "."), cwd))
+        # Stamp before dispatching: a change racing the read makes it stale
+        stamp = _stamp(key[1])
+        cached = cache.get(key)
+        if cached is not None and stamp is not None and cached[1] == stamp:
+            return cached[0], False
+
+    async with semaphore:
+        content, error = await _dispatch(tool_name, args, cwd)
+    if key is not None:
+        if not error and stamp is not None:
+            cache[key] = (content, stamp)
+    else:
+        _invalidate(cache, tool_name, args, cwd)
+
+    return content, error
+
+
+def _resolve(path: object, cwd: str) -> str:
+    """Resolve a tool path argument the way the tools do (relative to *cwd*)."""
+    return os.path.realpath(os.path.join(cwd, str(path)))
+
+
+def _stamp(path: str) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for *path*, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _run_cache(run_id: str) -> dict[_CacheKey, _CacheEntry]:
+    """Return the tool-result cache for *run_id*, evicting the oldest runs."""
+    cache = _tool_caches.get(run_id)
+    if cache is None:
+        cache = _tool_caches[run_id] = {}
+        while len(_tool_caches) > _MAX_CACHED_RUNS:
+            _tool_caches.popitem(last=False)
+    else:
+        _tool_caches.move_to_end(run_id)
+    return cache
+
+
+def _invalidate(cache: dict[_CacheKey, _CacheEntry], tool_name: str, args: dict, cwd: str) -> None:
+    """Drop cached results that a mutating tool call may have made stale.
+
+    The mtime/size stamps catch most changes on their own; this also covers
+    writes that land within the filesystem's timestamp granularity.
+    """
+    if tool_name not in ("file_write", "file_patch"):
+        # bash_exec (or anything unknown) may touch any file
+        cache.clear()
+        return
+    written = _resolve(args.get("path", ""), cwd)
+    for key in list(cache):
+        name, path = key
+        if name == "file_read" and path != written and not path.startswith(written + os.sep):
+            continue
+        del cache[key]
+
+
+def _episode(tc: ToolCall, content: str, error: bool) -> tuple[str, str]:
+    """Return the episodic-memory (key, summary) entry for one tool attempt."""
+    canonical = json.dumps(tc["args"], sort_keys=True, default=str)
+    key = hashlib.sha1(f"{tc['name']}:{canonical}".encode()).hexdigest()
+    summary = f"{tc['name']}({canonical[:200]}) -> {'ERR' if error else 'ok'}: {content[:200]}"
+    return key, summary
+
+
+def _make_outcome(tc: ToolCall, content: str, error: bool) -> tuple[ToolResult, ToolMessage]:
+    result = ToolResult(
+        tool_call_id=tc["id"],
+        name=tc["name"],
+        content=content,
+        error=error,
+    )
+    message = ToolMessage(content=content, tool_call_id=tc["id"], name=tc["name"])
+    return result, message
+
+
 async def _dispatch(tool_name: str, args: dict, cwd: str) -> tuple[str, bool]:
-    """Dispatch a single tool call. Returns (content, is_error)."""
+    """Dispatch a single tool call. Returns (content, is_error).
+
+    Tool modules are imported on first use so a run only loads what it calls.
+    """
     try:
         if tool_name == "bash_exec":
+            from retrai.tools.bash_exec import bash_exec
+
             result = await bash_exec(
                 command=args["command"],
                 cwd=cwd,
@@ -95,22 +247,29 @@ async def _dispatch(tool_name: str, args: dict, cwd: str) -> tuple[str, bool]:
             return output[:8000], False
 
         elif tool_name == "file_read":
+            from retrai.tools.file_read import file_read
+
             content = await file_read(args["path"], cwd)
             return content, False
 
         elif tool_name == "file_list":
+            from retrai.tools.file_read import file_list
+
             path = args.get("path", ".")
             entries = await file_list(path, cwd)
             return "\n".join(entries), False
 
         elif tool_name == "file_write":
+            from retrai.tools.file_write import file_write
+
             written = await file_write(args["path"], args["content"], cwd)
             return f"Written: {written}", False
 
         elif tool_name == "run_pytest":
-            import asyncio
+            from retrai.tools.pytest_runner import run_pytest
 
-            result = await asyncio.get_event_loop().run_in_executor(None, run_pytest, cwd)
+            # The runner enforces the output/failure caps, so nothing is sliced here
+            result = await asyncio.to_thread(run_pytest, cwd, stdout_cap=3000, max_failures=10)
             summary = {
                 "exit_code": result.exit_code,
                 "passed": result.passed,
@@ -118,17 +277,19 @@ async def _dispatch(tool_name: str, args: dict, cwd: str) -> tuple[str, bool]:
                 "error": result.error,
                 "total": result.total,
             }
-            output = json.dumps(
+            output = jsonx.dumps(
                 {
                     "summary": summary,
-                    "failures": result.failures[:10],
-                    "stdout": result.stdout[:3000],
+                    "failures": result.failures,
+                    "stdout": result.stdout,
                 },
-                indent=2,
+                indent=True,
             )
             return output, False
 
         elif tool_name == "file_patch":
+            from retrai.tools.file_patch import file_patch
+
             result_msg = await file_patch(args["path"], args["old"], args["new"], cwd)
             return result_msg, False
 
@@ -20,6 +20,9 @@ async def evaluate_node(state: AgentState, config: RunnableConfig) -> dict:
 
     new_iteration = iteration + 1
 
+    if goal is None and cfg.get("skip_goal_noop", True):
+        return await _evaluate_without_goal(state, event_bus, new_iteration)
+
     if goal:
         result = await goal.check(state, cwd)
         achieved = result.achieved
@@ -77,14 +80,55 @@ async def evaluate_node(state: AgentState, config: RunnableConfig) -> dict:
     }
 
 
+async def _evaluate_without_goal(state: AgentState, event_bus, new_iteration: int) -> dict:
+    """No-goal fast path: count the iteration without a goal_check or status message."""
+    if event_bus:
+        await event_bus.publish(
+            AgentEvent(
+                kind="iteration_complete",
+                run_id=state["run_id"],
+                iteration=new_iteration,
+                payload={"iteration": new_iteration, "goal_achieved": False},
+            )
+        )
+    update: dict = {"iteration": new_iteration}
+    if new_iteration >= state["max_iterations"]:
+        update["goal_achieved"] = False
+        max_iter = state["max_iterations"]
+        update["goal_reason"] = f"Max iterations ({max_iter}) reached. No goal defined"
+    return update
+
+
 def _truncate_details(details: dict, max_len: int = 2000) -> dict:
-    """Truncate long string values in details dict for event payload."""
-    truncated = {}
-    for k, v in details.items():
-        if isinstance(v, str) and len(v) > max_len:
-            truncated[k] = v[:max_len] + "..."
-        elif isinstance(v, dict):
-            truncated[k] = _truncate_details(v, max_len)
-        else:
-            truncated[k] = v
-    return truncated
+    """Truncate long string values in details dict for event payload.
+
+    Returns *details* itself when nothing is over *max_len*; otherwise only the
+    dicts on the path to a truncated value are copied.
+    """
+    # Pass 1: locate over-long strings without copying anything
+    hits: list[tuple[tuple, str]] = []
+    stack: list[tuple[tuple, dict]] = [((), details)]
+    while stack:
+        path, d = stack.pop()
+        for k, v in d.items():
+            if isinstance(v, str):
+                if len(v) > max_len:
+                    hits.append(((*path, k), v[:max_len] + "..."))
+            elif isinstance(v, dict):
+                stack.append(((*path, k), v))
+    if not hits:
+        return details
+
+    # Pass 2: copy-on-write along each hit path
+    root = dict(details)
+    copies: dict[tuple, dict] = {(): root}
+    for path, value in hits:
+        node = root
+        for depth in range(1, len(path)):
+            child = copies.get(path[:depth])
+            if child is None:
+                child = copies[path[:depth]] = dict(node[path[depth - 1]])
+                node[path[depth - 1]] = child
+            node = child
+        node[path[-1]] = value
+    return root
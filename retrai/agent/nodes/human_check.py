@@ -8,6 +8,8 @@ from langgraph.types import interrupt
 from retrai.agent.state import AgentState
 from retrai.events.types import AgentEvent
 
+_APPROVALS = frozenset({"approve", "yes", "continue"})
+
 
 async def human_check_node(state: AgentState, config: RunnableConfig) -> dict:
     """Interrupt execution to wait for human approval."""
@@ -50,7 +52,7 @@ async def human_check_node(state: AgentState, config: RunnableConfig) -> dict:
         )
 
     # decision is whatever the human passed in resume()
-    approved = decision in (True, "approve", "yes", "continue")
+    approved = decision is True or (isinstance(decision, str) and decision in _APPROVALS)
     if not approved:
-        return {"goal_achieved": False, "goal_reason": "Aborted by user."}
+        return {"goal_achieved": False, "goal_reason": "Aborted by user.", "aborted": True}
     return {}
@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 import inspect
+from collections import OrderedDict
 from typing import Any
 
-from langchain_core.messages import AIMessage, SystemMessage
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
 from langchain_core.runnables import RunnableConfig
+from langchain_core.utils.function_calling import convert_to_openai_tool
 
 from retrai.agent.state import AgentState, ToolCall
 from retrai.events.types import AgentEvent
@@ -99,6 +107,23 @@ TOOL_DEFINITIONS = [
     },
 ]
 
+# Converted once at import; bind_tools passes OpenAI-format tools through as-is
+_TOOLS = [convert_to_openai_tool(d) for d in TOOL_DEFINITIONS]
+
+# Bound runnables keyed by model name, reused while get_llm returns the same instance
+_BOUND_LLMS: dict[str, tuple[Any, Any]] = {}
+
+
+def _get_bound_llm(model_name: str) -> Any:
+    """Return the LLM for *model_name* with the agent tools bound, binding once per model."""
+    llm = get_llm(model_name)
+    cached = _BOUND_LLMS.get(model_name)
+    if cached is not None and cached[0] is llm:
+        return cached[1]
+    bound = llm.bind_tools(_TOOLS)  # type: ignore[attr-defined]
+    _BOUND_LLMS[model_name] = (llm, bound)
+    return bound
+
 
 async def plan_node(state: AgentState, config: RunnableConfig) -> dict:
     """Call the LLM to decide next actions."""
@@ -118,19 +143,15 @@ async def plan_node(state: AgentState, config: RunnableConfig) -> dict:
             )
         )
 
-    llm = get_llm(state["model_name"])
+    # Build messages — start with system prompt on first iteration. The history
+    # is only read, so it is passed through without copying.
+    messages = state["messages"] or [SystemMessage(content=_build_system_prompt(goal, state))]
 
-    # Build messages — start with system prompt on first iteration
-    messages = list(state["messages"])
-    if not messages:
-        system_content = _build_system_prompt(goal, state)
-        messages = [SystemMessage(content=system_content)]
+    # Fold older turns into a rolling summary to bound context growth
+    messages = await _prepare_messages(messages, state["model_name"])
+    messages = _with_recent_attempts(messages, state.get("episodic") or {})
 
-    # Trim to avoid unbounded context growth
-    messages = _trim_messages(messages)
-
-    # Bind tools to the model
-    llm_with_tools = llm.bind_tools(TOOL_DEFINITIONS)  # type: ignore[attr-defined]
+    llm_with_tools = _get_bound_llm(state["model_name"])
 
     response: AIMessage = await llm_with_tools.ainvoke(messages)
 
@@ -189,12 +210,117 @@ def _trim_messages(messages: list, max_keep: int = 40) -> list:
     return first + tail
 
 
+# Histories longer than _WINDOW get everything but the last ~_KEEP_RECENT messages
+# folded into a summary. The cut is aligned to _SUMMARY_BLOCK so the summarized
+# prefix (and its cache entry) only changes once per block.
+_WINDOW = 40
+_KEEP_RECENT = 20
+_SUMMARY_BLOCK = 10
+_MAX_SUMMARIES = 64
+_SUMMARY_PROMPT = (
+    "Summarize the following agent transcript for your own later reference. "
+    "Keep file paths, commands run, test results, errors and decisions made. "
+    "Be concise."
+)
+
+_summaries: OrderedDict[tuple, str] = OrderedDict()
+
+
+async def _prepare_messages(messages: list, model_name: str) -> list:
+    """Keep the system prompt and recent turns, summarizing everything older."""
+    if len(messages) <= _WINDOW:
+        return messages
+    head = messages[:1] if isinstance(messages[0], SystemMessage) else []
+    body = messages[len(head) :]
+
+    cut = ((len(body) - _KEEP_RECENT) // _SUMMARY_BLOCK) * _SUMMARY_BLOCK
+    # Never start the kept tail with tool results whose tool call was summarized
+    while cut < len(body) and isinstance(body[cut], ToolMessage):
+        cut += 1
+    old, tail = body[:cut], body[cut:]
+
+    try:
+        summary = await _summarize(old, model_name)
+    except Exception:
+        return _trim_messages(messages)
+    note = HumanMessage(content=f"[Summary of earlier conversation]\n{summary}")
+    return [*head, note, *tail]
+
+
+async def _summarize(old: list[BaseMessage], model_name: str) -> str:
+    """Summarize *old*, extending the longest cached summary of one of its prefixes."""
+    ids = tuple(m.id or id(m) for m in old)
+    cached = _summaries.get(ids)
+    if cached is not None:
+        _summaries.move_to_end(ids)
+        return cached
+
+    start, previous = 0, ""
+    for key, text in _summaries.items():
+        if start < len(key) < len(ids) and ids[: len(key)] == key:
+            start, previous = len(key), text
+
+    transcript = _render_transcript(old[start:])
+    if previous:
+        transcript = f"Summary so far:\n{previous}\n\nNew messages:\n{transcript}"
+    response = await get_llm(model_name).ainvoke(
+        [SystemMessage(content=_SUMMARY_PROMPT), HumanMessage(content=transcript)]
+    )
+    summary = str(response.content)
+
+    _summaries[ids] = summary
+    while len(_summaries) > _MAX_SUMMARIES:
+        _summaries.popitem(last=False)
+    return summary
+
+
+def _render_transcript(messages: list[BaseMessage], max_chars: int = 2000) -> str:
+    """Flatten messages to plain text so tool-call pairing rules don't apply."""
+    lines = []
+    for m in messages:
+        content = m.content if isinstance(m.content, str) else str(m.content)
+        line = f"{m.type}: {content[:max_chars]}"
+        for tc in getattr(m, "tool_calls", None) or []:
+            line += f"\n  -> {tc.get('name')}({str(tc.get('args'))[:200]})"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+_RECENT_ATTEMPTS = 10
+
+
+def _with_recent_attempts(messages: list, episodic: dict[str, str]) -> list:
+    """Show the LLM its latest tool attempts so it doesn't repeat failing calls.
+
+    The section is added for this call only and never written back to state.
+    """
+    if not episodic:
+        return messages
+    recent = list(episodic.values())[-_RECENT_ATTEMPTS:]
+    section = "## Recent attempts\n" + "\n".join(f"- {line}" for line in recent)
+    if messages and isinstance(messages[0], SystemMessage):
+        head = SystemMessage(content=f"{messages[0].content}\n\n{section}")
+        return [head, *messages[1:]]
+    return [SystemMessage(content=section), *messages]
+
+
+# Parameter count of each goal's system_prompt, keyed by the underlying function
+_PROMPT_ARITY: dict[Any, int] = {}
+
+
+def _prompt_arity(system_prompt: Any) -> int:
+    key = getattr(system_prompt, "__func__", system_prompt)
+    arity = _PROMPT_ARITY.get(key)
+    if arity is None:
+        arity = _PROMPT_ARITY[key] = len(inspect.signature(system_prompt).parameters)
+    return arity
+
+
 def _build_system_prompt(goal: Any, state: AgentState) -> str:
     if goal is None:
         goal_prompt = "Complete the task."
     else:
-        sig = inspect.signature(goal.system_prompt)
-        if len(sig.parameters) > 0:
+        if _prompt_arity(goal.system_prompt) > 0:
             goal_prompt = goal.system_prompt(state.get("cwd", "."))
         else:
             goal_prompt = goal.system_prompt()
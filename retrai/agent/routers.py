@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+from langgraph.types import Send
+
+from retrai.agent.nodes.act import PARALLEL_SAFE_TOOLS
 from retrai.agent.state import AgentState
 
 
-def should_call_tools(state: AgentState) -> str:
-    """After plan: if there are pending tool calls, go to act; else evaluate."""
-    if state.get("pending_tool_calls"):
-        return "act"
-    return "evaluate"
+def should_call_tools(state: AgentState) -> str | list[Send]:
+    """After plan: if there are pending tool calls, go to act; else evaluate.
+
+    When every pending call is read-only, each one is sent to its own
+    ``act_one`` branch so LangGraph runs them in parallel.
+    """
+    pending = state.get("pending_tool_calls")
+    if not pending:
+        return "evaluate"
+    if len(pending) > 1 and all(tc["name"] in PARALLEL_SAFE_TOOLS for tc in pending):
+        return [Send("act_one", {**state, "pending_tool_calls": [tc]}) for tc in pending]
+    return "act"
 
 
 def route_after_evaluate(state: AgentState) -> str:
@@ -25,7 +35,7 @@ def route_after_evaluate(state: AgentState) -> str:
 
 def route_after_human_check(state: AgentState) -> str:
     """After human_check: if aborted or max iterations reached, end; else plan."""
-    if not state["goal_achieved"] and state.get("goal_reason") == "Aborted by user.":
+    if state.get("aborted"):
         return "end"
     if state["iteration"] >= state["max_iterations"]:
         return "end"
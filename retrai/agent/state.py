@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Any, TypedDict
+from typing import TYPE_CHECKING, Annotated, Any, NotRequired, TypedDict
 
 from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
 
+if TYPE_CHECKING:
+    from retrai.config import RunConfig
+
 
 class ToolCall(TypedDict):
     id: str
@@ -21,16 +24,42 @@ class ToolResult(TypedDict):
     error: bool
 
 
+MAX_EPISODIC = 50
+
+
+def merge_episodic(left: dict[str, str] | None, right: dict[str, str] | None) -> dict[str, str]:
+    """Merge tool-attempt summaries, keeping the most recent MAX_EPISODIC (LRU)."""
+    merged = dict(left or {})
+    for key, summary in (right or {}).items():
+        merged.pop(key, None)
+        merged[key] = summary
+    while len(merged) > MAX_EPISODIC:
+        del merged[next(iter(merged))]
+    return merged
+
+
+def merge_tool_results(
+    left: list[ToolResult] | None, right: list[ToolResult] | None
+) -> list[ToolResult]:
+    """Append tool results from (possibly parallel) act branches; ``[]`` resets."""
+    if not right:
+        return []
+    return [*(left or []), *right]
+
+
 class AgentState(TypedDict):
+    # Keys marked NotRequired are optional in the initial state; read them with .get()
     # Full conversation history (reducer appends messages)
     messages: Annotated[list[BaseMessage], add_messages]
     # Tool calls requested by the LLM in the last plan step
     pending_tool_calls: list[ToolCall]
-    # Results of executed tool calls
-    tool_results: list[ToolResult]
+    # Results of executed tool calls (plan resets, act branches append)
+    tool_results: Annotated[list[ToolResult], merge_tool_results]
     # Goal evaluation
     goal_achieved: bool
     goal_reason: str
+    # Set by human_check when the user rejects continuing
+    aborted: NotRequired[bool]
     # Loop control
     iteration: int
     max_iterations: int
@@ -40,4 +69,23 @@ class AgentState(TypedDict):
     cwd: str
     run_id: str
     # Token usage tracking
-    total_tokens: int
+    total_tokens: NotRequired[int]
+    # Outcome of recent tool attempts, keyed by hash of (tool, args)
+    episodic: NotRequired[Annotated[dict[str, str], merge_episodic]]
+
+
+def initial_state(cfg: RunConfig) -> AgentState:
+    """Build the starting AgentState for a run described by *cfg*."""
+    return {
+        "messages": [],
+        "pending_tool_calls": [],
+        "tool_results": [],
+        "goal_achieved": False,
+        "goal_reason": "",
+        "iteration": 0,
+        "max_iterations": cfg.max_iterations,
+        "hitl_enabled": cfg.hitl_enabled,
+        "model_name": cfg.model_name,
+        "cwd": cfg.cwd,
+        "run_id": cfg.run_id,
+    }
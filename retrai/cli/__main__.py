@@ -0,0 +1,43 @@
+"""Console entry point that answers top-level help without importing Typer."""
+
+from __future__ import annotations
+
+import sys
+
+_HELP_FLAGS = frozenset({"--help", "-h"})
+
+# Plain-text rendering of `retrai --help`; tests keep it in sync with the app.
+STATIC_HELP = """\
+Usage: retrai [OPTIONS] COMMAND [ARGS]...
+
+  Self-solving AI agent loop. Run a goal, watch it fix itself.
+
+Options:
+  --help  Show this message and exit.
+
+Commands:
+  run            Run an agent goal loop in the terminal.
+  serve          Start the retrAI web dashboard (FastAPI + Vue).
+  tui            Launch the interactive Textual TUI.
+  init           Scaffold a .retrai.yml config file in the project directory.
+  generate-eval  Generate an AI eval harness from a natural-language description.
+"""
+
+
+def main() -> None:
+    """Run the CLI, short-circuiting bare `retrai` and `retrai --help`."""
+    argv = sys.argv[1:]
+    if all(arg in _HELP_FLAGS for arg in argv):
+        sys.stdout.write(STATIC_HELP)
+        # Mirror Click: no arguments is a usage error, an explicit --help is not
+        raise SystemExit(0 if argv else 2)
+
+    from retrai.cli.app import app, register_commands
+
+    # Only the invoked command's module is imported
+    register_commands(argv)
+    app(prog_name="retrai")
+
+
+if __name__ == "__main__":
+    main()
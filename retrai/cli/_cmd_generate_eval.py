@@ -0,0 +1,63 @@
+"""`retrai generate-eval` — write an AI eval harness from a description."""
+
+from __future__ import annotations
+
+import typer
+
+from retrai.cli._common import _CWD_OPT, _MODEL_OPT, _console, _load_dotenv, _resolve, _run_async
+
+
+def generate_eval(
+    description: str = typer.Argument(..., help="Natural language description of what to achieve"),
+    cwd: str = _CWD_OPT,
+    model: str = _MODEL_OPT,
+) -> None:
+    """Generate an AI eval harness from a natural-language description.
+
+    Example:
+        retrai generate-eval "make the sort function run in O(n log n) time"
+
+    After running this, use:
+        retrai run ai-eval
+    """
+
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = _console()
+
+    resolved_cwd = _resolve(cwd)
+    _load_dotenv(resolved_cwd)
+
+    from retrai.goals.planner import generate_eval_harness
+
+    console.print(
+        Panel(
+            Text.assemble(("Generating eval harness…", "bold cyan"), "\n", (description, "dim")),
+            border_style="cyan",
+        )
+    )
+
+    harness_path = _run_async(
+        generate_eval_harness(
+            description=description,
+            cwd=resolved_cwd,
+            model_name=model,
+        )
+    )
+
+    harness_content = harness_path.read_text()
+    console.print(
+        Panel(
+            Text(harness_content),
+            title=(
+                f"[bold green]✓ Harness saved to "
+                f"{harness_path.relative_to(resolved_cwd)}[/bold green]"
+            ),
+            border_style="green",
+        )
+    )
+    console.print(
+        "\n[bold]Next step:[/bold] run [bold cyan]retrai run ai-eval[/bold cyan]"
+        f" [dim]--cwd {resolved_cwd}[/dim]"
+    )
@@ -0,0 +1,85 @@
+"""`retrai init` — scaffold a .retrai.yml."""
+
+from __future__ import annotations
+
+import typer
+
+from retrai.cli._common import (
+    _CWD_OPT,
+    _HITL_OPT,
+    _MAX_ITER_OPT,
+    _MODEL_OPT,
+    _console,
+    _dump_yaml,
+    _goal_names,
+    _resolve,
+)
+
+
+def init(
+    cwd: str = _CWD_OPT,
+    goal: str | None = typer.Option(
+        None, "--goal", "-g", help="Goal to use (auto-detected if omitted)"
+    ),
+    model: str = _MODEL_OPT,
+    max_iter: int = _MAX_ITER_OPT,
+    hitl: bool = _HITL_OPT,
+) -> None:
+    """Scaffold a .retrai.yml config file in the project directory."""
+    from pathlib import Path
+
+    from rich.panel import Panel
+    from rich.text import Text
+
+    from retrai.goals.detector import detect_goal
+
+    console = _console()
+
+    resolved_cwd = _resolve(cwd)
+
+    if goal is None:
+        detected = detect_goal(resolved_cwd)
+        if detected:
+            console.print(f"[dim]Auto-detected:[/dim] [bold cyan]{detected}[/bold cyan]")
+            goal = detected
+        else:
+            available = _goal_names()
+            console.print(
+                "[yellow]Could not auto-detect a test framework.[/yellow]\n"
+                f"Available goals: [bold]{available}[/bold]\n"
+                "Pass [bold]--goal <name>[/bold] to configure manually."
+            )
+            raise typer.Exit(code=1)
+
+    config: dict = {
+        "goal": goal,
+        "model": model,
+        "max_iterations": max_iter,
+        "hitl_enabled": hitl,
+    }
+
+    config_path = Path(resolved_cwd) / ".retrai.yml"
+    config_path.write_text(_dump_yaml(config))
+
+    console.print(
+        Panel(
+            Text.assemble(
+                ("✓ Created", "bold green"),
+                " ",
+                (str(config_path), "bold"),
+                "\n\n  goal:           ",
+                (goal, "cyan"),
+                "\n  model:          ",
+                (model, "cyan"),
+                "\n  max_iterations: ",
+                (str(max_iter), "cyan"),
+                "\n  hitl_enabled:   ",
+                (str(hitl), "cyan"),
+                "\n\nRun ",
+                ("retrai run", "bold"),
+                " to start the agent.",
+            ),
+            border_style="green",
+            title="retrAI init",
+        )
+    )
@@ -0,0 +1,431 @@
+"""`retrai run` — the terminal agent loop and its event renderer."""
+
+from __future__ import annotations
+
+import reprlib
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+import typer
+
+from retrai.cli._common import (
+    _API_BASE_OPT,
+    _API_KEY_OPT,
+    _CWD_OPT,
+    _HITL_OPT,
+    _MAX_ITER_OPT,
+    _MODEL_OPT,
+    _console,
+    _resolve,
+    _resolve_config,
+    _run_async,
+)
+
+if TYPE_CHECKING:
+    import queue
+    import threading
+    from collections.abc import Callable
+
+    from rich.console import Console
+    from rich.text import Text
+
+
+def run(
+    goal: str | None = typer.Argument(
+        None,
+        help=(
+            "Goal to achieve (e.g. 'pytest', 'bun-test', 'cargo-test'). "
+            "Omit to auto-detect from project files."
+        ),
+    ),
+    cwd: str = _CWD_OPT,
+    model: str = _MODEL_OPT,
+    max_iter: int = _MAX_ITER_OPT,
+    hitl: bool = _HITL_OPT,
+    api_key: str | None = _API_KEY_OPT,
+    api_base: str | None = _API_BASE_OPT,
+) -> None:
+    """Run an agent goal loop in the terminal.
+
+    If no goal is given, retrAI scans the project and auto-detects the right one.
+    """
+
+    from rich.panel import Panel
+    from rich.text import Text
+
+    from retrai.config import RunConfig
+
+    console = _console()
+
+    resolved_cwd = _resolve(cwd)
+    resolved = _resolve_config(
+        resolved_cwd,
+        goal=goal,
+        model=model,
+        max_iter=max_iter,
+        hitl=hitl,
+        api_key=api_key,
+        api_base=api_base,
+    )
+
+    cfg = RunConfig(
+        goal=str(resolved["goal"]),
+        cwd=resolved_cwd,
+        model_name=str(resolved["model"]),
+        max_iterations=int(resolved["max_iterations"]),
+        hitl_enabled=bool(resolved["hitl_enabled"]),
+    )
+
+    console.print(
+        Panel(
+            Text.assemble(
+                ("retrAI", "bold cyan"),
+                "  ",
+                ("—", "dim"),
+                "  goal=",
+                (cfg.goal, "bold"),
+                "  model=",
+                (cfg.model_name, "bold"),
+                "  max-iter=",
+                (str(cfg.max_iterations), "bold"),
+                "  hitl=",
+                ("on" if cfg.hitl_enabled else "off", "bold"),
+                "\n",
+                ("cwd: " + resolved_cwd, "dim"),
+            ),
+            border_style="cyan",
+        )
+    )
+
+    exit_code = _run_async(_run_cli(cfg))
+    raise typer.Exit(code=exit_code)
+
+
+async def _run_cli(cfg) -> int:
+    """Run the agent loop and stream events to the terminal."""
+    import asyncio
+    import os
+    import queue
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rich.panel import Panel
+    from rich.text import Text
+
+    from retrai.agent.graph import build_graph
+    from retrai.agent.state import initial_state
+    from retrai.events.bus import AsyncEventBus
+    from retrai.goals.registry import get_goal
+
+    console = _console()
+
+    # Blocking tool work (run_pytest, file I/O) shares one bounded pool
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(
+            max_workers=_pool_size(console, os.getenv("RETRAI_POOL")),
+            thread_name_prefix="retrai-tool",
+        )
+    )
+
+    goal = get_goal(cfg.goal)
+    bus = AsyncEventBus()
+    graph = build_graph(hitl_enabled=cfg.hitl_enabled)
+
+    state = initial_state(cfg)
+
+    run_config = {
+        "configurable": {
+            "thread_id": cfg.run_id,
+            "event_bus": bus,
+            "goal": goal,
+        }
+    }
+
+    q = await bus.subscribe()
+
+    # Rendering happens on a dedicated thread so terminal writes never stall the
+    # loop; a bounded hand-off queue of event batches sheds non-critical events
+    # under pressure.
+    render_q: queue.Queue[Any] = queue.Queue(maxsize=_RENDER_QUEUE_SIZE)
+    render_errors: list[Exception] = []
+    render_thread = threading.Thread(
+        target=_render_worker,
+        args=(render_q, render_errors),
+        name="retrai-render",
+        daemon=True,
+    )
+    render_thread.start()
+
+    final_state = None
+    failure: Exception | None = None
+    exit_code = 1
+    dropped = 0
+
+    async def consume_events() -> None:
+        nonlocal exit_code, dropped
+        closed = False
+        while not closed and (event := await q.get()) is not None:
+            # Drain whatever else is already queued so it renders as one batch
+            batch = [event]
+            while True:
+                try:
+                    nxt = q.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if nxt is None:
+                    closed = True
+                    break
+                batch.append(nxt)
+
+            for ev in batch:
+                if ev.kind == "run_end" and ev.payload.get("status") == "achieved":
+                    exit_code = 0
+
+            try:
+                render_q.put_nowait(batch)
+            except queue.Full:
+                critical = [ev for ev in batch if ev.kind in _CRITICAL_EVENTS]
+                dropped += len(batch) - len(critical)
+                if critical:
+                    await asyncio.to_thread(_put_render, render_q, critical, render_thread)
+
+    # Run graph and consume events concurrently in one cancellation scope
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(consume_events())
+            try:
+                final_state = await graph.ainvoke(state, config=run_config)  # type: ignore[arg-type]
+            except Exception as e:
+                failure = e
+            finally:
+                # Closing the bus lets the consumer drain what's queued and exit
+                await bus.close()
+    finally:
+        await asyncio.to_thread(_put_render, render_q, None, render_thread)
+        await asyncio.to_thread(render_thread.join)
+
+    # Surface a rendering failure (e.g. BrokenPipeError) instead of hiding it
+    if render_errors:
+        raise render_errors[0]
+
+    # Printed only after the render thread has flushed the run's events
+    if failure is not None:
+        console.print(f"\n[red]Run failed: {failure}[/red]")
+    if dropped:
+        console.print(f"[dim]({dropped} events not rendered: output could not keep up)[/dim]")
+
+    if final_state:
+        achieved = final_state.get("goal_achieved", False)
+        reason = final_state.get("goal_reason", "")
+        iters = final_state.get("iteration", 0)
+        if achieved:
+            console.print(
+                Panel(
+                    Text.assemble(
+                        ("GOAL ACHIEVED", "bold green"), f" after {iters} iteration(s)\n", reason
+                    ),
+                    border_style="green",
+                )
+            )
+            exit_code = 0
+        else:
+            console.print(
+                Panel(
+                    Text.assemble(
+                        ("GOAL NOT ACHIEVED", "bold red"), f" after {iters} iteration(s)\n", reason
+                    ),
+                    border_style="red",
+                )
+            )
+            exit_code = 1
+
+    return exit_code
+
+
+_RENDER_QUEUE_SIZE = 256
+_DEFAULT_POOL_SIZE = 8
+# Events that are rendered even when the terminal can't keep up
+_CRITICAL_EVENTS = frozenset({"goal_check", "human_check_required", "run_end", "error"})
+
+
+def _pool_size(console: Console, raw: str | None) -> int:
+    """Parse RETRAI_POOL; anything but a positive integer falls back, with a warning."""
+    if raw is None:
+        return _DEFAULT_POOL_SIZE
+    try:
+        size = int(raw)
+    except ValueError:
+        size = 0
+    if size < 1:
+        console.print(
+            f"[yellow]Ignoring RETRAI_POOL={raw!r}: expected a positive integer, "
+            f"using {_DEFAULT_POOL_SIZE}.[/yellow]"
+        )
+        return _DEFAULT_POOL_SIZE
+    return size
+
+
+# When stdout is not a terminal, batches arriving within this window are
+# coalesced into one write (up to this many events); a TTY flushes per batch.
+_PIPE_FLUSH_EVENTS = 64
+_PIPE_FLUSH_SECONDS = 0.25
+# How often a blocked put re-checks that the render thread is still alive
+_PUT_POLL_SECONDS = 0.1
+
+
+def _put_render(render_q: queue.Queue[Any], item: Any, render_thread: threading.Thread) -> bool:
+    """Put *item* on *render_q*, giving up (False) once the render thread has exited."""
+    import queue
+
+    while render_thread.is_alive():
+        try:
+            render_q.put(item, timeout=_PUT_POLL_SECONDS)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _render_worker(render_q: queue.Queue[Any], errors: list[Exception]) -> None:
+    """Render event batches from *render_q* until a ``None`` sentinel arrives.
+
+    The first rendering error is appended to *errors*; after that the worker
+    keeps draining the queue without rendering so producers never block on it.
+    """
+    import queue
+
+    console = _console()
+    coalesce = not console.is_terminal
+    done = False
+    while not done and (batch := render_q.get()) is not None:
+        if errors:
+            continue
+        rendered = 0
+        try:
+            # Rich buffers everything printed inside the context into one write
+            with console:
+                while True:
+                    for event in batch:
+                        _render_event(event)
+                    rendered += len(batch)
+                    if not coalesce or rendered >= _PIPE_FLUSH_EVENTS:
+                        break
+                    try:
+                        batch = render_q.get(timeout=_PIPE_FLUSH_SECONDS)
+                    except queue.Empty:
+                        break
+                    if batch is None:
+                        done = True
+                        break
+        except Exception as e:
+            errors.append(e)
+
+
+# (template, style) for single-style event lines. Printed with markup=False so
+# Rich skips its markup parser (and payload text can't inject markup).
+_TEMPLATES: dict[str, tuple[str, str]] = {
+    "step_start": ("\n▶ [{}] {}", "bold blue"),
+    "goal_achieved": ("  ✓ Goal: {}", "green"),
+    "goal_pending": ("  … Goal: {}", "yellow"),
+    "human_check": ("\n⏸  Human check required", "bold yellow"),
+    "human_check_hint": ("  Use 'retrai serve' and the web UI to approve/abort.", "dim"),
+    "iteration_complete": ("  --- iteration {} complete ---", "dim"),
+    "run_end": ("\nRun ended: {}", "bold"),
+    "error": ("\nERROR: {}", "bold red"),
+}
+
+
+@cache
+def _line_prefix(text: str, style: str) -> Text:
+    """Return a styled, reusable prefix; callers ``.copy()`` before appending."""
+    from rich.text import Text
+
+    return Text(text, style=style)
+
+
+def _print_template(console: Console, key: str, *values: Any) -> None:
+    template, style = _TEMPLATES[key]
+    console.print(template.format(*values), style=style, markup=False)
+
+
+def _h_step_start(console: Console, payload: dict, iteration: int) -> None:
+    _print_template(console, "step_start", iteration, payload.get("node", "?").upper())
+
+
+def _h_tool_call(console: Console, payload: dict, iteration: int) -> None:
+    line = _line_prefix("  ⟶ ", "cyan").copy()
+    line.append(payload.get("tool", "?"), style="cyan")
+    line.append(f"({_fmt_args(payload.get('args', {}))})")
+    console.print(line)
+
+
+def _h_tool_result(console: Console, payload: dict, iteration: int) -> None:
+    # Content is already capped at TOOL_RESULT_PREVIEW_CHARS by the producer
+    err = payload.get("error", False)
+    color = "red" if err else "green"
+    line = _line_prefix("  ✗ " if err else "  ✓ ", color).copy()
+    line.append(payload.get("tool", "?"), style=color)
+    line.append(": ")
+    line.append(payload.get("content", ""))
+    console.print(line, no_wrap=True, overflow="ellipsis")
+
+
+def _h_goal_check(console: Console, payload: dict, iteration: int) -> None:
+    key = "goal_achieved" if payload.get("achieved", False) else "goal_pending"
+    _print_template(console, key, payload.get("reason", ""))
+
+
+def _h_human_check(console: Console, payload: dict, iteration: int) -> None:
+    _print_template(console, "human_check")
+    _print_template(console, "human_check_hint")
+
+
+def _h_iteration_complete(console: Console, payload: dict, iteration: int) -> None:
+    _print_template(console, "iteration_complete", payload.get("iteration", 0))
+
+
+def _h_run_end(console: Console, payload: dict, iteration: int) -> None:
+    _print_template(console, "run_end", payload.get("status", "?"))
+
+
+def _h_error(console: Console, payload: dict, iteration: int) -> None:
+    _print_template(console, "error", payload.get("error", "unknown error"))
+
+
+_HANDLERS: dict[str, Callable[[Console, dict, int], None]] = {
+    "step_start": _h_step_start,
+    "tool_call": _h_tool_call,
+    "tool_result": _h_tool_result,
+    "goal_check": _h_goal_check,
+    "human_check_required": _h_human_check,
+    "iteration_complete": _h_iteration_complete,
+    "run_end": _h_run_end,
+    "error": _h_error,
+}
+
+
+def _render_event(event) -> None:
+    """Render an AgentEvent to the terminal; unknown kinds are ignored."""
+    handler = _HANDLERS.get(event.kind)
+    if handler is not None:
+        handler(_console(), event.payload, event.iteration)
+
+
+# Bounded reprs so huge args (e.g. file_write content) stay cheap to render
+_ARG_REPR = reprlib.Repr(maxstring=80, maxother=80, maxlist=5, maxdict=5)
+_MAX_STR_ARG = 80
+
+
+def _fmt_args(args: dict) -> str:
+    parts = []
+    for k, v in args.items():
+        if isinstance(v, str):
+            # Strings (the common case) skip reprlib; only long ones are sliced
+            if len(v) <= _MAX_STR_ARG:
+                parts.append(f"{k}={v!r}")
+            else:
+                parts.append(f"{k}={v[:_MAX_STR_ARG]!r}…")
+        else:
+            parts.append(f"{k}={_ARG_REPR.repr(v)}")
+    return ", ".join(parts)
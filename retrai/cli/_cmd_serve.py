@@ -0,0 +1,36 @@
+"""`retrai serve` — the web dashboard."""
+
+from __future__ import annotations
+
+import typer
+
+from retrai.cli._common import _console, _load_dotenv
+
+
+def serve(
+    host: str = typer.Option("0.0.0.0", "--host", help="Host to bind to"),
+    port: int = typer.Option(8000, "--port", "-p", help="Port to listen on"),
+    reload: bool = typer.Option(False, "--reload", help="Enable auto-reload (dev mode)"),
+) -> None:
+    """Start the retrAI web dashboard (FastAPI + Vue)."""
+    from rich.panel import Panel
+
+    console = _console()
+
+    _load_dotenv()
+
+    import uvicorn
+
+    console.print(
+        Panel(
+            f"[bold cyan]retrAI server[/bold cyan] starting on [bold]http://{host}:{port}[/bold]",
+            border_style="cyan",
+        )
+    )
+    uvicorn.run(
+        "retrai.server.app:app",
+        host=host,
+        port=port,
+        reload=reload,
+        log_level="info",
+    )
@@ -0,0 +1,61 @@
+"""`retrai tui` — the Textual interface."""
+
+from __future__ import annotations
+
+import typer
+
+from retrai.cli._common import (
+    _API_BASE_OPT,
+    _API_KEY_OPT,
+    _CWD_OPT,
+    _HITL_OPT,
+    _MAX_ITER_OPT,
+    _MODEL_OPT,
+    _resolve,
+    _resolve_config,
+)
+
+
+def tui(
+    goal: str | None = typer.Argument(
+        None,
+        help=(
+            "Goal to achieve (e.g. 'pytest', 'pyright', 'bun-test'). "
+            "Omit to auto-detect from project files."
+        ),
+    ),
+    cwd: str = _CWD_OPT,
+    model: str = _MODEL_OPT,
+    max_iter: int = _MAX_ITER_OPT,
+    hitl: bool = _HITL_OPT,
+    api_key: str | None = _API_KEY_OPT,
+    api_base: str | None = _API_BASE_OPT,
+) -> None:
+    """Launch the interactive Textual TUI.
+
+    If no goal is given, retrAI scans the project and auto-detects the right one.
+    """
+
+    from retrai.config import RunConfig
+    from retrai.tui.app import RetrAITUI
+
+    resolved_cwd = _resolve(cwd)
+    resolved = _resolve_config(
+        resolved_cwd,
+        goal=goal,
+        model=model,
+        max_iter=max_iter,
+        hitl=hitl,
+        api_key=api_key,
+        api_base=api_base,
+    )
+
+    cfg = RunConfig(
+        goal=str(resolved["goal"]),
+        cwd=resolved_cwd,
+        model_name=str(resolved["model"]),
+        max_iterations=int(resolved["max_iterations"]),
+        hitl_enabled=bool(resolved["hitl_enabled"]),
+    )
+    tui_app = RetrAITUI(cfg=cfg)
+    tui_app.run()
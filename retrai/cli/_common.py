@@ -0,0 +1,340 @@
+"""Helpers and option definitions shared by the CLI commands."""
+
+from __future__ import annotations
+
+import json
+import re
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+import typer
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+    from rich.console import Console
+
+
+# Options shared by several commands, built once at import
+_CWD_OPT = typer.Option(".", "--cwd", "-C", help="Project directory (default: current dir)")
+_MODEL_OPT = typer.Option(
+    "claude-sonnet-4-6", "--model", "-m", help="LLM model name (LiteLLM format)"
+)
+_MAX_ITER_OPT = typer.Option(20, "--max-iter", "-n", help="Maximum agent iterations")
+_HITL_OPT = typer.Option(False, "--hitl", help="Enable human-in-the-loop checkpoints")
+_API_KEY_OPT = typer.Option(
+    None, "--api-key", "-k", help="API key (overrides env var)", envvar="LLM_API_KEY"
+)
+_API_BASE_OPT = typer.Option(
+    None, "--api-base", help="Custom API base URL (e.g. for Azure, Ollama, vLLM)"
+)
+
+
+@cache
+def _console() -> Console:
+    """Return the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _resolve(cwd: str) -> str:
+    """Absolute, symlink-resolved path for *cwd*; the default "." is just getcwd()."""
+    import os
+
+    if cwd in (".", ""):
+        return os.getcwd()
+    # Same result as Path(cwd).resolve(), without building PurePath objects
+    return os.path.realpath(cwd)
+
+
+# Built-in goal names, so validating them doesn't import the goal registry
+_BUILTIN_GOALS = frozenset(
+    {
+        "pytest",
+        "pyright",
+        "bun-test",
+        "npm-test",
+        "cargo-test",
+        "go-test",
+        "make-test",
+        "shell-goal",
+        "perf-check",
+        "sql-benchmark",
+        "ai-eval",
+    }
+)
+
+
+@cache
+def _list_goals() -> tuple[str, ...]:
+    """Registered goal names, imported and frozen on first use."""
+    from retrai.goals.registry import list_goals
+
+    return tuple(list_goals())
+
+
+@cache
+def _goal_names() -> str:
+    return ", ".join(_list_goals())
+
+
+# Strings that may be written as plain YAML scalars; anything else is quoted
+_PLAIN_SCALAR = re.compile(r"[A-Za-z_][A-Za-z0-9_./+-]*")
+# Plain words YAML 1.1 would load as bools or null
+_YAML_RESERVED = frozenset({"y", "n", "yes", "no", "on", "off", "true", "false", "null"})
+
+
+def _yaml_scalar(value: Any) -> str | None:
+    """Render *value* as a YAML scalar, or None if it needs the real emitter."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, str):
+        if _PLAIN_SCALAR.fullmatch(value) and value.lower() not in _YAML_RESERVED:
+            return value
+        # A JSON string literal is a valid double-quoted YAML scalar
+        return json.dumps(value)
+    return None
+
+
+def _dump_yaml(data: dict) -> str:
+    """Serialize a config dict as block-style YAML.
+
+    Flat dicts of plain scalars (every config the CLI writes) are formatted
+    directly; anything else goes through PyYAML, using libyaml when available.
+    """
+    lines = []
+    for key, value in data.items():
+        rendered = _yaml_scalar(value)
+        if rendered is None or not isinstance(key, str) or not _PLAIN_SCALAR.fullmatch(key):
+            break
+        lines.append(f"{key}: {rendered}\n")
+    else:
+        return "".join(lines)
+
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeDumper as Dumper  # type: ignore[assignment]
+
+    return yaml.dump(data, Dumper=Dumper, default_flow_style=False, sort_keys=False)
+
+
+def _load_dotenv(cwd: str | None = None) -> None:
+    """Load the first .env found in *cwd* (the project) or the working directory.
+
+    python-dotenv is only imported once a file exists. Setting
+    ``RETRAI_SKIP_DOTENV`` (to any non-empty value) disables loading.
+    """
+    import os
+
+    if os.environ.get("RETRAI_SKIP_DOTENV"):
+        return
+    here = os.getcwd()
+    for directory in (cwd, here) if cwd and cwd != here else (here,):
+        env_path = os.path.join(directory, ".env")
+        if os.path.isfile(env_path):
+            break
+    else:
+        return
+    try:
+        from dotenv import load_dotenv
+    except ImportError:  # pragma: no cover - python-dotenv is a core dependency
+        return
+    load_dotenv(env_path)
+
+
+def _run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run *coro* to completion, on uvloop when it is installed (not on Windows)."""
+    import asyncio
+    import sys
+
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+@cache
+def _menu(title: str, options: tuple[str, ...]) -> str:
+    """A numbered menu as one markup string, so it renders in a single print."""
+    lines = [title]
+    lines.extend(f"  [cyan]{i}[/cyan]) {option}" for i, option in enumerate(options, 1))
+    return "\n".join(lines)
+
+
+def _interactive_setup(cwd: str) -> dict[str, str]:
+    """Run interactive first-time setup — pick provider, model, and API key."""
+    import os
+    from pathlib import Path
+
+    from rich.panel import Panel
+
+    from retrai.config import PROVIDER_NAMES, get_provider_models
+
+    console = _console()
+
+    console.print(
+        Panel(
+            "[bold cyan]Welcome to retrAI![/bold cyan]\n\n"
+            "No [bold].retrai.yml[/bold] found. Let's set up your AI provider.",
+            border_style="cyan",
+        )
+    )
+
+    # 1. Pick provider
+    PROVIDER_MODELS = get_provider_models()
+    console.print(_menu("\n[bold]Choose your AI provider:[/bold]", PROVIDER_NAMES))
+    choice = typer.prompt("\nProvider number", default="1")
+    try:
+        n = int(choice) - 1
+    except ValueError:
+        n = 0
+    # Out-of-range picks (including 0 and negatives) fall back to the first provider
+    provider_name = PROVIDER_NAMES[n] if 0 <= n < len(PROVIDER_NAMES) else PROVIDER_NAMES[0]
+    provider = PROVIDER_MODELS[provider_name]
+    console.print(f"\n[dim]Selected:[/dim] [bold]{provider_name}[/bold]")
+
+    # 2. Pick model
+    models = provider["models"]
+    if models:
+        console.print(
+            _menu("\n[bold]Choose a model:[/bold]", (*models, "Custom (enter manually)"))
+        )
+        model_choice = typer.prompt("Model number", default="1")
+        try:
+            idx = int(model_choice) - 1
+            model = models[idx] if 0 <= idx < len(models) else ""
+        except (ValueError, IndexError):
+            model = models[0]
+        if not model:
+            model = typer.prompt("Enter model name (LiteLLM format)")
+    else:
+        model = typer.prompt("Enter model name (LiteLLM format)", default="gpt-4o")
+    console.print(f"[dim]Model:[/dim] [bold]{model}[/bold]")
+
+    # 3. API key
+    env_var = provider.get("env_var")
+    if env_var and not os.environ.get(env_var):
+        console.print(
+            f"\n[yellow]No {env_var} found in environment.[/yellow]"
+        )
+        api_key = typer.prompt(
+            f"Enter your API key (or leave blank to set {env_var} later)",
+            default="",
+            hide_input=True,
+        )
+        if api_key:
+            os.environ[env_var] = api_key
+    elif env_var:
+        console.print(f"\n[green]✓ {env_var} already set in environment[/green]")
+
+    # 4. Extra env vars (e.g. Azure)
+    for extra in provider.get("extra_env", []):
+        if not os.environ.get(extra):
+            val = typer.prompt(f"Enter {extra}", default="")
+            if val:
+                os.environ[extra] = val
+
+    # 5. API base for local providers
+    api_base = provider.get("api_base")
+    if api_base:
+        os.environ["OPENAI_API_BASE"] = api_base
+        console.print(f"[dim]API base:[/dim] [bold]{api_base}[/bold]")
+
+    # Save config
+    config: dict[str, str | int | bool] = {
+        "model": model,
+    }
+    config_path = Path(cwd) / ".retrai.yml"
+    config_path.write_text(_dump_yaml(dict(config)))
+    console.print(
+        f"\n[bold green]✓ Saved to {config_path.name}[/bold green]\n"
+    )
+    return {"model": model}
+
+
+def _resolve_config(
+    cwd: str,
+    *,
+    goal: str | None,
+    model: str,
+    max_iter: int,
+    hitl: bool,
+    api_key: str | None,
+    api_base: str | None,
+) -> dict[str, str | int | bool]:
+    """Load config from .retrai.yml, falling back to interactive setup.
+
+    CLI flags always take priority over config file values.
+    Returns a dict with resolved goal, model, max_iterations, hitl_enabled.
+    """
+    import os
+
+    console = _console()
+
+    _load_dotenv(cwd)
+
+    from retrai.config import load_config
+    from retrai.goals.detector import detect_goal
+
+    # Try loading config file
+    file_cfg = load_config(cwd)
+    if file_cfg is None:
+        # No config file — run interactive setup
+        setup_result = _interactive_setup(cwd)
+        file_cfg = setup_result
+
+    # Merge: CLI args > config file > defaults
+    resolved_model = model if model != "claude-sonnet-4-6" else file_cfg.get("model", model)
+    resolved_max_iter = (
+        max_iter if max_iter != 20
+        else int(file_cfg.get("max_iterations", max_iter))
+    )
+    resolved_hitl = hitl or bool(file_cfg.get("hitl_enabled", False))
+
+    # Resolve goal: CLI arg > config file > auto-detect
+    if goal is None:
+        goal = file_cfg.get("goal") if isinstance(file_cfg.get("goal"), str) else None
+    if goal is None:
+        detected = detect_goal(cwd)
+        if detected is None:
+            available = _goal_names()
+            console.print(
+                "[yellow]Could not auto-detect a test framework.[/yellow]\n"
+                f"Available goals: [bold]{available}[/bold]\n"
+                "Pass a goal argument or run [bold]retrai init[/bold]."
+            )
+            raise typer.Exit(code=1)
+        console.print(f"[dim]Auto-detected goal:[/dim] [bold cyan]{detected}[/bold cyan]")
+        goal = detected
+
+    # Validate goal
+    if goal not in _BUILTIN_GOALS and goal not in _list_goals():
+        console.print(f"[red]Unknown goal: '{goal}'. Available: {_goal_names()}[/red]")
+        raise typer.Exit(code=1)
+
+    # Apply auth overrides
+    if api_key:
+        for env_var in ["OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GEMINI_API_KEY", "AZURE_API_KEY"]:
+            if not os.environ.get(env_var):
+                os.environ[env_var] = api_key
+    if api_base:
+        os.environ["OPENAI_API_BASE"] = api_base
+
+    return {
+        "goal": goal,
+        "model": str(resolved_model),
+        "max_iterations": resolved_max_iter,
+        "hitl_enabled": resolved_hitl,
+    }
@@ -1,16 +1,16 @@
-"""Typer CLI for retrAI."""
+"""Typer CLI for retrAI.
+
+Each command lives in its own ``_cmd_<name>`` module and is registered on
+``app`` only when needed, so ``retrai run`` never imports the server or TUI
+command modules.
+"""
 
 from __future__ import annotations
 
-import asyncio
-from pathlib import Path
+from typing import Any
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
 
-console = Console()
 app = typer.Typer(
     name="retrai",
     help="Self-solving AI agent loop. Run a goal, watch it fix itself.",
@@ -19,559 +19,63 @@ app = typer.Typer(
 )
 
 
-def _interactive_setup(cwd: str) -> dict[str, str]:
-    """Run interactive first-time setup — pick provider, model, and API key."""
-    import os
-
-    import yaml
-
-    from retrai.config import get_provider_models
-
-    console.print(
-        Panel(
-            "[bold cyan]Welcome to retrAI![/bold cyan]\n\n"
-            "No [bold].retrai.yml[/bold] found. Let's set up your AI provider.",
-            border_style="cyan",
-        )
-    )
-
-    # 1. Pick provider
-    PROVIDER_MODELS = get_provider_models()
-    providers = list(PROVIDER_MODELS.keys())
-    console.print("\n[bold]Choose your AI provider:[/bold]")
-    for i, name in enumerate(providers, 1):
-        console.print(f"  [cyan]{i}[/cyan]) {name}")
-    choice = typer.prompt("\nProvider number", default="1")
-    try:
-        provider_name = providers[int(choice) - 1]
-    except (ValueError, IndexError):
-        provider_name = providers[0]
-    provider = PROVIDER_MODELS[provider_name]
-    console.print(f"\n[dim]Selected:[/dim] [bold]{provider_name}[/bold]")
-
-    # 2. Pick model
-    models = provider["models"]
-    if models:
-        console.print("\n[bold]Choose a model:[/bold]")
-        for i, m in enumerate(models, 1):
-            console.print(f"  [cyan]{i}[/cyan]) {m}")
-        console.print(f"  [cyan]{len(models) + 1}[/cyan]) Custom (enter manually)")
-        model_choice = typer.prompt("Model number", default="1")
-        try:
-            idx = int(model_choice) - 1
-            model = models[idx] if 0 <= idx < len(models) else ""
-        except (ValueError, IndexError):
-            model = models[0]
-        if not model:
-            model = typer.prompt("Enter model name (LiteLLM format)")
-    else:
-        model = typer.prompt("Enter model name (LiteLLM format)", default="gpt-4o")
-    console.print(f"[dim]Model:[/dim] [bold]{model}[/bold]")
-
-    # 3. API key
-    env_var = provider.get("env_var")
-    if env_var and not os.environ.get(env_var):
-        console.print(
-            f"\n[yellow]No {env_var} found in environment.[/yellow]"
-        )
-        api_key = typer.prompt(
-            f"Enter your API key (or leave blank to set {env_var} later)",
-            default="",
-            hide_input=True,
-        )
-        if api_key:
-            os.environ[env_var] = api_key
-    elif env_var:
-        console.print(f"\n[green]✓ {env_var} already set in environment[/green]")
-
-    # 4. Extra env vars (e.g. Azure)
-    for extra in provider.get("extra_env", []):
-        if not os.environ.get(extra):
-            val = typer.prompt(f"Enter {extra}", default="")
-            if val:
-                os.environ[extra] = val
-
-    # 5. API base for local providers
-    api_base = provider.get("api_base")
-    if api_base:
-        os.environ["OPENAI_API_BASE"] = api_base
-        console.print(f"[dim]API base:[/dim] [bold]{api_base}[/bold]")
-
-    # Save config
-    config: dict[str, str | int | bool] = {
-        "model": model,
-    }
-    config_path = Path(cwd) / ".retrai.yml"
-    config_path.write_text(yaml.dump(dict(config), default_flow_style=False, sort_keys=False))
-    console.print(
-        f"\n[bold green]✓ Saved to {config_path.name}[/bold green]\n"
-    )
-    return {"model": model}
-
-
-def _resolve_config(
-    cwd: str,
-    *,
-    goal: str | None,
-    model: str,
-    max_iter: int,
-    hitl: bool,
-    api_key: str | None,
-    api_base: str | None,
-) -> dict[str, str | int | bool]:
-    """Load config from .retrai.yml, falling back to interactive setup.
-
-    CLI flags always take priority over config file values.
-    Returns a dict with resolved goal, model, max_iterations, hitl_enabled.
-    """
-    import os
-
-    from dotenv import load_dotenv
-
-    load_dotenv()
-
-    from retrai.config import load_config
-    from retrai.goals.detector import detect_goal
-    from retrai.goals.registry import list_goals
-
-    # Try loading config file
-    file_cfg = load_config(cwd)
-    if file_cfg is None:
-        # No config file — run interactive setup
-        setup_result = _interactive_setup(cwd)
-        file_cfg = setup_result
-
-    # Merge: CLI args > config file > defaults
-    resolved_model = model if model != "claude-sonnet-4-6" else file_cfg.get("model", model)
-    resolved_max_iter = (
-        max_iter if max_iter != 20
-        else int(file_cfg.get("max_iterations", max_iter))
-    )
-    resolved_hitl = hitl or bool(file_cfg.get("hitl_enabled", False))
-
-    # Resolve goal: CLI arg > config file > auto-detect
-    if goal is None:
-        goal = file_cfg.get("goal") if isinstance(file_cfg.get("goal"), str) else None
-    if goal is None:
-        detected = detect_goal(cwd)
-        if detected is None:
-            available = ", ".join(list_goals())
-            console.print(
-                "[yellow]Could not auto-detect a test framework.[/yellow]\n"
-                f"Available goals: [bold]{available}[/bold]\n"
-                "Pass a goal argument or run [bold]retrai init[/bold]."
-            )
-            raise typer.Exit(code=1)
-        console.print(f"[dim]Auto-detected goal:[/dim] [bold cyan]{detected}[/bold cyan]")
-        goal = detected
-
-    # Validate goal
-    available_goals = list_goals()
-    if goal not in available_goals:
-        console.print(f"[red]Unknown goal: '{goal}'. Available: {', '.join(available_goals)}[/red]")
-        raise typer.Exit(code=1)
-
-    # Apply auth overrides
-    if api_key:
-        for env_var in ["OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GEMINI_API_KEY", "AZURE_API_KEY"]:
-            if not os.environ.get(env_var):
-                os.environ[env_var] = api_key
-    if api_base:
-        os.environ["OPENAI_API_BASE"] = api_base
-
-    return {
-        "goal": goal,
-        "model": str(resolved_model),
-        "max_iterations": resolved_max_iter,
-        "hitl_enabled": resolved_hitl,
-    }
-
-
-@app.command()
-def run(
-    goal: str | None = typer.Argument(
-        None,
-        help=(
-            "Goal to achieve (e.g. 'pytest', 'bun-test', 'cargo-test'). "
-            "Omit to auto-detect from project files."
-        ),
-    ),
-    cwd: str = typer.Option(".", "--cwd", "-C", help="Project directory (default: current dir)"),
-    model: str = typer.Option(
-        "claude-sonnet-4-6", "--model", "-m", help="LLM model name (LiteLLM format)"
-    ),
-    max_iter: int = typer.Option(20, "--max-iter", "-n", help="Maximum agent iterations"),
-    hitl: bool = typer.Option(False, "--hitl", help="Enable human-in-the-loop checkpoints"),
-    api_key: str | None = typer.Option(
-        None, "--api-key", "-k", help="API key (overrides env var)", envvar="LLM_API_KEY"
-    ),
-    api_base: str | None = typer.Option(
-        None, "--api-base", help="Custom API base URL (e.g. for Azure, Ollama, vLLM)"
-    ),
-) -> None:
-    """Run an agent goal loop in the terminal.
-
-    If no goal is given, retrAI scans the project and auto-detects the right one.
-    """
-    from retrai.config import RunConfig
-
-    resolved_cwd = str(Path(cwd).resolve())
-    resolved = _resolve_config(
-        resolved_cwd,
-        goal=goal,
-        model=model,
-        max_iter=max_iter,
-        hitl=hitl,
-        api_key=api_key,
-        api_base=api_base,
-    )
-
-    cfg = RunConfig(
-        goal=str(resolved["goal"]),
-        cwd=resolved_cwd,
-        model_name=str(resolved["model"]),
-        max_iterations=int(resolved["max_iterations"]),
-        hitl_enabled=bool(resolved["hitl_enabled"]),
-    )
-
-    console.print(
-        Panel(
-            Text.from_markup(
-                f"[bold cyan]retrAI[/bold cyan]  [dim]—[/dim]  goal=[bold]{cfg.goal}[/bold]  "
-                f"model=[bold]{cfg.model_name}[/bold]  max-iter=[bold]{cfg.max_iterations}[/bold]  "
-                f"hitl=[bold]{'on' if cfg.hitl_enabled else 'off'}[/bold]\n"
-                f"[dim]cwd: {resolved_cwd}[/dim]"
-            ),
-            border_style="cyan",
-        )
-    )
-
-    exit_code = asyncio.run(_run_cli(cfg))
-    raise typer.Exit(code=exit_code)
-
-
-async def _run_cli(cfg) -> int:
-    """Run the agent loop and stream events to the terminal."""
-    from retrai.agent.graph import build_graph
-    from retrai.events.bus import AsyncEventBus
-    from retrai.goals.registry import get_goal
-
-    goal = get_goal(cfg.goal)
-    bus = AsyncEventBus()
-    graph = build_graph(hitl_enabled=cfg.hitl_enabled)
-
-    initial_state = {
-        "messages": [],
-        "pending_tool_calls": [],
-        "tool_results": [],
-        "goal_achieved": False,
-        "goal_reason": "",
-        "iteration": 0,
-        "max_iterations": cfg.max_iterations,
-        "hitl_enabled": cfg.hitl_enabled,
-        "model_name": cfg.model_name,
-        "cwd": cfg.cwd,
-        "run_id": cfg.run_id,
-    }
-
-    run_config = {
-        "configurable": {
-            "thread_id": cfg.run_id,
-            "event_bus": bus,
-            "goal": goal,
-        }
-    }
-
-    q = await bus.subscribe()
-
-    # Run graph and consume events concurrently
-    graph_task = asyncio.create_task(graph.ainvoke(initial_state, config=run_config))  # type: ignore[arg-type]
-    final_state = None
-    exit_code = 1
+@app.callback()
+def _root() -> None:
+    # An explicit callback keeps `app` a command group even when only the
+    # invoked command has been registered.
+    pass
 
-    async def consume_events() -> None:
-        nonlocal exit_code
-        async for event in bus.iter_events(q):
-            _render_event(event)
-            if event.kind == "run_end":
-                payload = event.payload
-                if payload.get("status") == "achieved":
-                    exit_code = 0
 
-    consumer_task = asyncio.create_task(consume_events())
+# Command name -> (module, function), in help order
+_COMMANDS: dict[str, tuple[str, str]] = {
+    "run": ("retrai.cli._cmd_run", "run"),
+    "serve": ("retrai.cli._cmd_serve", "serve"),
+    "tui": ("retrai.cli._cmd_tui", "tui"),
+    "init": ("retrai.cli._cmd_init", "init"),
+    "generate-eval": ("retrai.cli._cmd_generate_eval", "generate_eval"),
+}
+_FUNC_TO_COMMAND = {func: name for name, (_, func) in _COMMANDS.items()}
+_registered: dict[str, Any] = {}
 
-    try:
-        final_state = await graph_task
-    except Exception as e:
-        console.print(f"\n[red]Run failed: {e}[/red]")
-    finally:
-        await bus.close()
-        await consumer_task
 
-    if final_state:
-        achieved = final_state.get("goal_achieved", False)
-        reason = final_state.get("goal_reason", "")
-        iters = final_state.get("iteration", 0)
-        if achieved:
-            console.print(
-                Panel(
-                    f"[bold green]GOAL ACHIEVED[/bold green] after {iters} iteration(s)\n{reason}",
-                    border_style="green",
-                )
-            )
-            exit_code = 0
-        else:
-            console.print(
-                Panel(
-                    f"[bold red]GOAL NOT ACHIEVED[/bold red] after {iters} iteration(s)\n{reason}",
-                    border_style="red",
-                )
-            )
-            exit_code = 1
+def _register(name: str) -> Any:
+    """Import command *name*'s module and add it to ``app`` (once)."""
+    func = _registered.get(name)
+    if func is None:
+        import importlib
 
-    return exit_code
+        module_name, attr = _COMMANDS[name]
+        func = getattr(importlib.import_module(module_name), attr)
+        app.command(name=name)(func)
+        _registered[name] = func
+    return func
 
 
-def _render_event(event) -> None:
-    """Render an AgentEvent to the terminal."""
-    kind = event.kind
-    payload = event.payload
-    iteration = event.iteration
+def _sniff_subcommand(argv: list[str] | None) -> str | None:
+    """The command named by ``argv[0]``, if any.
 
-    if kind == "step_start":
-        node = payload.get("node", "?")
-        console.print(f"\n[bold blue]▶ [{iteration}] {node.upper()}[/bold blue]")
-
-    elif kind == "tool_call":
-        tool = payload.get("tool", "?")
-        args = payload.get("args", {})
-        args_str = _fmt_args(args)
-        console.print(f"  [cyan]⟶ {tool}[/cyan]({args_str})")
-
-    elif kind == "tool_result":
-        tool = payload.get("tool", "?")
-        err = payload.get("error", False)
-        content = payload.get("content", "")[:200]
-        color = "red" if err else "green"
-        icon = "✗" if err else "✓"
-        console.print(f"  [{color}]{icon} {tool}[/{color}]: {content!r}")
-
-    elif kind == "goal_check":
-        achieved = payload.get("achieved", False)
-        reason = payload.get("reason", "")
-        color = "green" if achieved else "yellow"
-        icon = "✓" if achieved else "…"
-        console.print(f"  [{color}]{icon} Goal: {reason}[/{color}]")
-
-    elif kind == "human_check_required":
-        console.print("\n[bold yellow]⏸  Human check required[/bold yellow]")
-        console.print("  [dim]Use 'retrai serve' and the web UI to approve/abort.[/dim]")
-
-    elif kind == "iteration_complete":
-        iteration = payload.get("iteration", 0)
-        console.print(f"  [dim]--- iteration {iteration} complete ---[/dim]")
-
-    elif kind == "run_end":
-        status = payload.get("status", "?")
-        console.print(f"\n[bold]Run ended: {status}[/bold]")
-
-    elif kind == "error":
-        err = payload.get("error", "unknown error")
-        console.print(f"\n[bold red]ERROR: {err}[/bold red]")
-
-
-def _fmt_args(args: dict) -> str:
-    parts = []
-    for k, v in args.items():
-        v_str = repr(v) if not isinstance(v, str) else repr(v[:80])
-        parts.append(f"{k}={v_str}")
-    return ", ".join(parts)
-
-
-@app.command()
-def serve(
-    host: str = typer.Option("0.0.0.0", "--host", help="Host to bind to"),
-    port: int = typer.Option(8000, "--port", "-p", help="Port to listen on"),
-    reload: bool = typer.Option(False, "--reload", help="Enable auto-reload (dev mode)"),
-) -> None:
-    """Start the retrAI web dashboard (FastAPI + Vue)."""
-    from dotenv import load_dotenv
-
-    load_dotenv()
-
-    import uvicorn
-
-    console.print(
-        Panel(
-            f"[bold cyan]retrAI server[/bold cyan] starting on [bold]http://{host}:{port}[/bold]",
-            border_style="cyan",
-        )
-    )
-    uvicorn.run(
-        "retrai.server.app:app",
-        host=host,
-        port=port,
-        reload=reload,
-        log_level="info",
-    )
-
-
-@app.command()
-def tui(
-    goal: str | None = typer.Argument(
-        None,
-        help=(
-            "Goal to achieve (e.g. 'pytest', 'pyright', 'bun-test'). "
-            "Omit to auto-detect from project files."
-        ),
-    ),
-    cwd: str = typer.Option(".", "--cwd", "-C", help="Project directory"),
-    model: str = typer.Option("claude-sonnet-4-6", "--model", "-m", help="LLM model"),
-    max_iter: int = typer.Option(20, "--max-iter", "-n", help="Max iterations"),
-    hitl: bool = typer.Option(False, "--hitl", help="Enable human-in-the-loop checkpoints"),
-    api_key: str | None = typer.Option(
-        None, "--api-key", "-k", help="API key (overrides env var)", envvar="LLM_API_KEY"
-    ),
-    api_base: str | None = typer.Option(
-        None, "--api-base", help="Custom API base URL (e.g. for Azure, Ollama, vLLM)"
-    ),
-) -> None:
-    """Launch the interactive Textual TUI.
-
-    If no goal is given, retrAI scans the project and auto-detects the right one.
-    """
-    from retrai.config import RunConfig
-    from retrai.tui.app import RetrAITUI
-
-    resolved_cwd = str(Path(cwd).resolve())
-    resolved = _resolve_config(
-        resolved_cwd,
-        goal=goal,
-        model=model,
-        max_iter=max_iter,
-        hitl=hitl,
-        api_key=api_key,
-        api_base=api_base,
-    )
-
-    cfg = RunConfig(
-        goal=str(resolved["goal"]),
-        cwd=resolved_cwd,
-        model_name=str(resolved["model"]),
-        max_iterations=int(resolved["max_iterations"]),
-        hitl_enabled=bool(resolved["hitl_enabled"]),
-    )
-    tui_app = RetrAITUI(cfg=cfg)
-    tui_app.run()
-
-
-@app.command()
-def init(
-    cwd: str = typer.Option(".", "--cwd", "-C", help="Project directory"),
-    goal: str | None = typer.Option(
-        None, "--goal", "-g", help="Goal to use (auto-detected if omitted)"
-    ),
-    model: str = typer.Option("claude-sonnet-4-6", "--model", "-m", help="LLM model name"),
-    max_iter: int = typer.Option(20, "--max-iter", "-n", help="Max agent iterations"),
-    hitl: bool = typer.Option(False, "--hitl", help="Enable human-in-the-loop checkpoints"),
-) -> None:
-    """Scaffold a .retrai.yml config file in the project directory."""
-    import yaml
-
-    from retrai.goals.detector import detect_goal
-    from retrai.goals.registry import list_goals
-
-    resolved_cwd = str(Path(cwd).resolve())
-
-    if goal is None:
-        detected = detect_goal(resolved_cwd)
-        if detected:
-            console.print(f"[dim]Auto-detected:[/dim] [bold cyan]{detected}[/bold cyan]")
-            goal = detected
-        else:
-            available = ", ".join(list_goals())
-            console.print(
-                "[yellow]Could not auto-detect a test framework.[/yellow]\n"
-                f"Available goals: [bold]{available}[/bold]\n"
-                "Pass [bold]--goal <name>[/bold] to configure manually."
-            )
-            raise typer.Exit(code=1)
-
-    config: dict = {
-        "goal": goal,
-        "model": model,
-        "max_iterations": max_iter,
-        "hitl_enabled": hitl,
-    }
-
-    config_path = Path(resolved_cwd) / ".retrai.yml"
-    config_path.write_text(yaml.dump(config, default_flow_style=False, sort_keys=False))
-
-    console.print(
-        Panel(
-            Text.from_markup(
-                f"[bold green]✓ Created[/bold green] [bold]{config_path}[/bold]\n\n"
-                f"  goal:           [cyan]{goal}[/cyan]\n"
-                f"  model:          [cyan]{model}[/cyan]\n"
-                f"  max_iterations: [cyan]{max_iter}[/cyan]\n"
-                f"  hitl_enabled:   [cyan]{hitl}[/cyan]\n\n"
-                "Run [bold]retrai run[/bold] to start the agent."
-            ),
-            border_style="green",
-            title="retrAI init",
-        )
-    )
-
-
-@app.command(name="generate-eval")
-def generate_eval(
-    description: str = typer.Argument(..., help="Natural language description of what to achieve"),
-    cwd: str = typer.Option(".", "--cwd", "-C", help="Project directory"),
-    model: str = typer.Option("claude-sonnet-4-6", "--model", "-m", help="LLM model name"),
-) -> None:
-    """Generate an AI eval harness from a natural-language description.
-
-    Example:
-        retrai generate-eval "make the sort function run in O(n log n) time"
-
-    After running this, use:
-        retrai run ai-eval
+    Only the first token counts: the root group's one option is ``--help``,
+    and ``retrai --help <cmd>`` prints the top-level help, which needs every
+    command registered anyway.
     """
-    from dotenv import load_dotenv
-
-    load_dotenv()
-
-    from retrai.goals.planner import generate_eval_harness
-
-    resolved_cwd = str(Path(cwd).resolve())
-
-    console.print(
-        Panel(
-            f"[bold cyan]Generating eval harness…[/bold cyan]\n[dim]{description}[/dim]",
-            border_style="cyan",
-        )
-    )
-
-    harness_path = asyncio.run(
-        generate_eval_harness(
-            description=description,
-            cwd=resolved_cwd,
-            model_name=model,
-        )
-    )
-
-    harness_content = harness_path.read_text()
-    console.print(
-        Panel(
-            harness_content,
-            title=(
-                f"[bold green]✓ Harness saved to "
-                f"{harness_path.relative_to(resolved_cwd)}[/bold green]"
-            ),
-            border_style="green",
-        )
-    )
-    console.print(
-        "\n[bold]Next step:[/bold] run [bold cyan]retrai run ai-eval[/bold cyan]"
-        f" [dim]--cwd {resolved_cwd}[/dim]"
-    )
+    if argv and argv[0] in _COMMANDS:
+        return argv[0]
+    return None
+
+
+def register_commands(argv: list[str] | None = None) -> None:
+    """Register the command *argv* invokes, or every command if it names none."""
+    name = _sniff_subcommand(argv)
+    if name is not None:
+        _register(name)
+        return
+    for name in _COMMANDS:
+        _register(name)
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: `from retrai.cli.app import run` registers and returns the command
+    command = _FUNC_TO_COMMAND.get(name)
+    if command is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _register(command)
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import copy
+import os
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from pathlib import Path
 from typing import Any
 
 # Provider definitions — models are fetched dynamically from LiteLLM
@@ -42,6 +44,9 @@ PROVIDER_DEFS: list[dict[str, Any]] = [
     },
 ]
 
+# Provider names in menu order; static, unlike the LiteLLM-derived model lists
+PROVIDER_NAMES: tuple[str, ...] = tuple(pdef["name"] for pdef in PROVIDER_DEFS)
+
 
 def _pick_best_models(all_models: list[str], prefix: str, limit: int = 8) -> list[str]:
     """Filter and rank models for a provider prefix from LiteLLM's registry."""
@@ -102,7 +107,7 @@ class RunConfig:
     """Configuration for a single agent run."""
 
     goal: str
-    cwd: str = field(default_factory=lambda: str(Path.cwd()))
+    cwd: str = field(default_factory=os.getcwd)
     model_name: str = "claude-sonnet-4-6"
     max_iterations: int = 20
     hitl_enabled: bool = False
@@ -113,18 +118,71 @@ class RunConfig:
             import uuid
 
             self.run_id = str(uuid.uuid4())
-        # Resolve to absolute path
-        self.cwd = str(Path(self.cwd).resolve())
+        # Resolve to an absolute, symlink-free path (same as Path.resolve())
+        self.cwd = os.path.realpath(self.cwd)
 
 
-def load_config(cwd: str) -> dict[str, Any] | None:
-    """Load config from .retrai.yml if it exists, else return None."""
-    import yaml
+# Parsed .retrai.yml files: resolved path -> (mtime_ns, size, data), LRU-bounded.
+# Shared by the CLI (load_config) and the config-driven goals (load_goal_config).
+_MAX_CACHED_CONFIGS = 100
+_config_cache: OrderedDict[str, tuple[int, int, dict[str, Any] | None]] = OrderedDict()
+
+
+def _load_cached(cwd: str) -> dict[str, Any] | None:
+    """Return the cached parse of *cwd*/.retrai.yml, re-reading it only when its
+    mtime or size changes.
 
-    config_path = Path(cwd) / ".retrai.yml"
-    if not config_path.exists():
+    Returns None when the file is missing or its top level is not a mapping.
+    The dict is shared with the cache; public callers hand out copies.
+    """
+    # Plain os.path on this per-call path; no PurePath objects
+    config_path = os.path.join(cwd, ".retrai.yml")
+    try:
+        st = os.stat(config_path)
+    except OSError:
         return None
-    with config_path.open() as f:
-        data = yaml.safe_load(f)
-    return data if isinstance(data, dict) else None
 
+    key = os.path.abspath(config_path)
+    cached = _config_cache.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        _config_cache.move_to_end(key)
+        return cached[2]
+
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader  # type: ignore[assignment]
+
+    # Bytes go straight to libyaml, which does its own decoding
+    with open(config_path, "rb") as f:
+        data = yaml.load(f, Loader=Loader)
+    if not isinstance(data, dict):
+        data = None
+    _config_cache[key] = (st.st_mtime_ns, st.st_size, data)
+    _config_cache.move_to_end(key)
+    while len(_config_cache) > _MAX_CACHED_CONFIGS:
+        _config_cache.popitem(last=False)
+    return data
+
+
+def load_config(cwd: str) -> dict[str, Any] | None:
+    """Load config from .retrai.yml if it exists, else return None.
+
+    Parsed files are cached and re-read only when their mtime or size changes;
+    callers get a deep copy they are free to mutate.
+    """
+    data = _load_cached(cwd)
+    return copy.deepcopy(data) if data is not None else None
+
+
+def load_goal_config(cwd: str) -> dict[str, Any]:
+    """Like load_config, but returns {} when the file is missing or unreadable.
+
+    Goals treat a broken .retrai.yml as "not configured" rather than failing.
+    """
+    try:
+        return load_config(cwd) or {}
+    except Exception:
+        return {}
@@ -7,38 +7,75 @@ from collections.abc import AsyncIterator
 
 from retrai.events.types import AgentEvent
 
+# Per-subscriber queue bound; on overflow the oldest queued event is dropped
+SUBSCRIBER_QUEUE_SIZE = 1024
+
 
 class AsyncEventBus:
-    """Fan-out event bus. Each subscriber gets its own queue."""
+    """Fan-out event bus. Each subscriber gets its own bounded queue.
+
+    Subscribers are held in an immutable tuple that is rebound on
+    subscribe/unsubscribe. All access happens on one event loop, so publishers
+    iterate a consistent snapshot without taking a lock. A subscriber that
+    falls behind loses its oldest events rather than stalling the producer or
+    growing without bound; ``dropped(q)`` reports how many.
+    """
 
     def __init__(self) -> None:
-        self._subscribers: list[asyncio.Queue[AgentEvent | None]] = []
-        self._lock = asyncio.Lock()
+        self._subs: tuple[asyncio.Queue[AgentEvent | None], ...] = ()
+        self._dropped: dict[asyncio.Queue[AgentEvent | None], int] = {}
 
-    async def subscribe(self) -> asyncio.Queue[AgentEvent | None]:
+    async def subscribe(
+        self, maxsize: int = SUBSCRIBER_QUEUE_SIZE
+    ) -> asyncio.Queue[AgentEvent | None]:
         """Create and register a new subscriber queue."""
-        q: asyncio.Queue[AgentEvent | None] = asyncio.Queue()
-        async with self._lock:
-            self._subscribers.append(q)
+        q: asyncio.Queue[AgentEvent | None] = asyncio.Queue(maxsize=maxsize)
+        self._subs = (*self._subs, q)
         return q
 
     async def unsubscribe(self, q: asyncio.Queue[AgentEvent | None]) -> None:
-        async with self._lock:
-            self._subscribers.remove(q)
+        """Remove *q*; raises ValueError if it is not subscribed."""
+        if not any(x is q for x in self._subs):
+            raise ValueError("queue is not subscribed")
+        self._subs = tuple(x for x in self._subs if x is not q)
+        self._dropped.pop(q, None)
+
+    def dropped(self, q: asyncio.Queue[AgentEvent | None]) -> int:
+        """Number of events dropped from *q* because it was full."""
+        return self._dropped.get(q, 0)
+
+    def _offer(self, q: asyncio.Queue[AgentEvent | None], item: AgentEvent | None) -> None:
+        try:
+            q.put_nowait(item)
+        except asyncio.QueueFull:
+            # Drop the oldest event so the newest (and the close sentinel) get in
+            q.get_nowait()
+            self._dropped[q] = self._dropped.get(q, 0) + 1
+            q.put_nowait(item)
 
     async def publish(self, event: AgentEvent) -> None:
-        """Publish an event to all subscribers."""
-        async with self._lock:
-            subs = list(self._subscribers)
-        for q in subs:
-            await q.put(event)
+        """Publish an event to all subscribers.
+
+        ``tool_result`` events carry at most ``TOOL_RESULT_PREVIEW_CHARS`` of
+        content; producers truncate before publishing.
+        """
+        for q in self._subs:
+            self._offer(q, event)
+
+    async def publish_many(self, events: list[AgentEvent]) -> None:
+        """Publish several events to all subscribers."""
+        for q in self._subs:
+            for event in events:
+                self._offer(q, event)
 
     async def close(self) -> None:
-        """Signal all subscribers that the bus is closing."""
-        async with self._lock:
-            subs = list(self._subscribers)
-        for q in subs:
-            await q.put(None)
+        """Signal all subscribers that the bus is closing.
+
+        Each subscriber queue receives a ``None`` sentinel; consumers may read
+        their queue directly and stop at it instead of using ``iter_events``.
+        """
+        for q in self._subs:
+            self._offer(q, None)
 
     async def iter_events(self, q: asyncio.Queue[AgentEvent | None]) -> AsyncIterator[AgentEvent]:
         """Async-iterate over events from a subscriber queue."""
@@ -6,6 +6,8 @@ import time
 from dataclasses import dataclass, field
 from typing import Literal
 
+from retrai.utils import jsonx
+
 EventKind = Literal[
     "step_start",
     "tool_call",
@@ -20,8 +22,12 @@ EventKind = Literal[
     "llm_usage",
 ]
 
+# Upper bound on ``tool_result`` payload content; producers truncate before
+# publishing so consumers never hold full tool output.
+TOOL_RESULT_PREVIEW_CHARS = 200
+
 
-@dataclass
+@dataclass(slots=True)
 class AgentEvent:
     """A structured event emitted by the agent during a run."""
 
@@ -30,6 +36,8 @@ class AgentEvent:
     iteration: int
     payload: dict
     ts: float = field(default_factory=time.time)
+    # Encoded once and shared by every subscriber; orjson skips "_" fields
+    _json: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
         return {
@@ -39,3 +47,9 @@ class AgentEvent:
             "payload": self.payload,
             "ts": self.ts,
         }
+
+    def to_json(self) -> str:
+        """Return the event as JSON text, encoding it at most once."""
+        if self._json is None:
+            self._json = jsonx.dumps(self)
+        return self._json
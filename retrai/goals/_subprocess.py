@@ -0,0 +1,224 @@
+"""Async subprocess helpers shared by the goal checks."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+
+# asyncio's default 64 KiB line limit is too small for JSON lines that embed
+# captured test output
+_LINE_LIMIT = 16 * 1024 * 1024
+
+
+@dataclass
+class StreamResult:
+    returncode: int
+    stdout_head: str
+    stderr_head: str
+
+
+@dataclass
+class RunResult:
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+@dataclass
+class RawRunResult:
+    returncode: int
+    stdout: bytes
+    stderr: bytes
+
+
+async def run(
+    cmd: str | list[str],
+    cwd: str,
+    *,
+    timeout: float,
+    env: dict[str, str] | None = None,
+) -> RunResult:
+    """Run *cmd* to completion and return its full decoded output.
+
+    A string *cmd* is run through the shell. For commands whose whole output
+    is parsed; prefer :func:`run_capped` when only the head is reported.
+    Raises like :func:`stream_lines`.
+    """
+    raw = await run_raw(cmd, cwd, timeout=timeout, env=env)
+    return RunResult(
+        returncode=raw.returncode,
+        stdout=raw.stdout.decode("utf-8", errors="replace"),
+        stderr=raw.stderr.decode("utf-8", errors="replace"),
+    )
+
+
+async def run_raw(
+    cmd: str | list[str],
+    cwd: str,
+    *,
+    timeout: float,
+    env: dict[str, str] | None = None,
+) -> RawRunResult:
+    """Like :func:`run`, but return the output as undecoded bytes.
+
+    For output handed straight to a bytes parser such as ``jsonx.loads``.
+    """
+    proc = await _spawn(cmd, cwd, env)
+    try:
+        async with asyncio.timeout(timeout):
+            stdout, stderr = await proc.communicate()
+    except BaseException:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+
+    return RawRunResult(returncode=proc.returncode or 0, stdout=stdout, stderr=stderr)
+
+
+async def stream_lines(
+    cmd: list[str],
+    cwd: str,
+    *,
+    timeout: float,
+    on_line: Callable[[bytes], None],
+    stdout_head: int = 2000,
+    stderr_head: int = 1000,
+    env: dict[str, str] | None = None,
+) -> StreamResult:
+    """Run *cmd*, feeding each raw stdout line to *on_line* as it arrives.
+
+    Only the first *stdout_head* / *stderr_head* characters of each stream are
+    kept, so memory stays bounded however much the command prints. A stdout
+    line longer than the 16 MiB line limit is skipped, not passed on. Raises
+    FileNotFoundError if the executable is missing, and TimeoutError (after
+    killing the process) if it runs longer than *timeout* seconds.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        env=env,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=_LINE_LIMIT,
+    )
+    assert proc.stdout is not None and proc.stderr is not None
+    # Characters are at most 4 UTF-8 bytes, so this many bytes always suffices
+    head = bytearray()
+    head_bytes = stdout_head * 4
+
+    async def read_stdout() -> None:
+        stdout = proc.stdout
+        assert stdout is not None
+        skipping = False
+        while True:
+            try:
+                line = await stdout.readuntil(b"\n")
+            except asyncio.IncompleteReadError as e:
+                line = e.partial  # last line without a newline, or b"" at EOF
+            except asyncio.LimitOverrunError as e:
+                # Discard the over-long line in chunks rather than failing the read
+                await stdout.readexactly(e.consumed)
+                skipping = True
+                continue
+            if not line:
+                return
+            if skipping:
+                # Tail of the over-long line, up to and including its newline
+                skipping = False
+                continue
+            if len(head) < head_bytes:
+                head.extend(line[: head_bytes - len(head)])
+            on_line(line)
+
+    try:
+        async with asyncio.timeout(timeout):
+            _, stderr, _ = await asyncio.gather(
+                read_stdout(), _read_head(proc.stderr, stderr_head * 4), proc.wait()
+            )
+    except BaseException:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+
+    return StreamResult(
+        returncode=proc.returncode or 0,
+        stdout_head=decode_head(head, stdout_head),
+        stderr_head=decode_head(stderr, stderr_head),
+    )
+
+
+async def run_capped(
+    cmd: str | list[str],
+    cwd: str,
+    *,
+    timeout: float,
+    stdout_head: int = 2000,
+    stderr_head: int = 1000,
+    env: dict[str, str] | None = None,
+) -> StreamResult:
+    """Run *cmd* to completion, keeping only the head of each output stream.
+
+    A string *cmd* is run through the shell. Both pipes are drained so the
+    child never blocks on a full buffer, but at most *stdout_head* /
+    *stderr_head* characters are retained. Raises like :func:`stream_lines`.
+    """
+    proc = await _spawn(cmd, cwd, env)
+    assert proc.stdout is not None and proc.stderr is not None
+
+    try:
+        async with asyncio.timeout(timeout):
+            stdout, stderr, _ = await asyncio.gather(
+                _read_head(proc.stdout, stdout_head * 4),
+                _read_head(proc.stderr, stderr_head * 4),
+                proc.wait(),
+            )
+    except BaseException:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+
+    return StreamResult(
+        returncode=proc.returncode or 0,
+        stdout_head=decode_head(stdout, stdout_head),
+        stderr_head=decode_head(stderr, stderr_head),
+    )
+
+
+async def _spawn(
+    cmd: str | list[str], cwd: str, env: dict[str, str] | None
+) -> asyncio.subprocess.Process:
+    """Start *cmd* with piped output; a string goes through the shell."""
+    if isinstance(cmd, str):
+        return await asyncio.create_subprocess_shell(
+            cmd,
+            cwd=cwd,
+            env=env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    return await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        env=env,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+
+async def _read_head(stream: asyncio.StreamReader, limit: int) -> bytearray:
+    """Drain *stream* to EOF, keeping only its first *limit* bytes."""
+    head = bytearray()
+    while chunk := await stream.read(65536):
+        if len(head) < limit:
+            head.extend(chunk[: limit - len(head)])
+    return head
+
+
+def decode_head(data: bytes | bytearray, chars: int) -> str:
+    """Decode at most the first *chars* characters of UTF-8 *data*."""
+    # Characters are at most 4 UTF-8 bytes, so the rest is never decoded
+    return data[: chars * 4].decode("utf-8", errors="replace")[:chars]
@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
-import json
-import subprocess
+from functools import lru_cache
 from pathlib import Path
 
+from retrai.goals._subprocess import run
 from retrai.goals.base import GoalBase, GoalResult
 from retrai.goals.pytest_goal import _extract_failures
+from retrai.utils import jsonx
+
+
+@lru_cache(maxsize=8)
+def _load_ai_eval_cfg(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse an ai_eval_config.json; the stat fields key the cache."""
+    try:
+        data = jsonx.loads(Path(path).read_bytes())
+    except (OSError, jsonx.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
 
 
 class AiEvalGoal(GoalBase):
@@ -15,12 +26,12 @@ class AiEvalGoal(GoalBase):
 
     def _load_config(self, cwd: str) -> dict:
         config_path = Path(cwd) / ".retrai" / "ai_eval_config.json"
-        if config_path.exists():
-            try:
-                return json.loads(config_path.read_text())
-            except json.JSONDecodeError:
-                pass
-        return {}
+        try:
+            st = config_path.stat()
+        except OSError:
+            return {}
+        # Copy so callers can't mutate the cached dict
+        return dict(_load_ai_eval_cfg(str(config_path), st.st_mtime_ns, st.st_size))
 
     async def check(self, state: dict, cwd: str) -> GoalResult:
         """Run the AI-generated eval harness with pytest."""
@@ -48,27 +59,26 @@ class AiEvalGoal(GoalBase):
             "--no-header",
         ]
 
+        # Run without blocking the event loop, so events keep flowing meanwhile
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-        except subprocess.TimeoutExpired:
+            result = await run(cmd, cwd, timeout=120)
+        except TimeoutError:
             return GoalResult(
                 achieved=False,
                 reason="eval harness timed out after 120s",
                 details={"error": "timeout"},
             )
+        except FileNotFoundError:
+            return GoalResult(
+                achieved=False,
+                reason="python not found — cannot run the eval harness",
+                details={"error": "python_not_found"},
+            )
 
-        if report_path.exists():
-            try:
-                report = json.loads(report_path.read_text())
-            except json.JSONDecodeError:
-                report = {}
-        else:
+        try:
+            # Parse the raw bytes: no UTF-8 decode pass over the whole report
+            report = jsonx.loads(report_path.read_bytes())
+        except (FileNotFoundError, jsonx.JSONDecodeError):
             report = {}
 
         summary = report.get("summary", {})
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import itertools
 import re
-import subprocess
 
+from retrai.goals._subprocess import run
 from retrai.goals.base import GoalBase, GoalResult
 
+_PASS_RE = re.compile(r"(\d+)\s+pass", re.IGNORECASE)
+_FAIL_RE = re.compile(r"(\d+)\s+fail", re.IGNORECASE)
+# Whole lines containing a failure marker, matched in one pass over the output
+_FAILURE_LINES_RE = re.compile(r"^[^\n]*(?:✗|× |FAIL)[^\n]*", re.MULTILINE)
+# The same markers as plain substrings, to skip streams with no failures at all
+_FAILURE_MARKERS = ("✗", "× ", "FAIL")
+
 
 class BunTestGoal(GoalBase):
     name = "bun-test"
@@ -15,14 +23,8 @@ class BunTestGoal(GoalBase):
         """Run bun test and check for failures."""
         cmd = ["bun", "test", "--reporter", "verbose"]
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-        except subprocess.TimeoutExpired:
+            result = await run(cmd, cwd, timeout=120)
+        except TimeoutError:
             return GoalResult(
                 achieved=False,
                 reason="bun test timed out after 120s",
@@ -35,10 +37,10 @@ class BunTestGoal(GoalBase):
                 details={"error": "bun_not_found"},
             )
 
-        output = result.stdout + result.stderr
+        # The streams are searched one after the other rather than concatenated
         if result.returncode == 0:
             # Parse summary: "X tests passed"
-            m = re.search(r"(\d+)\s+pass", output, re.IGNORECASE)
+            m = _PASS_RE.search(result.stdout) or _PASS_RE.search(result.stderr)
             passed = int(m.group(1)) if m else 0
             return GoalResult(
                 achieved=True,
@@ -47,9 +49,9 @@ class BunTestGoal(GoalBase):
             )
 
         # Extract failure count
-        failed_m = re.search(r"(\d+)\s+fail", output, re.IGNORECASE)
+        failed_m = _FAIL_RE.search(result.stdout) or _FAIL_RE.search(result.stderr)
         failed = int(failed_m.group(1)) if failed_m else "?"
-        failures = _extract_bun_failures(output)
+        failures = _extract_bun_failures(result.stdout, result.stderr)
         return GoalResult(
             achieved=False,
             reason=f"{failed} bun test(s) failed",
@@ -73,10 +75,10 @@ class BunTestGoal(GoalBase):
         )
 
 
-def _extract_bun_failures(output: str) -> list[str]:
-    """Extract failing test names from bun test verbose output."""
-    failures = []
-    for line in output.splitlines():
-        if "✗" in line or "× " in line or "FAIL" in line:
-            failures.append(line.strip())
-    return failures[:20]
+def _extract_bun_failures(*outputs: str) -> list[str]:
+    """Extract up to 20 failing test names from bun test verbose output streams."""
+    # A substring scan is much cheaper than the line regex, which backtracks
+    # through every line; most streams (e.g. stderr) have no marker at all
+    flagged = [out for out in outputs if any(m in out for m in _FAILURE_MARKERS)]
+    matches = itertools.chain.from_iterable(map(_FAILURE_LINES_RE.finditer, flagged))
+    return [m.group().strip() for m in itertools.islice(matches, 20)]
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-import json
-import subprocess
+import re
 
+from retrai.goals._subprocess import stream_lines
 from retrai.goals.base import GoalBase, GoalResult
+from retrai.utils import jsonx
+
+# The "event": "failed" pair of a libtest JSON message, spaced or compact
+_CARGO_FAILURE_RE = re.compile(rb'"event"\s*:\s*"failed"')
 
 
 class CargoTestGoal(GoalBase):
@@ -14,15 +18,18 @@ class CargoTestGoal(GoalBase):
     async def check(self, state: dict, cwd: str) -> GoalResult:
         """Run cargo test --message-format json and check for failures."""
         cmd = ["cargo", "test", "--message-format", "json", "--", "--test-output=immediate"]
+        failures: list[dict] = []
+
+        def on_line(line: bytes) -> None:
+            failure = _cargo_failure(line)
+            if failure is not None:
+                failures.append(failure)
+
+        # Parse JSON messages as they stream in; only failures and the output
+        # heads are kept, not the whole (possibly huge) stdout
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=300,
-            )
-        except subprocess.TimeoutExpired:
+            result = await stream_lines(cmd, cwd, timeout=300, on_line=on_line)
+        except TimeoutError:
             return GoalResult(
                 achieved=False,
                 reason="cargo test timed out after 300s",
@@ -35,13 +42,11 @@ class CargoTestGoal(GoalBase):
                 details={"error": "cargo_not_found"},
             )
 
-        failures = _parse_cargo_failures(result.stdout)
-
         if result.returncode == 0:
             return GoalResult(
                 achieved=True,
                 reason="All cargo tests passed",
-                details={"stdout": result.stdout[:2000], "stderr": result.stderr[:1000]},
+                details={"stdout": result.stdout_head, "stderr": result.stderr_head},
             )
 
         return GoalResult(
@@ -49,8 +54,8 @@ class CargoTestGoal(GoalBase):
             reason=f"{len(failures)} cargo test(s) failed",
             details={
                 "failures": failures,
-                "stdout": result.stdout[:2000],
-                "stderr": result.stderr[:1000],
+                "stdout": result.stdout_head,
+                "stderr": result.stderr_head,
             },
         )
 
@@ -72,22 +77,20 @@ class CargoTestGoal(GoalBase):
         )
 
 
-def _parse_cargo_failures(stdout: str) -> list[dict]:
-    """Parse JSON lines from cargo test output to find failures."""
-    failures = []
-    for line in stdout.splitlines():
-        line = line.strip()
-        if not line.startswith("{"):
-            continue
-        try:
-            msg = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if msg.get("type") == "test" and msg.get("event") == "failed":
-            failures.append(
-                {
-                    "name": msg.get("name", ""),
-                    "stdout": msg.get("stdout", "")[:1000],
-                }
-            )
-    return failures
+def _cargo_failure(line: bytes) -> dict | None:
+    """Parse one line of cargo test JSON output; return it if it is a test failure."""
+    # Most lines are compiler messages or passing tests; skip them without decoding
+    if _CARGO_FAILURE_RE.search(line) is None:
+        return None
+    try:
+        msg = jsonx.loads(line)
+    except jsonx.JSONDecodeError:
+        return None
+    if not isinstance(msg, dict):
+        return None
+    if msg.get("type") == "test" and msg.get("event") == "failed":
+        return {
+            "name": msg.get("name", ""),
+            "stdout": msg.get("stdout", "")[:1000],
+        }
+    return None
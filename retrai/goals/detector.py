@@ -2,9 +2,25 @@
 
 from __future__ import annotations
 
-import json
+import os
+import re
+from collections import OrderedDict
 from pathlib import Path
 
+from retrai.utils import jsonx
+
+# Files whose *contents* affect detection; the rest only matter by name
+_CONTENT_MARKERS = ("pyproject.toml", "setup.cfg", "package.json", "Makefile")
+
+# cwd -> (fingerprint, detected goal), LRU-bounded for long-lived processes
+_MAX_CACHED_DIRS = 64
+
+# package.json can only select npm-test if it mentions one of these runners
+_NPM_RUNNERS = (b"jest", b"vitest", b"mocha")
+
+_MAKE_TEST_TARGET_RE = re.compile(rb"^[ \t]*test[: ]", re.MULTILINE)
+_detect_cache: OrderedDict[str, tuple[tuple, str | None]] = OrderedDict()
+
 
 def detect_goal(cwd: str) -> str | None:
     """Scan project files and return the best matching goal name.
@@ -19,81 +35,119 @@ def detect_goal(cwd: str) -> str | None:
     7. package.json + jest/vitest in deps → "npm-test"
     8. Makefile with test target → "make-test"
     9. None (caller must handle)
+
+    The top-level directory is listed once with ``os.scandir``. Results are
+    memoized per *cwd* until the directory's mtime, or the mtime/size of a
+    marker file whose contents matter, changes.
     """
-    root = Path(cwd)
+    try:
+        dir_mtime = os.stat(cwd).st_mtime_ns
+        with os.scandir(cwd) as it:
+            entries = {entry.name: entry for entry in it}
+    except OSError:
+        return None
 
+    fingerprint = (dir_mtime, *_marker_stats(entries))
+    cached = _detect_cache.get(cwd)
+    if cached is not None and cached[0] == fingerprint:
+        _detect_cache.move_to_end(cwd)
+        return cached[1]
+    goal = _detect(Path(cwd), entries)
+    _detect_cache[cwd] = (fingerprint, goal)
+    _detect_cache.move_to_end(cwd)
+    while len(_detect_cache) > _MAX_CACHED_DIRS:
+        _detect_cache.popitem(last=False)
+    return goal
+
+
+def _marker_stats(entries: dict[str, os.DirEntry]) -> list[tuple[int, int]]:
+    stats = []
+    for name in _CONTENT_MARKERS:
+        entry = entries.get(name)
+        if entry is None:
+            stats.append((0, -1))
+            continue
+        try:
+            st = entry.stat()
+        except OSError:
+            stats.append((0, -1))
+        else:
+            stats.append((st.st_mtime_ns, st.st_size))
+    return stats
+
+
+def _detect(root: Path, entries: dict[str, os.DirEntry]) -> str | None:
     # 1. User has a .retrai.yml — they explicitly configured shell-goal
-    if (root / ".retrai.yml").exists():
+    if ".retrai.yml" in entries:
         return "shell-goal"
 
     # 2. Python project with pytest
-    if _has_pytest(root):
+    if _has_pytest(root, entries):
         return "pytest"
 
     # 3. Python project with pyright (but no pytest)
-    if _has_pyright(root):
+    if _has_pyright(root, entries):
         return "pyright"
 
     # 4. Rust project
-    if (root / "Cargo.toml").exists():
+    if "Cargo.toml" in entries:
         return "cargo-test"
 
     # 5. Go project
-    if (root / "go.mod").exists():
+    if "go.mod" in entries:
         return "go-test"
 
     # 6. JavaScript with bun
-    if (root / "package.json").exists() and (root / "bun.lock").exists():
+    if "package.json" in entries and "bun.lock" in entries:
         return "bun-test"
 
     # 7. JavaScript with Jest / Vitest via npm
-    if (root / "package.json").exists():
+    if "package.json" in entries:
         goal = _detect_npm_goal(root)
         if goal:
             return goal
 
     # 8. Makefile with a test target
-    if _has_make_test_target(root):
+    if _has_make_test_target(root, entries):
         return "make-test"
 
     return None
 
 
-def _has_pytest(root: Path) -> bool:
-    """Return True if the project uses pytest."""
-    pyproject = root / "pyproject.toml"
-    setup_cfg = root / "setup.cfg"
-    pytest_ini = root / "pytest.ini"
-    conftest = root / "conftest.py"
+def _is_dir(entries: dict[str, os.DirEntry], name: str) -> bool:
+    entry = entries.get(name)
+    return entry is not None and entry.is_dir()
+
 
-    if pytest_ini.exists() or conftest.exists():
+def _has_pytest(root: Path, entries: dict[str, os.DirEntry]) -> bool:
+    """Return True if the project uses pytest."""
+    if "pytest.ini" in entries or "conftest.py" in entries:
         return True
 
-    if pyproject.exists():
-        content = pyproject.read_text(errors="replace")
-        if "[tool.pytest" in content or "pytest" in content.lower():
+    if "pyproject.toml" in entries:
+        content = (root / "pyproject.toml").read_bytes()
+        if b"[tool.pytest" in content or b"pytest" in content.lower():
             return True
 
-    if setup_cfg.exists():
-        content = setup_cfg.read_text(errors="replace")
-        if "[tool:pytest]" in content:
+    if "setup.cfg" in entries:
+        content = (root / "setup.cfg").read_bytes()
+        if b"[tool:pytest]" in content:
             return True
 
     # Check for tests/ directory
-    if (root / "tests").is_dir() or (root / "test").is_dir():
+    if _is_dir(entries, "tests") or _is_dir(entries, "test"):
         return True
 
     return False
 
 
-def _has_pyright(root: Path) -> bool:
+def _has_pyright(root: Path, entries: dict[str, os.DirEntry]) -> bool:
     """Return True if the project has pyright configured."""
-    if (root / "pyrightconfig.json").exists():
+    if "pyrightconfig.json" in entries:
         return True
-    pyproject = root / "pyproject.toml"
-    if pyproject.exists():
-        content = pyproject.read_text(errors="replace")
-        if "[tool.pyright]" in content:
+    if "pyproject.toml" in entries:
+        content = (root / "pyproject.toml").read_bytes()
+        if b"[tool.pyright]" in content:
             return True
     return False
 
@@ -101,8 +155,16 @@ def _has_pyright(root: Path) -> bool:
 def _detect_npm_goal(root: Path) -> str | None:
     """Detect npm/jest/vitest from package.json."""
     try:
-        pkg = json.loads((root / "package.json").read_text())
-    except (json.JSONDecodeError, OSError):
+        data = (root / "package.json").read_bytes()
+    except OSError:
+        return None
+    # Files that never name a known runner are rejected without parsing
+    lowered = data.lower()
+    if not any(runner in lowered for runner in _NPM_RUNNERS):
+        return None
+    try:
+        pkg = jsonx.loads(data)
+    except ValueError:
         return None
 
     all_deps: dict = {}
@@ -121,14 +183,8 @@ def _detect_npm_goal(root: Path) -> str | None:
     return None
 
 
-def _has_make_test_target(root: Path) -> bool:
+def _has_make_test_target(root: Path, entries: dict[str, os.DirEntry]) -> bool:
     """Return True if the Makefile has a 'test' target."""
-    makefile = root / "Makefile"
-    if not makefile.exists():
+    if "Makefile" not in entries:
         return False
-    content = makefile.read_text(errors="replace")
-    for line in content.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("test:") or stripped.startswith("test "):
-            return True
-    return False
+    return _MAKE_TEST_TARGET_RE.search((root / "Makefile").read_bytes()) is not None
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-import json
-import subprocess
+import re
 
+from retrai.goals._subprocess import stream_lines
 from retrai.goals.base import GoalBase, GoalResult
+from retrai.utils import jsonx
+
+# The "Action": "fail" pair of a test2json event, spaced or compact
+_GO_FAILURE_RE = re.compile(rb'"Action"\s*:\s*"fail"')
 
 
 class GoTestGoal(GoalBase):
@@ -14,15 +18,18 @@ class GoTestGoal(GoalBase):
     async def check(self, state: dict, cwd: str) -> GoalResult:
         """Run go test ./... -json and check for failures."""
         cmd = ["go", "test", "./...", "-json", "-count=1"]
+        failures: list[dict] = []
+
+        def on_line(line: bytes) -> None:
+            failure = _go_failure(line)
+            if failure is not None:
+                failures.append(failure)
+
+        # Parse JSON messages as they stream in; only failures and the output
+        # heads are kept, not the whole (possibly huge) stdout
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=300,
-            )
-        except subprocess.TimeoutExpired:
+            result = await stream_lines(cmd, cwd, timeout=300, on_line=on_line)
+        except TimeoutError:
             return GoalResult(
                 achieved=False,
                 reason="go test timed out after 300s",
@@ -35,13 +42,11 @@ class GoTestGoal(GoalBase):
                 details={"error": "go_not_found"},
             )
 
-        failures = _parse_go_failures(result.stdout)
-
         if result.returncode == 0:
             return GoalResult(
                 achieved=True,
                 reason="All go tests passed",
-                details={"stdout": result.stdout[:2000]},
+                details={"stdout": result.stdout_head},
             )
 
         return GoalResult(
@@ -49,8 +54,8 @@ class GoTestGoal(GoalBase):
             reason=f"{len(failures)} go test(s) failed",
             details={
                 "failures": failures,
-                "stdout": result.stdout[:2000],
-                "stderr": result.stderr[:1000],
+                "stdout": result.stdout_head,
+                "stderr": result.stderr_head,
             },
         )
 
@@ -72,23 +77,21 @@ class GoTestGoal(GoalBase):
         )
 
 
-def _parse_go_failures(stdout: str) -> list[dict]:
-    """Parse JSON lines from go test -json output to find failures."""
-    failures = []
-    for line in stdout.splitlines():
-        line = line.strip()
-        if not line.startswith("{"):
-            continue
-        try:
-            entry = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if entry.get("Action") == "fail" and entry.get("Test"):
-            failures.append(
-                {
-                    "package": entry.get("Package", ""),
-                    "test": entry.get("Test", ""),
-                    "elapsed": entry.get("Elapsed", 0),
-                }
-            )
-    return failures
+def _go_failure(line: bytes) -> dict | None:
+    """Parse one line of go test -json output; return it if it is a test failure."""
+    # Most lines are "run"/"output"/"pass" actions; skip them without decoding
+    if _GO_FAILURE_RE.search(line) is None:
+        return None
+    try:
+        entry = jsonx.loads(line)
+    except jsonx.JSONDecodeError:
+        return None
+    if not isinstance(entry, dict):
+        return None
+    if entry.get("Action") == "fail" and entry.get("Test"):
+        return {
+            "package": entry.get("Package", ""),
+            "test": entry.get("Test", ""),
+            "elapsed": entry.get("Elapsed", 0),
+        }
+    return None
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import subprocess
-
+from retrai.goals._subprocess import run_capped
 from retrai.goals.base import GoalBase, GoalResult
 
 
@@ -17,14 +16,8 @@ class MakeTestGoal(GoalBase):
         """Run make <target> and check for success."""
         cmd = ["make", self.make_target]
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=300,
-            )
-        except subprocess.TimeoutExpired:
+            result = await run_capped(cmd, cwd, timeout=300)
+        except TimeoutError:
             return GoalResult(
                 achieved=False,
                 reason=f"make {self.make_target} timed out after 300s",
@@ -41,13 +34,13 @@ class MakeTestGoal(GoalBase):
             return GoalResult(
                 achieved=True,
                 reason=f"make {self.make_target} passed",
-                details={"stdout": result.stdout[:2000]},
+                details={"stdout": result.stdout_head},
             )
 
         return GoalResult(
             achieved=False,
             reason=f"make {self.make_target} failed (exit {result.returncode})",
-            details={"stdout": result.stdout[:2000], "stderr": result.stderr[:1000]},
+            details={"stdout": result.stdout_head, "stderr": result.stderr_head},
         )
 
     def system_prompt(self) -> str:
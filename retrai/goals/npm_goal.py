@@ -2,10 +2,23 @@
 
 from __future__ import annotations
 
-import subprocess
+import itertools
+import os
+import re
+from functools import cache
 
+from retrai.goals._subprocess import run
 from retrai.goals.base import GoalBase, GoalResult
 
+# Whole lines containing a failure marker, matched in one pass over the output
+_FAILURE_LINES_RE = re.compile(r"^[^\n]*(?:FAIL|✕)[^\n]*", re.MULTILINE)
+
+
+@cache
+def _npm_env() -> dict[str, str]:
+    """Environment for npm test, snapshotted from os.environ on first use."""
+    return {**os.environ, "CI": "true", "FORCE_COLOR": "0"}
+
 
 class NpmTestGoal(GoalBase):
     name = "npm-test"
@@ -14,15 +27,13 @@ class NpmTestGoal(GoalBase):
         """Run npm test and check for failures."""
         cmd = ["npm", "test", "--", "--passWithNoTests"]
         try:
-            result = subprocess.run(
+            result = await run(
                 cmd,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
+                cwd,
                 timeout=180,
-                env={**__import__("os").environ, "CI": "true", "FORCE_COLOR": "0"},
+                env=_npm_env(),
             )
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             return GoalResult(
                 achieved=False,
                 reason="npm test timed out after 180s",
@@ -35,7 +46,6 @@ class NpmTestGoal(GoalBase):
                 details={"error": "npm_not_found"},
             )
 
-        output = result.stdout + result.stderr
         if result.returncode == 0:
             return GoalResult(
                 achieved=True,
@@ -43,11 +53,14 @@ class NpmTestGoal(GoalBase):
                 details={"stdout": result.stdout, "stderr": result.stderr},
             )
 
-        failures = [line.strip() for line in output.splitlines() if "FAIL" in line or "✕" in line]
+        # Search each stream in turn instead of concatenating them
+        streams = (result.stdout, result.stderr)
+        matches = itertools.chain.from_iterable(map(_FAILURE_LINES_RE.finditer, streams))
+        failures = [m.group().strip() for m in itertools.islice(matches, 20)]
         return GoalResult(
             achieved=False,
             reason="npm test failed",
-            details={"failures": failures[:20], "stdout": result.stdout, "stderr": result.stderr},
+            details={"failures": failures, "stdout": result.stdout, "stderr": result.stderr},
         )
 
     def system_prompt(self) -> str:
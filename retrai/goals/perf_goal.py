@@ -2,25 +2,14 @@
 
 from __future__ import annotations
 
-import subprocess
 import time
-from pathlib import Path
-
-import yaml
 
+from retrai.config import load_goal_config
+from retrai.goals._subprocess import run_capped
 from retrai.goals.base import GoalBase, GoalResult
 
-_CONFIG_FILE = ".retrai.yml"
-
-
-def _load_config(cwd: str) -> dict:
-    path = Path(cwd) / _CONFIG_FILE
-    if not path.exists():
-        return {}
-    try:
-        return yaml.safe_load(path.read_text()) or {}
-    except Exception:
-        return {}
+# Only this much benchmark output is ever reported back
+_OUTPUT_CHARS = 2000
 
 
 class PerfCheckGoal(GoalBase):
@@ -39,7 +28,7 @@ class PerfCheckGoal(GoalBase):
     name = "perf-check"
 
     async def check(self, state: dict, cwd: str) -> GoalResult:
-        cfg = _load_config(cwd)
+        cfg = load_goal_config(cwd)
         command = cfg.get("check_command", "python bench.py")
         max_seconds = float(cfg.get("max_seconds", 1.0))
         required_passes = int(cfg.get("iterations", 1))
@@ -50,15 +39,14 @@ class PerfCheckGoal(GoalBase):
         for _ in range(required_passes):
             start = time.monotonic()
             try:
-                result = subprocess.run(
+                result = await run_capped(
                     command,
-                    shell=True,
-                    cwd=cwd,
-                    capture_output=True,
-                    text=True,
+                    cwd,
                     timeout=max_seconds * 10,
+                    stdout_head=_OUTPUT_CHARS,
+                    stderr_head=_OUTPUT_CHARS,
                 )
-            except subprocess.TimeoutExpired:
+            except TimeoutError:
                 return GoalResult(
                     achieved=False,
                     reason=f"Command timed out (limit: {max_seconds}s × 10)",
@@ -66,7 +54,7 @@ class PerfCheckGoal(GoalBase):
                 )
             elapsed = time.monotonic() - start
             times.append(elapsed)
-            last_stdout = result.stdout + result.stderr
+            last_stdout = (result.stdout_head + result.stderr_head)[:_OUTPUT_CHARS]
 
             if result.returncode != 0:
                 return GoalResult(
@@ -75,7 +63,7 @@ class PerfCheckGoal(GoalBase):
                     details={
                         "command": command,
                         "elapsed": elapsed,
-                        "stdout": last_stdout[:2000],
+                        "stdout": last_stdout,
                     },
                 )
 
@@ -90,7 +78,7 @@ class PerfCheckGoal(GoalBase):
                         "command": command,
                         "elapsed": elapsed,
                         "times": times,
-                        "stdout": last_stdout[:2000],
+                        "stdout": last_stdout,
                     },
                 )
 
@@ -104,7 +92,7 @@ class PerfCheckGoal(GoalBase):
         )
 
     def system_prompt(self, cwd: str = ".") -> str:  # type: ignore[override]
-        cfg = _load_config(cwd)
+        cfg = load_goal_config(cwd)
         custom = cfg.get("system_prompt", "")
         command = cfg.get("check_command", "python bench.py")
         max_sec = cfg.get("max_seconds", 1.0)
@@ -2,10 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import itertools
 import json
-from datetime import UTC, datetime
+import os
+from collections.abc import Iterator
+from operator import attrgetter
 from pathlib import Path
 
+# Directories never listed or searched when building the project context
+_SKIP_DIRS = frozenset({".git", "__pycache__", "node_modules", ".venv", "dist", "build", ".retrai"})
+# Config and docs files whose heads are included in the context
+_KEY_FILES = (
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "package.json",
+    "Cargo.toml",
+    "go.mod",
+    "README.md",
+)
+
 
 async def generate_eval_harness(
     description: str,
@@ -18,11 +36,13 @@ async def generate_eval_harness(
     writes the harness to .retrai/eval_harness.py, saves metadata to
     .retrai/ai_eval_config.json, and returns the harness path.
     """
+    from datetime import UTC, datetime
+
     root = Path(cwd)
     retrai_dir = root / ".retrai"
     retrai_dir.mkdir(parents=True, exist_ok=True)
 
-    context = _build_project_context(root)
+    context = await _build_project_context(root)
     prompt = _build_planner_prompt(description, context)
 
     harness_code = await _call_llm(prompt, model_name)
@@ -41,58 +61,76 @@ async def generate_eval_harness(
     return harness_path
 
 
-def _build_project_context(root: Path) -> str:
-    """Build a compact project context string for the planner prompt."""
+async def _build_project_context(root: Path) -> str:
+    """Build a compact project context string for the planner prompt.
+
+    The key and source files are read concurrently in worker threads.
+    """
     lines: list[str] = []
 
     # File listing (top 2 levels, skip noise)
     lines.append("## Project files")
-    skip = {".git", "__pycache__", "node_modules", ".venv", "dist", "build", ".retrai"}
     for item in sorted(root.iterdir()):
-        if item.name in skip:
+        if item.name in _SKIP_DIRS:
             continue
         if item.is_dir():
             lines.append(f"  {item.name}/")
-            for sub in sorted(item.iterdir())[:20]:
-                if sub.name not in skip and not sub.name.startswith("."):
-                    lines.append(f"    {sub.name}")
+            for sub in heapq.nsmallest(20, item.iterdir(), key=attrgetter("name")):
+                name = sub.name
+                # Hidden names are rejected by the prefix test before any hashing
+                if not name.startswith(".") and name not in _SKIP_DIRS:
+                    lines.append(f"    {name}")
         else:
             lines.append(f"  {item.name}")
 
-    # Read key config files
-    key_files = [
-        "pyproject.toml",
-        "setup.py",
-        "setup.cfg",
-        "package.json",
-        "Cargo.toml",
-        "go.mod",
-        "README.md",
-    ]
-    for fname in key_files:
-        p = root / fname
-        if p.exists():
-            content = p.read_text(errors="replace")[:2000]
+    # Key config files (first 2000 chars) and main source files (Python: up
+    # to 5 .py files, first 150 lines each)
+    py_files = list(itertools.islice(_iter_py_sources(root), 5))
+    contents = await asyncio.gather(
+        *(asyncio.to_thread(_read_head, root / fname, 2000) for fname in _KEY_FILES),
+        *(asyncio.to_thread(_read_lines, pf, 150) for pf in py_files),
+    )
+
+    for fname, content in zip(_KEY_FILES, contents[: len(_KEY_FILES)], strict=True):
+        if content is not None:
             lines.append(f"\n## {fname}\n```\n{content}\n```")
 
-    # Read main source files (Python: up to 5 .py files, first 150 lines each)
-    py_files = sorted(root.rglob("*.py"))
-    py_files = [
-        f
-        for f in py_files
-        if not any(part in skip for part in f.parts)
-        and "test" not in f.name.lower()
-        and "__" not in f.name
-    ]
-    for pf in py_files[:5]:
+    for pf, content in zip(py_files, contents[len(_KEY_FILES) :], strict=True):
         rel = pf.relative_to(root)
-        content_lines = pf.read_text(errors="replace").splitlines()[:150]
-        content = "\n".join(content_lines)
         lines.append(f"\n## {rel}\n```python\n{content}\n```")
 
     return "\n".join(lines)
 
 
+def _read_head(path: Path, chars: int) -> str | None:
+    """Return the first *chars* characters of *path*, or None if it can't be read."""
+    # Characters are at most 4 UTF-8 bytes, so this many bytes always suffices
+    try:
+        with path.open("rb") as f:
+            return f.read(chars * 4).decode("utf-8", errors="replace")[:chars]
+    except OSError:
+        return None
+
+
+def _read_lines(path: Path, count: int) -> str:
+    """Return the first *count* lines of *path* without reading the rest."""
+    with path.open(errors="replace") as f:
+        return "".join(itertools.islice(f, count)).rstrip("\n")
+
+
+def _iter_py_sources(root: Path) -> Iterator[Path]:
+    """Yield non-test Python files under *root* in sorted walk order.
+
+    Skipped and hidden directories are pruned before they are entered, so
+    vendored trees like node_modules or .venv are never traversed.
+    """
+    for dirpath, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if d not in _SKIP_DIRS and not d.startswith("."))
+        for name in sorted(files):
+            if name.endswith(".py") and "test" not in name.lower() and "__" not in name:
+                yield Path(dirpath, name)
+
+
 def _build_planner_prompt(description: str, context: str) -> str:
     return f"""You are an expert software testing agent. Your job is to write a pytest test file
 that verifies the following requirement:
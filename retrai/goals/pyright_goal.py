@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import json
-import subprocess
-
+from retrai.goals._subprocess import decode_head, run_raw
 from retrai.goals.base import GoalBase, GoalResult
+from retrai.utils import jsonx
 
 
 class PyrightGoal(GoalBase):
@@ -15,14 +14,8 @@ class PyrightGoal(GoalBase):
         """Run pyright --outputjson and check for errors."""
         cmd = ["pyright", "--outputjson"]
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-        except subprocess.TimeoutExpired:
+            result = await run_raw(cmd, cwd, timeout=120)
+        except TimeoutError:
             return GoalResult(
                 achieved=False,
                 reason="pyright timed out after 120s",
@@ -35,14 +28,18 @@ class PyrightGoal(GoalBase):
                 details={"error": "pyright_not_found"},
             )
 
+        # The report bytes go straight to the parser, never decoded to a str
         try:
-            report = json.loads(result.stdout)
-        except json.JSONDecodeError:
+            report = jsonx.loads(result.stdout)
+        except jsonx.JSONDecodeError:
             # Pyright may fail to produce JSON for fatal errors
             return GoalResult(
                 achieved=False,
                 reason="pyright failed to produce output",
-                details={"stdout": result.stdout[:2000], "stderr": result.stderr[:500]},
+                details={
+                    "stdout": decode_head(result.stdout, 2000),
+                    "stderr": decode_head(result.stderr, 500),
+                },
             )
 
         summary = report.get("summary", {})
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
-import subprocess
 from pathlib import Path
 
+from retrai.goals._subprocess import run
 from retrai.goals.base import GoalBase, GoalResult
+from retrai.utils import jsonx
 
 
 class PytestGoal(GoalBase):
@@ -26,14 +26,8 @@ class PytestGoal(GoalBase):
             "--no-header",
         ]
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-        except subprocess.TimeoutExpired:
+            result = await run(cmd, cwd, timeout=120)
+        except TimeoutError:
             return GoalResult(
                 achieved=False,
                 reason="pytest timed out after 120s",
@@ -48,8 +42,8 @@ class PytestGoal(GoalBase):
 
         if report_path.exists():
             try:
-                report = json.loads(report_path.read_text())
-            except json.JSONDecodeError:
+                report = jsonx.loads(report_path.read_bytes())
+            except jsonx.JSONDecodeError:
                 report = {}
         else:
             report = {}
@@ -65,7 +59,7 @@ class PytestGoal(GoalBase):
             return GoalResult(
                 achieved=True,
                 reason=f"All {total} tests passed",
-                details={"summary": summary, "report": report},
+                details={"summary": summary},
             )
         elif exit_code == 5:
             return GoalResult(
@@ -83,7 +77,6 @@ class PytestGoal(GoalBase):
                     "failures": failures,
                     "stdout": result.stdout,
                     "stderr": result.stderr,
-                    "report": report,
                 },
             )
 
@@ -105,10 +98,15 @@ class PytestGoal(GoalBase):
         )
 
 
-def _extract_failures(report: dict) -> list[dict]:
-    """Extract structured failure information from a pytest-json-report."""
-    failures = []
+def _extract_failures(report: dict, limit: int = 50) -> list[dict]:
+    """Extract structured failure information from a pytest-json-report.
+
+    At most *limit* failures are returned; they end up in every goal_check event.
+    """
+    failures: list[dict] = []
     for test in report.get("tests", []):
+        if len(failures) >= limit:
+            break
         if test.get("outcome") in ("failed", "error"):
             failure = {
                 "nodeid": test.get("nodeid", ""),
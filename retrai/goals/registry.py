@@ -2,41 +2,46 @@
 
 from __future__ import annotations
 
-from retrai.goals.ai_eval import AiEvalGoal
+import importlib
+from types import MappingProxyType
+
 from retrai.goals.base import GoalBase
-from retrai.goals.bun_goal import BunTestGoal
-from retrai.goals.cargo_goal import CargoTestGoal
-from retrai.goals.go_goal import GoTestGoal
-from retrai.goals.make_goal import MakeTestGoal
-from retrai.goals.npm_goal import NpmTestGoal
-from retrai.goals.perf_goal import PerfCheckGoal
-from retrai.goals.pyright_goal import PyrightGoal
-from retrai.goals.pytest_goal import PytestGoal
-from retrai.goals.shell_goal import ShellGoal
-from retrai.goals.sql_goal import SqlBenchmarkGoal
-
-_REGISTRY: dict[str, GoalBase] = {
-    "pytest": PytestGoal(),
-    "pyright": PyrightGoal(),
-    "bun-test": BunTestGoal(),
-    "npm-test": NpmTestGoal(),
-    "cargo-test": CargoTestGoal(),
-    "go-test": GoTestGoal(),
-    "make-test": MakeTestGoal(),
-    "shell-goal": ShellGoal(),
-    "perf-check": PerfCheckGoal(),
-    "sql-benchmark": SqlBenchmarkGoal(),
-    "ai-eval": AiEvalGoal(),
-}
+
+# Goal name -> (module, class). Modules are imported on first get_goal(), so
+# listing goals or running one doesn't import the others' dependencies.
+# Read-only so no caller can swap a goal out from under running agents.
+_REGISTRY: MappingProxyType[str, tuple[str, str]] = MappingProxyType(
+    {
+        "pytest": ("retrai.goals.pytest_goal", "PytestGoal"),
+        "pyright": ("retrai.goals.pyright_goal", "PyrightGoal"),
+        "bun-test": ("retrai.goals.bun_goal", "BunTestGoal"),
+        "npm-test": ("retrai.goals.npm_goal", "NpmTestGoal"),
+        "cargo-test": ("retrai.goals.cargo_goal", "CargoTestGoal"),
+        "go-test": ("retrai.goals.go_goal", "GoTestGoal"),
+        "make-test": ("retrai.goals.make_goal", "MakeTestGoal"),
+        "shell-goal": ("retrai.goals.shell_goal", "ShellGoal"),
+        "perf-check": ("retrai.goals.perf_goal", "PerfCheckGoal"),
+        "sql-benchmark": ("retrai.goals.sql_goal", "SqlBenchmarkGoal"),
+        "ai-eval": ("retrai.goals.ai_eval", "AiEvalGoal"),
+    }
+)
+# Names listed in the KeyError for unknown goals, joined once
+_AVAILABLE = ", ".join(_REGISTRY)
+# One shared instance per goal, created on first lookup
+_instances: dict[str, GoalBase] = {}
 
 
 def get_goal(name: str) -> GoalBase:
     """Return a goal by name, raising KeyError if not found."""
-    if name not in _REGISTRY:
-        available = ", ".join(_REGISTRY.keys())
-        raise KeyError(f"Unknown goal: '{name}'. Available: {available}")
-    return _REGISTRY[name]
+    goal = _instances.get(name)
+    if goal is None:
+        try:
+            module, cls = _REGISTRY[name]
+        except KeyError:
+            raise KeyError(f"Unknown goal: '{name}'. Available: {_AVAILABLE}") from None
+        goal = _instances[name] = getattr(importlib.import_module(module), cls)()
+    return goal
 
 
 def list_goals() -> list[str]:
-    return list(_REGISTRY.keys())
+    return list(_REGISTRY)
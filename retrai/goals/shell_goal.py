@@ -3,25 +3,21 @@
 from __future__ import annotations
 
 import re
-import subprocess
 import time
-from pathlib import Path
-
-import yaml
+from functools import lru_cache
 
+from retrai.config import load_goal_config
+from retrai.goals._subprocess import run, run_capped
 from retrai.goals.base import GoalBase, GoalResult
 
-_CONFIG_FILE = ".retrai.yml"
+# Only this much command output is ever reported back
+_OUTPUT_CHARS = 3000
 
 
-def _load_config(cwd: str) -> dict:
-    path = Path(cwd) / _CONFIG_FILE
-    if not path.exists():
-        return {}
-    try:
-        return yaml.safe_load(path.read_text()) or {}
-    except Exception:
-        return {}
+@lru_cache(maxsize=32)
+def _output_pattern(output_regex: str) -> re.Pattern[str]:
+    """Compile a success_condition.output_regex once per distinct pattern."""
+    return re.compile(output_regex, re.MULTILINE)
 
 
 class ShellGoal(GoalBase):
@@ -45,7 +41,7 @@ class ShellGoal(GoalBase):
     name = "shell-goal"
 
     async def check(self, state: dict, cwd: str) -> GoalResult:
-        cfg = _load_config(cwd)
+        cfg = load_goal_config(cwd)
         command = cfg.get("check_command", "make check")
         cond = cfg.get("success_condition", {})
 
@@ -54,49 +50,59 @@ class ShellGoal(GoalBase):
         output_regex = cond.get("output_regex")
         max_seconds = cond.get("max_seconds")
 
+        timeout = max(120.0, (max_seconds or 120) * 2)
         start = time.monotonic()
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=max(120.0, (max_seconds or 120) * 2),
-            )
-        except subprocess.TimeoutExpired:
+            # Output conditions need all of it; otherwise only the reported
+            # head is kept, however much the command prints
+            if output_contains or output_regex:
+                full = await run(command, cwd, timeout=timeout)
+                returncode, streams = full.returncode, (full.stdout, full.stderr)
+            else:
+                capped = await run_capped(
+                    command,
+                    cwd,
+                    timeout=timeout,
+                    stdout_head=_OUTPUT_CHARS,
+                    stderr_head=_OUTPUT_CHARS,
+                )
+                returncode, streams = capped.returncode, (capped.stdout_head, capped.stderr_head)
+        except TimeoutError:
             return GoalResult(
                 achieved=False,
                 reason="Command timed out",
                 details={"command": command},
             )
         elapsed = time.monotonic() - start
-        stdout = result.stdout + result.stderr
 
         # Evaluate conditions
         failures = []
 
-        if result.returncode != expected_exit:
-            failures.append(f"exit_code={result.returncode} (expected {expected_exit})")
+        if returncode != expected_exit:
+            failures.append(f"exit_code={returncode} (expected {expected_exit})")
 
-        if output_contains and output_contains not in stdout:
+        # stdout and stderr are searched in turn rather than concatenated
+        if output_contains and not any(output_contains in out for out in streams):
             failures.append(f"stdout does not contain {output_contains!r}")
 
-        if output_regex and not re.search(output_regex, stdout, re.MULTILINE):
+        pattern = _output_pattern(output_regex) if output_regex else None
+        if pattern and not any(pattern.search(out) for out in streams):
             failures.append(f"stdout does not match regex {output_regex!r}")
 
         if max_seconds and elapsed > max_seconds:
             failures.append(f"took {elapsed:.2f}s (limit: {max_seconds}s)")
 
         if failures:
+            stdout, stderr = streams
+            head = (stdout[:_OUTPUT_CHARS] + stderr[:_OUTPUT_CHARS])[:_OUTPUT_CHARS]
             return GoalResult(
                 achieved=False,
                 reason="; ".join(failures),
                 details={
                     "command": command,
                     "elapsed": elapsed,
-                    "exit_code": result.returncode,
-                    "stdout": stdout[:3000],
+                    "exit_code": returncode,
+                    "stdout": head,
                 },
             )
 
@@ -107,7 +113,7 @@ class ShellGoal(GoalBase):
         )
 
     def system_prompt(self, cwd: str = ".") -> str:  # type: ignore[override]
-        cfg = _load_config(cwd)
+        cfg = load_goal_config(cwd)
         custom = cfg.get("system_prompt", "")
         command = cfg.get("check_command", "make check")
         cond = cfg.get("success_condition", {})
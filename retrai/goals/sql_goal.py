@@ -2,24 +2,64 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
 
-import yaml
-
+from retrai.config import load_goal_config
 from retrai.goals.base import GoalBase, GoalResult
 
-_CONFIG_FILE = ".retrai.yml"
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlalchemy.sql.elements import TextClause
+
+# DSN schemes whose driver is natively async; these skip the worker thread
+_ASYNC_SCHEMES = frozenset({"postgresql+asyncpg", "mysql+aiomysql", "sqlite+aiosqlite"})
+
+# Async engines per event loop: their pooled connections can't cross loops
+_async_engines: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, AsyncEngine]] = (
+    WeakKeyDictionary()
+)
+
+
+@lru_cache(maxsize=16)
+def _engine_for(dsn: str) -> Engine:
+    """Return the engine for *dsn*, so its connection pool is reused across checks."""
+    from sqlalchemy import create_engine
+
+    return create_engine(dsn, pool_pre_ping=True)
+
+
+def _async_engine_for(dsn: str) -> AsyncEngine:
+    """Return the running loop's async engine for *dsn*, creating it on first use."""
+    engines = _async_engines.setdefault(asyncio.get_running_loop(), {})
+    engine = engines.get(dsn)
+    if engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        engine = engines[dsn] = create_async_engine(dsn, pool_pre_ping=True)
+    return engine
+
+
+def _run_query(dsn: str, stmt: TextClause) -> tuple[list[Any], int]:
+    """Execute *stmt* on a pooled connection; return the rows and elapsed ns."""
+    with _engine_for(dsn).connect() as conn:
+        start = time.perf_counter_ns()
+        rows = list(conn.execute(stmt).fetchall())
+        return rows, time.perf_counter_ns() - start
 
 
-def _load_config(cwd: str) -> dict:
-    path = Path(cwd) / _CONFIG_FILE
-    if not path.exists():
-        return {}
-    try:
-        return yaml.safe_load(path.read_text()) or {}
-    except Exception:
-        return {}
+async def _run_query_async(dsn: str, stmt: TextClause) -> tuple[list[Any], int]:
+    """Like :func:`_run_query`, but on an async driver without a worker thread."""
+    async with _async_engine_for(dsn).connect() as conn:
+        start = time.perf_counter_ns()
+        result = await conn.execute(stmt)
+        rows = list(result.fetchall())
+        return rows, time.perf_counter_ns() - start
 
 
 class SqlBenchmarkGoal(GoalBase):
@@ -29,7 +69,8 @@ class SqlBenchmarkGoal(GoalBase):
 
     ```yaml
     goal: sql-benchmark
-    dsn: "sqlite:///mydb.sqlite"   # SQLAlchemy DSN
+    dsn: "sqlite:///mydb.sqlite"   # SQLAlchemy DSN (async drivers like
+                                   # sqlite+aiosqlite run without a thread)
     query_file: "query.sql"        # path to the SQL file (relative to cwd)
     # or inline:
     query: "SELECT * FROM orders WHERE ..."
@@ -42,7 +83,7 @@ class SqlBenchmarkGoal(GoalBase):
 
     async def check(self, state: dict, cwd: str) -> GoalResult:
         try:
-            from sqlalchemy import create_engine, text
+            from sqlalchemy import text
         except ImportError:
             return GoalResult(
                 achieved=False,
@@ -50,7 +91,7 @@ class SqlBenchmarkGoal(GoalBase):
                 details={"error": "missing_dependency"},
             )
 
-        cfg = _load_config(cwd)
+        cfg = load_goal_config(cwd)
         dsn = cfg.get("dsn")
         if not dsn:
             return GoalResult(
@@ -76,19 +117,12 @@ class SqlBenchmarkGoal(GoalBase):
         max_ms = float(cfg.get("max_ms", 100))
         expected_rows = cfg.get("expected_rows")
 
+        stmt = text(query)
         try:
-            import asyncio
-
-            def _run_query():
-                engine = create_engine(dsn)
-                with engine.connect() as conn:
-                    start = time.perf_counter()
-                    result = conn.execute(text(query))
-                    rows = result.fetchall()
-                    elapsed_ms = (time.perf_counter() - start) * 1000
-                return rows, elapsed_ms
-
-            rows, elapsed_ms = await asyncio.get_event_loop().run_in_executor(None, _run_query)
+            if dsn.partition("://")[0] in _ASYNC_SCHEMES:
+                rows, elapsed_ns = await _run_query_async(dsn, stmt)
+            else:
+                rows, elapsed_ns = await asyncio.to_thread(_run_query, dsn, stmt)
         except Exception as e:
             return GoalResult(
                 achieved=False,
@@ -96,6 +130,8 @@ class SqlBenchmarkGoal(GoalBase):
                 details={"error": str(e)},
             )
 
+        # Integer nanoseconds until here; one division keeps sub-ms timings exact
+        elapsed_ms = elapsed_ns / 1_000_000
         failures = []
         if elapsed_ms > max_ms:
             failures.append(f"query took {elapsed_ms:.1f}ms (limit: {max_ms}ms)")
@@ -116,7 +152,7 @@ class SqlBenchmarkGoal(GoalBase):
         )
 
     def system_prompt(self, cwd: str = ".") -> str:  # type: ignore[override]
-        cfg = _load_config(cwd)
+        cfg = load_goal_config(cwd)
         custom = cfg.get("system_prompt", "")
         max_ms = cfg.get("max_ms", 100)
         qfile = cfg.get("query_file", "the SQL query")
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
 
-from langchain_core.language_models import BaseChatModel
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+
+# ChatLiteLLM class, imported from langchain_community on first use only
+_chat_litellm: Any = None
+
+# (model_name, rounded temperature) -> model, LRU-bounded
+_MAX_CACHED_LLMS = 32
+_llm_cache: OrderedDict[tuple[str, float], BaseChatModel] = OrderedDict()
 
 
-@lru_cache(maxsize=32)
 def get_llm(model_name: str = "claude-sonnet-4-6", temperature: float = 0.0) -> BaseChatModel:
     """Return a cached LangChain chat model via LiteLLM.
 
@@ -16,7 +24,21 @@ def get_llm(model_name: str = "claude-sonnet-4-6", temperature: float = 0.0) ->
       - "gpt-4o" / "gpt-4o-mini"
       - "gemini/gemini-2.0-flash"
       - etc.
+
+    Temperatures equal to 4 decimal places share one instance.
     """
-    from langchain_community.chat_models import ChatLiteLLM
+    global _chat_litellm
+    key = (model_name, round(temperature, 4))
+    llm = _llm_cache.get(key)
+    if llm is not None:
+        _llm_cache.move_to_end(key)
+        return llm
+
+    if _chat_litellm is None:
+        from langchain_community.chat_models import ChatLiteLLM
 
-    return ChatLiteLLM(model=model_name, temperature=temperature)
+        _chat_litellm = ChatLiteLLM
+    llm = _llm_cache[key] = _chat_litellm(model=model_name, temperature=temperature)
+    while len(_llm_cache) > _MAX_CACHED_LLMS:
+        _llm_cache.popitem(last=False)
+    return llm
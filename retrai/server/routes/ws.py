@@ -1,4 +1,4 @@
-"""WebSocket route: streams AgentEvents as JSON to clients."""
+"""WebSocket route: streams AgentEvents to clients as JSON arrays."""
 
 from __future__ import annotations
 
@@ -8,6 +8,9 @@ from retrai.server.run_manager import run_manager
 
 router = APIRouter(tags=["websocket"])
 
+# Upper bound on events coalesced into one frame
+MAX_BATCH = 32
+
 
 @router.websocket("/api/ws/{run_id}")
 async def websocket_endpoint(websocket: WebSocket, run_id: str):
@@ -23,10 +26,29 @@ async def websocket_endpoint(websocket: WebSocket, run_id: str):
     q = await bus.subscribe()
 
     try:
-        async for event in bus.iter_events(q):
-            await websocket.send_json(event.to_dict())
-            if event.kind == "run_end":
-                break
+        done = False
+        while not done:
+            # Block for one event, then drain whatever else is already queued
+            # so a burst goes out as one frame instead of one send per event
+            batch: list[str] = []
+            item = await q.get()
+            while True:
+                if item is None:  # bus.close() sentinel
+                    done = True
+                    break
+                # to_json() caches, so other sockets reuse this encoding
+                try:
+                    batch.append(item.to_json())
+                except (TypeError, ValueError):
+                    pass  # unserializable payload: skip the event, keep the socket
+                if item.kind == "run_end":
+                    done = True
+                    break
+                if len(batch) >= MAX_BATCH or q.empty():
+                    break
+                item = q.get_nowait()
+            if batch:
+                await websocket.send_text("[" + ",".join(batch) + "]")
     except WebSocketDisconnect:
         pass
     finally:
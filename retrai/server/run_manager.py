@@ -48,6 +48,7 @@ class RunManager:
     async def start_run(self, run_id: str) -> None:
         """Launch the agent graph as a background asyncio task."""
         from retrai.agent.graph import build_graph
+        from retrai.agent.state import initial_state
         from retrai.goals.registry import get_goal
 
         entry = self.get_or_raise(run_id)
@@ -57,19 +58,7 @@ class RunManager:
         entry.graph = graph
         entry.status = "running"
 
-        initial_state = {
-            "messages": [],
-            "pending_tool_calls": [],
-            "tool_results": [],
-            "goal_achieved": False,
-            "goal_reason": "",
-            "iteration": 0,
-            "max_iterations": cfg.max_iterations,
-            "hitl_enabled": cfg.hitl_enabled,
-            "model_name": cfg.model_name,
-            "cwd": cfg.cwd,
-            "run_id": cfg.run_id,
-        }
+        state = initial_state(cfg)
 
         run_config = {
             "configurable": {
@@ -83,7 +72,7 @@ class RunManager:
             from retrai.events.types import AgentEvent
 
             try:
-                final = await graph.ainvoke(initial_state, config=run_config)  # type: ignore[arg-type]
+                final = await graph.ainvoke(state, config=run_config)  # type: ignore[arg-type]
                 entry.final_state = final
                 entry.status = "achieved" if final.get("goal_achieved") else "failed"
                 await entry.bus.publish(
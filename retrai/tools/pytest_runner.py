@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import subprocess
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 
+from retrai.utils import jsonx
+
 
 @dataclass
 class PytestRunResult:
@@ -21,8 +23,18 @@ class PytestRunResult:
     timed_out: bool = False
 
 
-def run_pytest(cwd: str, timeout: float = 120.0) -> PytestRunResult:
-    """Run pytest --json-report synchronously, return structured result."""
+def run_pytest(
+    cwd: str,
+    timeout: float = 120.0,
+    stdout_cap: int | None = None,
+    max_failures: int | None = None,
+) -> PytestRunResult:
+    """Run pytest --json-report synchronously, return structured result.
+
+    With *stdout_cap*, output is spooled to temporary files and only the first
+    *stdout_cap* characters of stdout/stderr are kept in memory. *max_failures*
+    stops collecting failures after that many.
+    """
     report_path = Path(cwd) / ".pytest_report.json"
     cmd = [
         "python",
@@ -36,13 +48,20 @@ def run_pytest(cwd: str, timeout: float = 120.0) -> PytestRunResult:
     ]
 
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
+        if stdout_cap is None:
+            result = subprocess.run(
+                cmd,
+                cwd=cwd,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+            stdout, stderr = result.stdout, result.stderr
+        else:
+            with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+                result = subprocess.run(cmd, cwd=cwd, stdout=out, stderr=err, timeout=timeout)
+                stdout = _read_head(out, stdout_cap)
+                stderr = _read_head(err, stdout_cap)
     except subprocess.TimeoutExpired:
         return PytestRunResult(
             exit_code=-1,
@@ -70,12 +89,12 @@ def run_pytest(cwd: str, timeout: float = 120.0) -> PytestRunResult:
     report: dict = {}
     if report_path.exists():
         try:
-            report = json.loads(report_path.read_text())
-        except json.JSONDecodeError:
+            report = jsonx.loads(report_path.read_bytes())
+        except jsonx.JSONDecodeError:
             pass
 
     summary = report.get("summary", {})
-    failures = _extract_failures(report)
+    failures = _extract_failures(report, max_failures)
 
     return PytestRunResult(
         exit_code=result.returncode,
@@ -84,14 +103,23 @@ def run_pytest(cwd: str, timeout: float = 120.0) -> PytestRunResult:
         error=summary.get("error", 0),
         total=summary.get("total", 0),
         failures=failures,
-        stdout=result.stdout,
-        stderr=result.stderr,
+        stdout=stdout,
+        stderr=stderr,
     )
 
 
-def _extract_failures(report: dict) -> list[dict]:
-    failures = []
+def _read_head(f, cap: int) -> str:
+    """Decode at most the first *cap* characters of a spooled output file."""
+    f.seek(0)
+    # UTF-8 needs at most 4 bytes per character
+    return f.read(cap * 4).decode(errors="replace")[:cap]
+
+
+def _extract_failures(report: dict, limit: int | None = None) -> list[dict]:
+    failures: list[dict] = []
     for test in report.get("tests", []):
+        if limit is not None and len(failures) >= limit:
+            break
         if test.get("outcome") in ("failed", "error"):
             failure = {
                 "nodeid": test.get("nodeid", ""),
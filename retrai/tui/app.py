@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from rich.text import Text
 from textual.app import App, ComposeResult
@@ -12,6 +12,8 @@ from textual.reactive import reactive
 from textual.widgets import Footer, Header, Label, RichLog, Static
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from retrai.config import RunConfig
 
 
@@ -225,6 +227,7 @@ class RetrAITUI(App):
 
     async def _run_agent(self) -> None:
         from retrai.agent.graph import build_graph
+        from retrai.agent.state import initial_state
         from retrai.events.bus import AsyncEventBus
         from retrai.goals.registry import get_goal
 
@@ -234,19 +237,7 @@ class RetrAITUI(App):
         bus = AsyncEventBus()
         graph = build_graph(hitl_enabled=self.cfg.hitl_enabled)
 
-        initial_state = {
-            "messages": [],
-            "pending_tool_calls": [],
-            "tool_results": [],
-            "goal_achieved": False,
-            "goal_reason": "",
-            "iteration": 0,
-            "max_iterations": self.cfg.max_iterations,
-            "hitl_enabled": self.cfg.hitl_enabled,
-            "model_name": self.cfg.model_name,
-            "cwd": self.cfg.cwd,
-            "run_id": self.cfg.run_id,
-        }
+        state = initial_state(self.cfg)
         run_config = {
             "configurable": {
                 "thread_id": self.cfg.run_id,
@@ -259,22 +250,27 @@ class RetrAITUI(App):
             self._status_panel.status = "RUNNING"
 
         q = await bus.subscribe()
-        graph_task = asyncio.create_task(graph.ainvoke(initial_state, config=run_config))  # type: ignore[arg-type]
 
         async def consume() -> None:
-            async for event in bus.iter_events(q):
+            # Read the queue directly; bus.close() enqueues the None sentinel
+            while (event := await q.get()) is not None:
                 self._handle_event(event)
 
-        consumer_task = asyncio.create_task(consume())
-
-        try:
-            final_state = await graph_task
-        except Exception as e:
-            self._write(f"[bold red]✗ ERROR: {e}[/bold red]")
-            final_state = None
-        finally:
-            await bus.close()
-            await consumer_task
+        final_state = None
+        failure: Exception | None = None
+        # Run graph and consumer in one cancellation scope; the group exits
+        # only once the consumer has drained everything up to the sentinel
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(consume())
+            try:
+                final_state = await graph.ainvoke(state, config=run_config)  # type: ignore[arg-type]
+            except Exception as e:
+                failure = e
+            finally:
+                await bus.close()
+
+        if failure is not None:
+            self._write(f"[bold red]✗ ERROR: {failure}[/bold red]")
 
         if final_state:
             achieved = final_state.get("goal_achieved", False)
@@ -288,61 +284,70 @@ class RetrAITUI(App):
             )
 
     def _handle_event(self, event) -> None:
-        kind = event.kind
-        payload = event.payload
-        iteration = event.iteration
-
-        if kind == "step_start":
-            node = payload.get("node", "?")
-            header = (
-                f"\n[bold #7c3aed]┌─[/bold #7c3aed]"
-                f" [bold #a78bfa]iter {iteration}[/bold #a78bfa]"
-                f" [dim #64748b]▸[/dim #64748b]"
-                f" [bold #e2e8f0]{node.upper()}[/bold #e2e8f0]"
-            )
-            self._write(header)
-            if self._status_panel:
-                self._status_panel.iteration = iteration
-
-        elif kind == "tool_call":
-            tool = payload.get("tool", "?")
-            args = payload.get("args", {})
-            arg_str = str(args)[:70]
-            self._write(f"  [#38bdf8]⟶ {tool}[/#38bdf8] [dim]{arg_str}[/dim]")
-
-        elif kind == "tool_result":
-            tool = payload.get("tool", "?")
-            err = payload.get("error", False)
-            content = str(payload.get("content", ""))[:150]
-            if err:
-                self._write(f"  [#f87171]✗ {tool}[/#f87171] [dim]{content!r}[/dim]")
-            else:
-                self._write(f"  [#4ade80]✓ {tool}[/#4ade80] [dim]{content!r}[/dim]")
-
-        elif kind == "goal_check":
-            achieved = payload.get("achieved", False)
-            reason = payload.get("reason", "")
-            if achieved:
-                self._write(f"  [bold #4ade80]◉ GOAL: {reason}[/bold #4ade80]")
-            else:
-                self._write(f"  [#fbbf24]◌ {reason}[/#fbbf24]")
-
-        elif kind == "human_check_required":
-            self._write("[bold #fb923c]⏸  Human approval required[/bold #fb923c]")
-
-        elif kind == "iteration_complete":
-            n = payload.get("iteration", 0)
-            self._write(f"[dim #2e1065]└─────────────────────────── iteration {n} ──[/dim #2e1065]")
-            if self._status_panel:
-                self._status_panel.iteration = n
-
-        elif kind == "run_end":
-            status = payload.get("status", "?")
-            self._write(f"\n[bold]Run ended: {status}[/bold]")
-
-        elif kind == "error":
-            err = payload.get("error", "?")
-            self._write(f"[bold #f87171]ERROR: {err}[/bold #f87171]")
+        handler = self._EVENT_HANDLERS.get(event.kind)
+        if handler is not None:
+            handler(self, event.payload, event.iteration)
+
+    def _ev_step_start(self, payload: dict, iteration: int) -> None:
+        node = payload.get("node", "?")
+        header = (
+            f"\n[bold #7c3aed]┌─[/bold #7c3aed]"
+            f" [bold #a78bfa]iter {iteration}[/bold #a78bfa]"
+            f" [dim #64748b]▸[/dim #64748b]"
+            f" [bold #e2e8f0]{node.upper()}[/bold #e2e8f0]"
+        )
+        self._write(header)
+        if self._status_panel:
+            self._status_panel.iteration = iteration
+
+    def _ev_tool_call(self, payload: dict, iteration: int) -> None:
+        tool = payload.get("tool", "?")
+        arg_str = str(payload.get("args", {}))[:70]
+        self._write(f"  [#38bdf8]⟶ {tool}[/#38bdf8] [dim]{arg_str}[/dim]")
+
+    def _ev_tool_result(self, payload: dict, iteration: int) -> None:
+        tool = payload.get("tool", "?")
+        content = str(payload.get("content", ""))[:150]
+        if payload.get("error", False):
+            self._write(f"  [#f87171]✗ {tool}[/#f87171] [dim]{content!r}[/dim]")
+        else:
+            self._write(f"  [#4ade80]✓ {tool}[/#4ade80] [dim]{content!r}[/dim]")
+
+    def _ev_goal_check(self, payload: dict, iteration: int) -> None:
+        reason = payload.get("reason", "")
+        if payload.get("achieved", False):
+            self._write(f"  [bold #4ade80]◉ GOAL: {reason}[/bold #4ade80]")
+        else:
+            self._write(f"  [#fbbf24]◌ {reason}[/#fbbf24]")
+
+    def _ev_human_check(self, payload: dict, iteration: int) -> None:
+        self._write("[bold #fb923c]⏸  Human approval required[/bold #fb923c]")
+
+    def _ev_iteration_complete(self, payload: dict, iteration: int) -> None:
+        n = payload.get("iteration", 0)
+        self._write(f"[dim #2e1065]└─────────────────────────── iteration {n} ──[/dim #2e1065]")
+        if self._status_panel:
+            self._status_panel.iteration = n
+
+    def _ev_run_end(self, payload: dict, iteration: int) -> None:
+        status = payload.get("status", "?")
+        self._write(f"\n[bold]Run ended: {status}[/bold]")
+
+    def _ev_error(self, payload: dict, iteration: int) -> None:
+        err = payload.get("error", "?")
+        self._write(f"[bold #f87171]ERROR: {err}[/bold #f87171]")
+
+    # Event kind -> handler, so dispatch is one dict lookup per event
+    _EVENT_HANDLERS: ClassVar[dict[str, Callable[[RetrAITUI, dict, int], None]]] = {
+        "step_start": _ev_step_start,
+        "tool_call": _ev_tool_call,
+        "tool_result": _ev_tool_result,
+        "goal_check": _ev_goal_check,
+        "human_check_required": _ev_human_check,
+        "iteration_complete": _ev_iteration_complete,
+        "run_end": _ev_run_end,
+        "error": _ev_error,
+    }
 
     def _write(self, text: str) -> None:
         if self._rich_log:
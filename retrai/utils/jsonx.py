@@ -0,0 +1,49 @@
+"""JSON helpers that use orjson when it is installed, falling back to json."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    # Objects exposing to_dict() (e.g. AgentEvent) serialize without a copy
+    # under orjson, which encodes dataclasses natively; json needs this hook.
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from text or UTF-8 bytes.
+
+    NaN/Infinity literals (e.g. from pytest-json-report durations) are not
+    strict JSON and orjson rejects them; such documents are re-parsed with json.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize *obj* to a JSON string, optionally indented by two spaces."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, default=_default, option=option).decode()
+        except TypeError:
+            # Values orjson rejects (e.g. ints beyond 64 bits) still work with json
+            pass
+    return json.dumps(obj, indent=2 if indent else None, default=_default)
@@ -167,3 +167,40 @@ async def test_graph_emits_events(passing_project: Path, mock_llm: MagicMock):
     kinds = {e.kind for e in events_seen}
     assert "step_start" in kinds
     assert "goal_check" in kinds
+
+
+@pytest.mark.asyncio
+async def test_graph_fans_out_read_only_tool_calls(passing_project: Path):
+    """Several read-only calls run as parallel act_one branches and all land in state."""
+    reads = AIMessage(content="Reading files.")
+    reads.tool_calls = [  # type: ignore[attr-defined]
+        {"id": "r1", "name": "file_list", "args": {"path": "."}},
+        {"id": "r2", "name": "file_read", "args": {"path": "src/calc.py"}},
+    ]
+    llm = MagicMock()
+    llm.bind_tools = MagicMock(return_value=llm)
+    llm.ainvoke = AsyncMock(side_effect=[reads, _make_ai_message_no_tools()])
+
+    graph = build_graph(hitl_enabled=False)
+    initial_state: AgentState = {
+        "messages": [],
+        "pending_tool_calls": [],
+        "tool_results": [],
+        "goal_achieved": False,
+        "goal_reason": "",
+        "iteration": 0,
+        "max_iterations": 1,
+        "hitl_enabled": False,
+        "model_name": "claude-sonnet-4-6",
+        "cwd": str(passing_project),
+        "run_id": "smoke-test-fan-out",
+        "total_tokens": 0,
+    }
+    run_config = {"configurable": {"thread_id": "smoke-test-fan-out", "goal": PytestGoal()}}
+
+    with patch("retrai.agent.nodes.plan.get_llm", return_value=llm):
+        final = await graph.ainvoke(initial_state, config=run_config)  # type: ignore[arg-type]
+
+    assert sorted(r["tool_call_id"] for r in final["tool_results"]) == ["r1", "r2"]
+    tool_ids = [m.tool_call_id for m in final["messages"] if m.type == "tool"]
+    assert sorted(tool_ids) == ["r1", "r2"]
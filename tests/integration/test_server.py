@@ -150,3 +150,51 @@ def test_resume_run_without_graph(client: TestClient, tmp_path: Path):
     # Entry has no graph yet, so resume should 400
     r = client.post(f"/api/runs/{run_id}/resume", json={"decision": "approve"})
     assert r.status_code == 400
+
+
+# ── WebSocket ──────────────────────────────────────────────────────────────────
+
+
+def test_ws_coalesces_queued_events_into_one_frame(client: TestClient, tmp_path: Path):
+    import asyncio
+
+    import retrai.server.routes.ws as ws_module
+    from retrai.config import RunConfig
+    from retrai.events.types import AgentEvent
+
+    entry = ws_module.run_manager.create(RunConfig(goal="pytest", cwd=str(tmp_path)))
+    # Pre-fill the subscriber queue so the whole burst is ready on first read
+    q: asyncio.Queue = asyncio.Queue()
+    for i in range(3):
+        q.put_nowait(AgentEvent(kind="log", run_id=entry.run_id, iteration=i, payload={}))
+    q.put_nowait(AgentEvent(kind="run_end", run_id=entry.run_id, iteration=3, payload={}))
+    entry.bus.subscribe = AsyncMock(return_value=q)  # type: ignore[method-assign]
+
+    with client.websocket_connect(f"/api/ws/{entry.run_id}") as ws:
+        frame = ws.receive_json()
+
+    assert [e["iteration"] for e in frame] == [0, 1, 2, 3]
+    assert frame[-1]["kind"] == "run_end"
+
+
+def test_ws_skips_events_that_cannot_be_encoded(client: TestClient, tmp_path: Path):
+    import asyncio
+    from decimal import Decimal
+
+    import retrai.server.routes.ws as ws_module
+    from retrai.config import RunConfig
+    from retrai.events.types import AgentEvent
+
+    entry = ws_module.run_manager.create(RunConfig(goal="pytest", cwd=str(tmp_path)))
+    q: asyncio.Queue = asyncio.Queue()
+    q.put_nowait(AgentEvent(kind="log", run_id=entry.run_id, iteration=0, payload={}))
+    q.put_nowait(
+        AgentEvent(kind="goal_check", run_id=entry.run_id, iteration=1, payload={"d": Decimal(1)})
+    )
+    q.put_nowait(AgentEvent(kind="run_end", run_id=entry.run_id, iteration=2, payload={}))
+    entry.bus.subscribe = AsyncMock(return_value=q)  # type: ignore[method-assign]
+
+    with client.websocket_connect(f"/api/ws/{entry.run_id}") as ws:
+        frame = ws.receive_json()
+
+    assert [e["iteration"] for e in frame] == [0, 2]
@@ -0,0 +1,157 @@
+"""Tests for the act node's tool dispatch."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from retrai.agent.nodes import act
+from retrai.agent.nodes.act import act_node
+from retrai.agent.state import AgentState
+
+
+def _state(cwd: Path, tool_calls: list[dict]) -> AgentState:
+    return {
+        "messages": [],
+        "pending_tool_calls": tool_calls,  # type: ignore[typeddict-item]
+        "tool_results": [],
+        "goal_achieved": False,
+        "goal_reason": "",
+        "iteration": 1,
+        "max_iterations": 10,
+        "hitl_enabled": False,
+        "model_name": "claude-sonnet-4-6",
+        "cwd": str(cwd),
+        "run_id": "act-test",
+        "total_tokens": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_act_node_preserves_call_order(tmp_path: Path):
+    (tmp_path / "a.txt").write_text("A")
+    (tmp_path / "b.txt").write_text("B")
+    calls = [
+        {"id": "1", "name": "file_read", "args": {"path": "a.txt"}},
+        {"id": "2", "name": "file_read", "args": {"path": "b.txt"}},
+        {"id": "3", "name": "file_write", "args": {"path": "a.txt", "content": "A2"}},
+        {"id": "4", "name": "file_read", "args": {"path": "a.txt"}},
+    ]
+    out = await act_node(_state(tmp_path, calls), {"configurable": {}})
+
+    assert [m.tool_call_id for m in out["messages"]] == ["1", "2", "3", "4"]
+    contents = [r["content"] for r in out["tool_results"]]
+    assert contents[0] == "A"
+    assert contents[1] == "B"
+    # The read after the write observes the new content
+    assert contents[3] == "A2"
+    assert out["pending_tool_calls"] == []
+
+
+@pytest.mark.asyncio
+async def test_act_node_runs_read_only_calls_concurrently(tmp_path: Path):
+    in_flight = 0
+    peak = 0
+
+    async def fake_dispatch(tool_name: str, args: dict, cwd: str) -> tuple[str, bool]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return "ok", False
+
+    calls = [{"id": str(i), "name": "file_read", "args": {"path": "x"}} for i in range(5)]
+    with patch.object(act, "_dispatch", fake_dispatch):
+        await act_node(_state(tmp_path, calls), {"configurable": {"tool_concurrency": 3}})
+
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_act_node_reports_unknown_tool_as_error(tmp_path: Path):
+    calls = [{"id": "1", "name": "no_such_tool", "args": {}}]
+    out = await act_node(_state(tmp_path, calls), {"configurable": {}})
+    assert out["tool_results"][0]["error"] is True
+
+
+@pytest.mark.asyncio
+async def test_act_node_caches_repeated_reads_until_write(tmp_path: Path):
+    calls_seen: list[str] = []
+    real_dispatch = act._dispatch
+
+    async def counting_dispatch(tool_name: str, args: dict, cwd: str) -> tuple[str, bool]:
+        calls_seen.append(tool_name)
+        return await real_dispatch(tool_name, args, cwd)
+
+    (tmp_path / "a.txt").write_text("A")
+    read = {"id": "r", "name": "file_read", "args": {"path": "a.txt"}}
+    state = _state(tmp_path, [read])
+    state["run_id"] = "act-cache-test"
+
+    with patch.object(act, "_dispatch", counting_dispatch):
+        await act_node(state, {"configurable": {}})
+        out = await act_node(state, {"configurable": {}})
+        assert out["tool_results"][0]["content"] == "A"
+        assert calls_seen == ["file_read"]
+
+        write = {"id": "w", "name": "file_write", "args": {"path": "a.txt", "content": "B"}}
+        state = _state(tmp_path, [write, read])
+        state["run_id"] = "act-cache-test"
+        out = await act_node(state, {"configurable": {}})
+
+    assert out["tool_results"][1]["content"] == "B"
+    assert calls_seen == ["file_read", "file_write", "file_read"]
+
+
+@pytest.mark.asyncio
+async def test_act_node_cache_sees_absolute_paths_and_outside_edits(tmp_path: Path):
+    target = tmp_path / "a.txt"
+    target.write_text("A")
+    read_abs = {"id": "r", "name": "file_read", "args": {"path": str(target)}}
+    read_rel = {"id": "r", "name": "file_read", "args": {"path": "a.txt"}}
+    write = {"id": "w", "name": "file_write", "args": {"path": "a.txt", "content": "BB"}}
+
+    async def run(calls: list[dict]) -> dict:
+        state = _state(tmp_path, calls)
+        state["run_id"] = "act-cache-stale-test"
+        return await act_node(state, {"configurable": {}})
+
+    await run([read_abs])
+    # A relative write invalidates the entry cached under the absolute path
+    out = await run([write, read_abs])
+    assert out["tool_results"][1]["content"] == "BB"
+
+    # An edit made outside the tools changes the stamp and forces a re-read
+    target.write_text("CCC")
+    out = await run([read_rel])
+    assert out["tool_results"][0]["content"] == "CCC"
+
+
+@pytest.mark.asyncio
+async def test_act_node_never_caches_run_pytest(tmp_path: Path):
+    calls_seen: list[str] = []
+
+    async def fake_dispatch(tool_name: str, args: dict, cwd: str) -> tuple[str, bool]:
+        calls_seen.append(tool_name)
+        return "{}", False
+
+    state = _state(tmp_path, [{"id": "p", "name": "run_pytest", "args": {}}])
+    state["run_id"] = "act-cache-pytest-test"
+    with patch.object(act, "_dispatch", fake_dispatch):
+        await act_node(state, {"configurable": {}})
+        await act_node(state, {"configurable": {}})
+
+    assert calls_seen == ["run_pytest", "run_pytest"]
+
+
+@pytest.mark.asyncio
+async def test_act_node_records_episodic_attempts(tmp_path: Path):
+    calls = [{"id": "1", "name": "file_read", "args": {"path": "missing.txt"}}]
+    out = await act_node(_state(tmp_path, calls), {"configurable": {}})
+
+    (summary,) = out["episodic"].values()
+    assert summary.startswith('file_read({"path": "missing.txt"}) -> ERR')
@@ -71,3 +71,27 @@ def test_state_messages_accept_various_types():
         ]
     )
     assert len(state["messages"]) == 3
+
+
+def test_merge_episodic_keeps_most_recent_entries():
+    from retrai.agent.state import MAX_EPISODIC, merge_episodic
+
+    merged = merge_episodic({}, {f"k{i}": f"v{i}" for i in range(MAX_EPISODIC)})
+    merged = merge_episodic(merged, {"k0": "again", "new": "entry"})
+
+    assert len(merged) == MAX_EPISODIC
+    assert "k1" not in merged
+    assert list(merged)[-2:] == ["k0", "new"]
+    assert merged["k0"] == "again"
+
+
+def test_initial_state_from_run_config():
+    from retrai.agent.state import initial_state
+    from retrai.config import RunConfig
+
+    cfg = RunConfig(goal="pytest", max_iterations=7, run_id="r1")
+    a, b = initial_state(cfg), initial_state(cfg)
+    assert a["iteration"] == 0 and a["max_iterations"] == 7 and a["run_id"] == "r1"
+    assert a["cwd"] == cfg.cwd
+    # Each run gets its own mutable containers
+    assert a["messages"] is not b["messages"]
@@ -0,0 +1,228 @@
+"""Tests for the CLI entry point."""
+
+from __future__ import annotations
+
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+import typer
+
+from retrai.cli.__main__ import STATIC_HELP
+from retrai.cli.app import app, register_commands
+
+
+def test_static_help_lists_every_command():
+    register_commands()
+    group = typer.main.get_command(app)
+    for name, command in group.commands.items():  # type: ignore[attr-defined]
+        summary = command.get_short_help_str(limit=200)
+        assert f"  {name}" in STATIC_HELP
+        assert summary in STATIC_HELP
+
+
+def test_help_does_not_import_typer():
+    code = (
+        "import sys\n"
+        "sys.argv = ['retrai', '--help']\n"
+        "from retrai.cli.__main__ import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit as e:\n"
+        "    assert e.code == 0\n"
+        "assert 'typer' not in sys.modules\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert "generate-eval" in result.stdout
+
+
+def test_load_dotenv_reads_env_from_cwd(tmp_path, monkeypatch):
+    from retrai.cli._common import _load_dotenv
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("RETRAI_TEST_DOTENV", raising=False)
+    _load_dotenv()
+    assert "RETRAI_TEST_DOTENV" not in os.environ
+
+    (tmp_path / ".env").write_text("RETRAI_TEST_DOTENV=1\n")
+    monkeypatch.setenv("RETRAI_SKIP_DOTENV", "1")
+    _load_dotenv()
+    assert "RETRAI_TEST_DOTENV" not in os.environ
+
+    monkeypatch.delenv("RETRAI_SKIP_DOTENV")
+    _load_dotenv()
+    assert os.environ["RETRAI_TEST_DOTENV"] == "1"
+
+
+def test_load_dotenv_prefers_project_dir(tmp_path, monkeypatch):
+    from retrai.cli._common import _load_dotenv
+
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / ".env").write_text("RETRAI_TEST_DOTENV_DIR=project\n")
+    (tmp_path / ".env").write_text("RETRAI_TEST_DOTENV_DIR=cwd\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("RETRAI_TEST_DOTENV_DIR", raising=False)
+    monkeypatch.delenv("RETRAI_SKIP_DOTENV", raising=False)
+
+    _load_dotenv(str(project))
+    assert os.environ["RETRAI_TEST_DOTENV_DIR"] == "project"
+    monkeypatch.delenv("RETRAI_TEST_DOTENV_DIR")
+
+
+def test_builtin_goals_are_registered():
+    from retrai.cli._common import _BUILTIN_GOALS
+    from retrai.goals.registry import list_goals
+
+    assert _BUILTIN_GOALS <= set(list_goals())
+
+
+def test_render_event_dispatches_by_kind(capsys):
+    from retrai.cli._cmd_run import _HANDLERS, _render_event
+    from retrai.events.types import AgentEvent
+
+    _render_event(AgentEvent(kind="step_start", run_id="r", iteration=2, payload={"node": "plan"}))
+    _render_event(AgentEvent(kind="log", run_id="r", iteration=2, payload={}))  # type: ignore[arg-type]
+    assert "[2] PLAN" in capsys.readouterr().out
+    assert "log" not in _HANDLERS
+
+
+def test_sniff_subcommand():
+    from retrai.cli.app import _sniff_subcommand
+
+    assert _sniff_subcommand(["generate-eval", "x"]) == "generate-eval"
+    assert _sniff_subcommand(["--help", "run"]) is None
+    assert _sniff_subcommand(["bogus"]) is None
+    assert _sniff_subcommand([]) is None
+
+
+def test_run_only_imports_its_own_command_module():
+    code = (
+        "import sys\n"
+        "sys.argv = ['retrai', 'run', '--help']\n"
+        "from retrai.cli.__main__ import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit as e:\n"
+        "    assert e.code == 0\n"
+        "assert 'retrai.cli._cmd_run' in sys.modules\n"
+        "assert 'retrai.cli._cmd_serve' not in sys.modules\n"
+        "assert 'retrai.cli._cmd_tui' not in sys.modules\n"
+        "for heavy in ('retrai.config', 'langgraph', 'litellm', 'yaml', 'dotenv'):\n"
+        "    assert heavy not in sys.modules, heavy\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert "--max-iter" in result.stdout
+
+
+class _CountingFile(io.StringIO):
+    writes = 0
+
+    def write(self, s: str) -> int:
+        self.writes += 1
+        return super().write(s)
+
+
+@pytest.mark.parametrize("is_tty, expected_writes", [(False, 1), (True, 3)])
+def test_render_worker_coalesces_writes_when_piped(monkeypatch, is_tty, expected_writes):
+    import queue
+
+    from rich.console import Console
+
+    from retrai.cli import _cmd_run
+    from retrai.events.types import AgentEvent
+
+    out = _CountingFile()
+    console = Console(file=out, force_terminal=is_tty, width=80)
+    monkeypatch.setattr(_cmd_run, "_console", lambda: console)
+
+    render_q: queue.Queue = queue.Queue()
+    for i in range(3):
+        event = AgentEvent(kind="step_start", run_id="r", iteration=i, payload={"node": "plan"})
+        render_q.put([event])
+    render_q.put(None)
+    _cmd_run._render_worker(render_q, [])
+
+    assert out.writes == expected_writes
+    assert out.getvalue().count("PLAN") == 3
+
+
+@pytest.mark.parametrize(
+    "raw, expected, warned",
+    [(None, 8, False), ("4", 4, False), ("abc", 8, True), ("0", 8, True), ("-2", 8, True)],
+)
+def test_pool_size_falls_back_on_invalid_values(raw, expected, warned):
+    from rich.console import Console
+
+    from retrai.cli._cmd_run import _pool_size
+
+    out = io.StringIO()
+    assert _pool_size(Console(file=out, width=200), raw) == expected
+    assert ("Ignoring RETRAI_POOL" in out.getvalue()) is warned
+
+
+def test_render_worker_records_error_and_keeps_draining(monkeypatch):
+    import queue
+
+    from retrai.cli import _cmd_run
+    from retrai.events.types import AgentEvent
+
+    def broken_pipe(event):
+        raise BrokenPipeError
+
+    monkeypatch.setattr(_cmd_run, "_render_event", broken_pipe)
+
+    render_q: queue.Queue = queue.Queue()
+    event = AgentEvent(kind="step_start", run_id="r", iteration=0, payload={"node": "plan"})
+    for _ in range(3):
+        render_q.put([event])
+    render_q.put(None)
+    errors: list[Exception] = []
+    _cmd_run._render_worker(render_q, errors)
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], BrokenPipeError)
+    assert render_q.empty()
+
+
+def test_put_render_gives_up_when_render_thread_is_dead():
+    import queue
+    import threading
+
+    from retrai.cli._cmd_run import _put_render
+
+    render_q: queue.Queue = queue.Queue(maxsize=1)
+    render_q.put([])
+    dead = threading.Thread(target=lambda: None)
+    dead.start()
+    dead.join()
+
+    assert _put_render(render_q, None, dead) is False
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"goal": "pytest", "model": "gpt-4o", "max_iterations": 20, "hitl_enabled": False},
+        {"model": "ollama/llama3:8b", "goal": "yes", "x": "", "y": " lead", "z": "1e3"},
+        {"model": 'quote"d # not a comment', "n": None, "u": "ü"},
+        {"nested": {"a": 1}, "f": 1.5},
+    ],
+)
+def test_dump_yaml_round_trips(config):
+    import yaml
+
+    from retrai.cli._common import _dump_yaml
+
+    assert yaml.safe_load(_dump_yaml(config)) == config
+
+
+def test_fmt_args_bounds_long_values():
+    from retrai.cli._cmd_run import _fmt_args
+
+    out = _fmt_args({"path": "a.py", "content": "x" * 500, "items": list(range(100))})
+    assert out.startswith("path='a.py', content='" + "x" * 80 + "'…, items=[0, 1, 2, 3, 4, ...]")
@@ -1,11 +1,11 @@
-"""Tests for RunConfig."""
+"""Tests for RunConfig and load_config."""
 
 from __future__ import annotations
 
 import uuid
 from pathlib import Path
 
-from retrai.config import RunConfig
+from retrai.config import RunConfig, load_config
 
 
 def test_default_values():
@@ -49,3 +49,27 @@ def test_custom_model():
 def test_max_iterations_respected():
     cfg = RunConfig(goal="pytest", max_iterations=5)
     assert cfg.max_iterations == 5
+
+
+def test_load_config_missing_file(tmp_path: Path):
+    assert load_config(str(tmp_path)) is None
+
+
+def test_load_config_returns_copies_and_sees_edits(tmp_path: Path):
+    path = tmp_path / ".retrai.yml"
+    path.write_text("goal: pytest\nmax_iterations: 5\n")
+
+    first = load_config(str(tmp_path))
+    assert first is not None
+    assert first == {"goal": "pytest", "max_iterations": 5}
+    first["goal"] = "mutated"
+    assert load_config(str(tmp_path)) == {"goal": "pytest", "max_iterations": 5}
+
+    path.write_text("goal: pyright\nmax_iterations: 50\n")
+    assert load_config(str(tmp_path)) == {"goal": "pyright", "max_iterations": 50}
+
+
+def test_provider_names_match_provider_models():
+    from retrai.config import PROVIDER_NAMES, get_provider_models
+
+    assert PROVIDER_NAMES == tuple(get_provider_models())
@@ -0,0 +1,39 @@
+"""Tests for the evaluate node helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from retrai.agent.nodes.evaluate import _truncate_details, evaluate_node
+
+
+def test_truncate_details_returns_original_when_short():
+    details = {"a": "x" * 10, "nested": {"b": "y"}, "n": 3}
+    assert _truncate_details(details, max_len=20) is details
+
+
+def test_truncate_details_copies_only_changed_path():
+    untouched = {"c": "short"}
+    details = {"nested": {"b": "y" * 50}, "other": untouched, "a": "z" * 50}
+    out = _truncate_details(details, max_len=10)
+
+    assert out["a"] == "z" * 10 + "..."
+    assert out["nested"]["b"] == "y" * 10 + "..."
+    assert out["other"] is untouched
+    # Input is not mutated
+    assert details["a"] == "z" * 50
+    assert details["nested"]["b"] == "y" * 50
+
+
+@pytest.mark.asyncio
+async def test_evaluate_without_goal_only_counts_iteration():
+    state = {"run_id": "r", "iteration": 0, "max_iterations": 2, "cwd": "."}
+    out = await evaluate_node(state, {"configurable": {}})  # type: ignore[arg-type]
+    assert out == {"iteration": 1}
+
+    state["iteration"] = 1
+    out = await evaluate_node(state, {"configurable": {}})  # type: ignore[arg-type]
+    assert out["goal_reason"].startswith("Max iterations (2) reached.")
+
+    out = await evaluate_node(state, {"configurable": {"skip_goal_noop": False}})  # type: ignore[arg-type]
+    assert out["messages"]
@@ -116,6 +116,15 @@ async def test_unsubscribe_stops_delivery():
     await bus.close()
 
 
+@pytest.mark.asyncio
+async def test_unsubscribe_unknown_queue_raises():
+    bus = AsyncEventBus()
+    q = await bus.subscribe()
+    await bus.unsubscribe(q)
+    with pytest.raises(ValueError):
+        await bus.unsubscribe(q)
+
+
 @pytest.mark.asyncio
 async def test_publish_multiple_events_in_order():
     bus = AsyncEventBus()
@@ -129,3 +138,71 @@ async def test_publish_multiple_events_in_order():
         received.append(e.iteration)
 
     assert received == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_publish_many_fans_out_in_order():
+    bus = AsyncEventBus()
+    q1 = await bus.subscribe()
+    q2 = await bus.subscribe()
+    events = [AgentEvent(kind="log", run_id="r", iteration=i, payload={}) for i in range(3)]
+    await bus.publish_many(events)
+    await bus.close()
+
+    for q in (q1, q2):
+        received = [e.iteration async for e in bus.iter_events(q)]
+        assert received == [0, 1, 2]
+
+
+def test_agent_event_uses_slots():
+    event = AgentEvent(kind="log", run_id="r", iteration=0, payload={})
+    assert not hasattr(event, "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_full_subscriber_drops_oldest_events():
+    bus = AsyncEventBus()
+    q = await bus.subscribe(maxsize=2)
+    events = [AgentEvent(kind="log", run_id="r", iteration=i, payload={}) for i in range(3)]
+    await bus.publish_many(events)
+    await bus.close()
+
+    assert bus.dropped(q) == 2
+    # The newest event and the close sentinel always get through
+    assert [q.get_nowait(), q.get_nowait()] == [events[2], None]
+
+
+@pytest.mark.asyncio
+async def test_event_is_encoded_once_for_all_subscribers(monkeypatch):
+    from retrai.utils import jsonx
+
+    calls = []
+    real_dumps = jsonx.dumps
+    monkeypatch.setattr(jsonx, "dumps", lambda obj: calls.append(obj) or real_dumps(obj))
+
+    bus = AsyncEventBus()
+    q1, q2 = await bus.subscribe(), await bus.subscribe()
+    event = AgentEvent(kind="log", run_id="r", iteration=0, payload={"msg": "hi"})
+    await bus.publish(event)
+    # Publishing never encodes; only consumers that need JSON pay for it
+    assert calls == []
+
+    received = [q1.get_nowait(), q2.get_nowait()]
+    assert received[0] is not None and received[1] is not None
+    texts = [received[0].to_json(), received[1].to_json()]
+    assert len(calls) == 1
+    assert texts[0] is texts[1]
+    assert jsonx.loads(texts[0]) == event.to_dict()
+
+
+@pytest.mark.asyncio
+async def test_publish_accepts_unserializable_payloads():
+    from decimal import Decimal
+
+    bus = AsyncEventBus()
+    q = await bus.subscribe()
+    event = AgentEvent(kind="goal_check", run_id="r", iteration=0, payload={"d": Decimal(1)})
+    await bus.publish(event)
+    assert q.get_nowait() is event
+    with pytest.raises(TypeError):
+        event.to_json()
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import subprocess
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from retrai.goals.ai_eval import AiEvalGoal
 from retrai.goals.base import GoalBase, GoalResult
+from retrai.goals.detector import detect_goal
 from retrai.goals.perf_goal import PerfCheckGoal
 from retrai.goals.pytest_goal import PytestGoal, _extract_failures
 from retrai.goals.registry import get_goal, list_goals
@@ -46,6 +47,14 @@ def test_get_goal_returns_correct_instance():
     assert isinstance(g, PytestGoal)
 
 
+def test_every_registered_goal_resolves_to_its_name():
+    for name in list_goals():
+        goal = get_goal(name)
+        assert isinstance(goal, GoalBase)
+        assert goal.name == name
+        assert get_goal(name) is goal
+
+
 def test_get_goal_raises_for_unknown():
     with pytest.raises(KeyError, match="Unknown goal"):
         get_goal("nonexistent-goal-xyz")
@@ -67,15 +76,16 @@ async def test_pytest_goal_fails_on_failing_project(failing_project: Path):
     goal = PytestGoal()
     result = await goal.check({}, str(failing_project))
     assert result.achieved is False
+    assert "report" not in result.details
     assert "failed" in result.reason.lower() or "1" in result.reason
 
 
 @pytest.mark.asyncio
 async def test_pytest_goal_handles_timeout(tmp_path: Path):
     goal = PytestGoal()
-    # Patch subprocess.run to raise TimeoutExpired
-    with patch("retrai.goals.pytest_goal.subprocess.run") as mock_run:
-        mock_run.side_effect = subprocess.TimeoutExpired(cmd="pytest", timeout=120)
+    # Patch the subprocess helper to raise TimeoutError
+    with patch("retrai.goals.pytest_goal.run") as mock_run:
+        mock_run.side_effect = TimeoutError
         result = await goal.check({}, str(tmp_path))
     assert result.achieved is False
     assert "timed out" in result.reason.lower()
@@ -84,7 +94,7 @@ async def test_pytest_goal_handles_timeout(tmp_path: Path):
 @pytest.mark.asyncio
 async def test_pytest_goal_handles_missing_pytest(tmp_path: Path):
     goal = PytestGoal()
-    with patch("retrai.goals.pytest_goal.subprocess.run") as mock_run:
+    with patch("retrai.goals.pytest_goal.run") as mock_run:
         mock_run.side_effect = FileNotFoundError("pytest not found")
         result = await goal.check({}, str(tmp_path))
     assert result.achieved is False
@@ -112,6 +122,12 @@ def test_extract_failures_with_data():
     assert failures[0]["longrepr"] == "AssertionError"
 
 
+def test_extract_failures_is_capped():
+    report = {"tests": [{"nodeid": f"t::{i}", "outcome": "failed"} for i in range(60)]}
+    assert len(_extract_failures(report)) == 50
+    assert _extract_failures(report, limit=3)[-1]["nodeid"] == "t::2"
+
+
 def test_pytest_goal_system_prompt_contains_strategy():
     goal = PytestGoal()
     prompt = goal.system_prompt()
@@ -177,6 +193,27 @@ async def test_shell_goal_max_seconds_too_slow(tmp_path: Path):
     assert "slow" in result.reason.lower() or "s" in result.reason
 
 
+@pytest.mark.asyncio
+async def test_shell_goal_output_regex_is_multiline(tmp_path: Path):
+    (tmp_path / ".retrai.yml").write_text(
+        "goal: shell-goal\ncheck_command: 'printf \"x\\nOK 3\\n\"'\n"
+        "success_condition:\n  output_regex: '^OK \\d+$'\n"
+    )
+    goal = ShellGoal()
+    assert (await goal.check({}, str(tmp_path))).achieved is True
+
+
+@pytest.mark.asyncio
+async def test_shell_goal_failure_reports_output_head(tmp_path: Path):
+    (tmp_path / ".retrai.yml").write_text(
+        "goal: shell-goal\ncheck_command: 'yes x | head -c 100000; exit 1'\n"
+    )
+    goal = ShellGoal()
+    result = await goal.check({}, str(tmp_path))
+    assert result.achieved is False
+    assert result.details["stdout"] == "x\n" * 1500
+
+
 def test_shell_goal_system_prompt_no_config(tmp_path: Path):
     goal = ShellGoal()
     prompt = goal.system_prompt(str(tmp_path))
@@ -230,6 +267,27 @@ async def test_perf_goal_nonzero_exit_fails(tmp_path: Path):
     assert "code 1" in result.reason or "exit" in result.reason.lower()
 
 
+def test_goal_config_cache_sees_edits(tmp_path: Path):
+    from retrai.config import load_goal_config
+
+    path = tmp_path / ".retrai.yml"
+    path.write_text("check_command: 'echo a'\n")
+    first = load_goal_config(str(tmp_path))
+    assert first == {"check_command": "echo a"}
+    # Callers get copies, so a mutation cannot leak into later checks
+    first["check_command"] = "mutated"
+    assert load_goal_config(str(tmp_path)) == {"check_command": "echo a"}
+
+    path.write_text("check_command: 'echo bb'\n")
+    assert load_goal_config(str(tmp_path)) == {"check_command": "echo bb"}
+    path.write_text("- not\n- a mapping\n")
+    assert load_goal_config(str(tmp_path)) == {}
+    path.write_text("check_command: [unclosed\n")
+    assert load_goal_config(str(tmp_path)) == {}
+    path.unlink()
+    assert load_goal_config(str(tmp_path)) == {}
+
+
 # ── SqlBenchmarkGoal ──────────────────────────────────────────────────────────
 
 
@@ -264,3 +322,279 @@ async def test_sql_goal_sqlite_too_slow(tmp_path: Path):
     result = await goal.check({}, str(tmp_path))
     assert result.achieved is False
     assert "ms" in result.reason
+
+
+@pytest.mark.asyncio
+async def test_sql_goal_reuses_engine_per_dsn(tmp_path: Path):
+    pytest.importorskip("sqlalchemy")
+    from retrai.goals.sql_goal import _engine_for
+
+    db_path = tmp_path / "test.db"
+    (tmp_path / ".retrai.yml").write_text(
+        f"goal: sql-benchmark\ndsn: 'sqlite:///{db_path}'\nquery: 'SELECT 1'\nmax_ms: 5000\n"
+    )
+    goal = SqlBenchmarkGoal()
+    await goal.check({}, str(tmp_path))
+    engine = _engine_for(f"sqlite:///{db_path}")
+    assert (await goal.check({}, str(tmp_path))).achieved is True
+    assert _engine_for(f"sqlite:///{db_path}") is engine
+
+
+@pytest.mark.asyncio
+async def test_sql_goal_async_driver(tmp_path: Path):
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("greenlet")
+    db_path = tmp_path / "test.db"
+    (tmp_path / ".retrai.yml").write_text(
+        f"goal: sql-benchmark\ndsn: 'sqlite+aiosqlite:///{db_path}'\n"
+        "query: 'SELECT 1 UNION ALL SELECT 2'\nmax_ms: 5000\nexpected_rows: 2\n"
+    )
+    goal = SqlBenchmarkGoal()
+    result = await goal.check({}, str(tmp_path))
+    assert result.achieved is True, result.reason
+
+
+# ── AiEvalGoal ────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_ai_eval_goal_reads_json_report(tmp_path: Path):
+    retrai_dir = tmp_path / ".retrai"
+    retrai_dir.mkdir()
+    (retrai_dir / "eval_harness.py").write_text("def test_x():\n    assert False\n")
+    report = (
+        '{"summary": {"failed": 1, "total": 1}, "tests": [{"nodeid": "h::test_x", '
+        '"outcome": "failed", "call": {"longrepr": "assert False"}}]}'
+    )
+
+    from retrai.goals._subprocess import RunResult
+
+    async def fake_run(cmd, cwd, *, timeout):
+        (retrai_dir / ".eval_report.json").write_text(report)
+        return RunResult(returncode=1, stdout="", stderr="")
+
+    with patch("retrai.goals.ai_eval.run", side_effect=fake_run):
+        result = await AiEvalGoal().check({}, str(tmp_path))
+    assert result.achieved is False
+    assert "1 eval test(s) failed out of 1" in result.reason
+    assert result.details["failures"][0]["nodeid"] == "h::test_x"
+
+
+@pytest.mark.asyncio
+async def test_ai_eval_goal_handles_timeout(tmp_path: Path):
+    retrai_dir = tmp_path / ".retrai"
+    retrai_dir.mkdir()
+    (retrai_dir / "eval_harness.py").write_text("def test_x():\n    pass\n")
+    with patch("retrai.goals.ai_eval.run", side_effect=TimeoutError):
+        result = await AiEvalGoal().check({}, str(tmp_path))
+    assert result.achieved is False
+    assert result.details == {"error": "timeout"}
+
+
+def test_ai_eval_config_is_reread_after_edit(tmp_path: Path):
+    retrai_dir = tmp_path / ".retrai"
+    retrai_dir.mkdir()
+    config = retrai_dir / "ai_eval_config.json"
+    goal = AiEvalGoal()
+    assert goal._load_config(str(tmp_path)) == {}
+
+    config.write_text('{"description": "sort faster"}')
+    assert "sort faster" in goal.system_prompt(str(tmp_path))
+    config.write_text('{"description": "parse faster!"}')
+    assert "parse faster!" in goal.system_prompt(str(tmp_path))
+
+
+# ── detect_goal ───────────────────────────────────────────────────────────────
+
+
+def test_detect_goal_sees_marker_edits(tmp_path: Path):
+    assert detect_goal(str(tmp_path)) is None
+
+    (tmp_path / "Cargo.toml").write_text("[package]\n")
+    assert detect_goal(str(tmp_path)) == "cargo-test"
+
+    # Editing a content marker in place must invalidate the memoized result
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("[project]\n")
+    assert detect_goal(str(tmp_path)) == "cargo-test"
+    pyproject.write_text("[tool.pyright]\nstrict = []\n")
+    assert detect_goal(str(tmp_path)) == "pyright"
+
+
+def test_detect_goal_missing_dir(tmp_path: Path):
+    assert detect_goal(str(tmp_path / "nope")) is None
+
+
+@pytest.mark.parametrize(
+    ("makefile", "expected"),
+    [
+        ("build:\n\tcc x.c\ntest: build\n\t./x\n", "make-test"),
+        ("  test :\n\t./x\n", "make-test"),
+        ("tests:\n\t./x\n# test: disabled\n", None),
+    ],
+)
+def test_detect_goal_make_test_target(tmp_path: Path, makefile: str, expected: str | None):
+    (tmp_path / "Makefile").write_text(makefile)
+    assert detect_goal(str(tmp_path)) == expected
+
+
+@pytest.mark.parametrize(
+    ("package_json", "expected"),
+    [
+        ('{"devDependencies": {"vitest": "^1.0.0"}}', "npm-test"),
+        ('{"scripts": {"test": "Mocha --recursive"}}', "npm-test"),
+        ('{"dependencies": {"react": "^18.0.0"}, "scripts": {"test": "tap"}}', None),
+        ('{"scripts": {"lint": "jest-lint"}}', None),
+        ("{not json jest", None),
+    ],
+)
+def test_detect_goal_npm_runner(tmp_path: Path, package_json: str, expected: str | None):
+    (tmp_path / "package.json").write_text(package_json)
+    assert detect_goal(str(tmp_path)) == expected
+
+
+# ── BunTestGoal ───────────────────────────────────────────────────────────────
+
+
+def test_extract_bun_failures_filters_failure_lines():
+    from retrai.goals.bun_goal import _extract_bun_failures
+
+    output = "✓ adds\n  ✗ subtracts [0.1ms]\n(fail) divides\nFAIL src/x.test.ts\n× multiplies\n"
+    assert _extract_bun_failures(output) == [
+        "✗ subtracts [0.1ms]",
+        "FAIL src/x.test.ts",
+        "× multiplies",
+    ]
+    failures = _extract_bun_failures("FAIL a\n" * 15, "FAIL b\n" * 15)
+    assert failures == ["FAIL a"] * 15 + ["FAIL b"] * 5
+
+
+# ── Streaming subprocess helper ───────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_stream_lines_feeds_lines_and_keeps_heads(tmp_path: Path):
+    import sys
+
+    from retrai.goals._subprocess import stream_lines
+
+    script = "import sys\nfor i in range(1000): print(i)\nsys.stderr.write('e' * 5000)\nsys.exit(3)"
+    lines: list[bytes] = []
+    result = await stream_lines(
+        [sys.executable, "-c", script],
+        str(tmp_path),
+        timeout=30,
+        on_line=lines.append,
+        stdout_head=10,
+        stderr_head=4,
+    )
+    assert result.returncode == 3
+    assert len(lines) == 1000 and lines[-1] == b"999\n"
+    assert result.stdout_head == "0\n1\n2\n3\n4\n"
+    assert result.stderr_head == "eeee"
+
+
+@pytest.mark.asyncio
+async def test_stream_lines_skips_over_long_lines(tmp_path: Path, monkeypatch):
+    import sys
+
+    from retrai.goals import _subprocess
+
+    monkeypatch.setattr(_subprocess, "_LINE_LIMIT", 64)
+    script = "import sys\nsys.stdout.write('a\\n' + 'x' * 1000 + '\\nb\\n' + 'y' * 500)"
+    lines: list[bytes] = []
+    result = await _subprocess.stream_lines(
+        [sys.executable, "-c", script], str(tmp_path), timeout=30, on_line=lines.append
+    )
+    assert result.returncode == 0
+    assert lines == [b"a\n", b"b\n"]
+
+
+@pytest.mark.asyncio
+async def test_stream_lines_kills_on_timeout(tmp_path: Path):
+    import sys
+
+    from retrai.goals._subprocess import stream_lines
+
+    with pytest.raises(TimeoutError):
+        await stream_lines(
+            [sys.executable, "-c", "import time; time.sleep(30)"],
+            str(tmp_path),
+            timeout=0.5,
+            on_line=lambda line: None,
+        )
+
+
+@pytest.mark.asyncio
+async def test_run_capped_shell_command_keeps_heads(tmp_path: Path):
+    from retrai.goals._subprocess import run_capped
+
+    result = await run_capped(
+        "python -c \"print('x' * 100000)\"; echo err >&2",
+        str(tmp_path),
+        timeout=30,
+        stdout_head=5,
+        stderr_head=2,
+    )
+    assert result.returncode == 0
+    assert result.stdout_head == "xxxxx"
+    assert result.stderr_head == "er"
+
+
+@pytest.mark.asyncio
+async def test_run_returns_full_output(tmp_path: Path):
+    import sys
+
+    from retrai.goals._subprocess import run
+
+    script = "import sys\nprint('x' * 100000)\nsys.stderr.write('err')\nsys.exit(2)"
+    result = await run([sys.executable, "-c", script], str(tmp_path), timeout=30)
+    assert result.returncode == 2
+    assert result.stdout == "x" * 100000 + "\n"
+    assert result.stderr == "err"
+
+
+def test_cargo_and_go_failure_lines():
+    from retrai.goals.cargo_goal import _cargo_failure
+    from retrai.goals.go_goal import _go_failure
+
+    assert _cargo_failure(b'{"type":"test","event":"failed","name":"t","stdout":"boom"}\n') == {
+        "name": "t",
+        "stdout": "boom",
+    }
+    assert _cargo_failure(b'{"type":"test","event":"ok","name":"t"}\n') is None
+    assert _cargo_failure(b"   Compiling foo v0.1.0\n") is None
+    assert _cargo_failure(b'{ "type": "test", "name": "t", "event": "failed" }\n') == {
+        "name": "t",
+        "stdout": "",
+    }
+    assert _cargo_failure(b'{"reason":"compiler-message","rendered":"\\"failed\\""}\n') is None
+    assert _go_failure(b'{"Action":"fail","Package":"p","Test":"TestX","Elapsed":0.1}\n') == {
+        "package": "p",
+        "test": "TestX",
+        "elapsed": 0.1,
+    }
+    assert _go_failure(b'{"Action":"fail","Package":"p"}\n') is None
+
+
+def test_detect_goal_cache_is_bounded(tmp_path: Path):
+    from retrai.goals import detector
+
+    for i in range(detector._MAX_CACHED_DIRS + 5):
+        d = tmp_path / str(i)
+        d.mkdir()
+        detect_goal(str(d))
+    assert len(detector._detect_cache) == detector._MAX_CACHED_DIRS
+    assert str(tmp_path / "0") not in detector._detect_cache
+
+
+def test_planner_py_sources_prune_skipped_dirs(tmp_path: Path):
+    from retrai.goals.planner import _iter_py_sources
+
+    files = ["app.py", "test_app.py", "pkg/core.py", "node_modules/x/vendored.py", ".venv/lib.py"]
+    for rel in files:
+        f = tmp_path / rel
+        f.parent.mkdir(parents=True, exist_ok=True)
+        f.write_text("")
+    found = [p.relative_to(tmp_path).as_posix() for p in _iter_py_sources(tmp_path)]
+    assert found == ["app.py", "pkg/core.py"]
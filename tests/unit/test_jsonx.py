@@ -0,0 +1,42 @@
+"""Tests for the orjson-backed JSON helpers."""
+
+from __future__ import annotations
+
+import json
+import math
+
+import pytest
+
+from retrai.utils import jsonx
+
+
+def test_dumps_round_trips_and_matches_json():
+    obj = {"b": [1, 2.5, None], "a": "ü", "nested": {"x": True}}
+    assert jsonx.loads(jsonx.dumps(obj)) == obj
+    assert json.loads(jsonx.dumps(obj, indent=True)) == obj
+    assert jsonx.loads(jsonx.dumps(obj).encode()) == obj
+
+
+def test_dumps_falls_back_for_big_ints():
+    assert jsonx.loads(jsonx.dumps({"n": 2**70})) == {"n": 2**70}
+
+
+def test_loads_accepts_nan_and_infinity():
+    out = jsonx.loads(b'{"duration": NaN, "max": Infinity}')
+    assert math.isnan(out["duration"])
+    assert out["max"] == math.inf
+
+
+def test_loads_raises_json_decode_error():
+    with pytest.raises(jsonx.JSONDecodeError):
+        jsonx.loads("{not json")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_serializes_agent_events(monkeypatch, use_orjson):
+    from retrai.events.types import AgentEvent
+
+    if not use_orjson:
+        monkeypatch.setattr(jsonx, "orjson", None)
+    event = AgentEvent(kind="log", run_id="r", iteration=1, payload={"msg": "hi"}, ts=1.5)
+    assert jsonx.loads(jsonx.dumps(event)) == event.to_dict()
@@ -0,0 +1,105 @@
+"""Tests for the plan node."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from retrai.agent.nodes.plan import plan_node
+from retrai.agent.state import AgentState
+
+
+def _state(cwd: Path) -> AgentState:
+    return {
+        "messages": [],
+        "pending_tool_calls": [],
+        "tool_results": [],
+        "goal_achieved": False,
+        "goal_reason": "",
+        "iteration": 1,
+        "max_iterations": 10,
+        "hitl_enabled": False,
+        "model_name": "plan-test-model",
+        "cwd": str(cwd),
+        "run_id": "plan-test",
+        "total_tokens": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_plan_node_binds_tools_once_per_model(tmp_path: Path):
+    llm = MagicMock()
+    llm.bind_tools = MagicMock(return_value=llm)
+    llm.ainvoke = AsyncMock(return_value=AIMessage(content="done"))
+
+    with patch("retrai.agent.nodes.plan.get_llm", return_value=llm):
+        await plan_node(_state(tmp_path), {"configurable": {}})
+        await plan_node(_state(tmp_path), {"configurable": {}})
+
+    assert llm.bind_tools.call_count == 1
+    assert llm.ainvoke.await_count == 2
+
+
+def test_system_prompt_passes_cwd_only_when_accepted(tmp_path: Path):
+    from retrai.agent.nodes.plan import _build_system_prompt
+
+    class NoArgs:
+        def system_prompt(self) -> str:
+            return "no-args goal"
+
+    class WithCwd:
+        def system_prompt(self, cwd: str) -> str:
+            return f"goal for {cwd}"
+
+    state = _state(tmp_path)
+    for _ in range(2):
+        assert "no-args goal" in _build_system_prompt(NoArgs(), state)
+        assert f"goal for {tmp_path}" in _build_system_prompt(WithCwd(), state)
+
+
+@pytest.mark.asyncio
+async def test_prepare_messages_summarizes_old_turns_once():
+    from langchain_core.messages import HumanMessage, ToolMessage
+
+    from retrai.agent.nodes.plan import _prepare_messages
+
+    summarizer = MagicMock()
+    summarizer.ainvoke = AsyncMock(return_value=AIMessage(content="earlier work"))
+
+    history: list = []
+    for i in range(25):
+        ai = AIMessage(content=f"step {i}", id=f"ai-{i}")
+        ai.tool_calls = [{"id": f"t{i}", "name": "file_read", "args": {"path": "x"}}]
+        history += [ai, ToolMessage(content="ok", tool_call_id=f"t{i}", id=f"tm-{i}")]
+
+    with patch("retrai.agent.nodes.plan.get_llm", return_value=summarizer):
+        out = await _prepare_messages(history, "summary-test-model")
+        assert isinstance(out[0], HumanMessage)
+        assert "earlier work" in out[0].content
+        assert not isinstance(out[1], ToolMessage)
+        assert len(out) < len(history)
+
+        # One more message inside the same block reuses the cached summary
+        history.append(HumanMessage(content="status", id="h-final"))
+        await _prepare_messages(history, "summary-test-model")
+
+    assert summarizer.ainvoke.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_plan_node_shows_recent_attempts(tmp_path: Path):
+    llm = MagicMock()
+    llm.bind_tools = MagicMock(return_value=llm)
+    llm.ainvoke = AsyncMock(return_value=AIMessage(content="done"))
+    state = _state(tmp_path)
+    state["episodic"] = {"k": "bash_exec(make) -> ERR: no rule"}
+
+    with patch("retrai.agent.nodes.plan.get_llm", return_value=llm):
+        await plan_node(state, {"configurable": {}})
+
+    sent = llm.ainvoke.await_args.args[0]
+    assert "## Recent attempts" in sent[0].content
+    assert "bash_exec(make) -> ERR: no rule" in sent[0].content
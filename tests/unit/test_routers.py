@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from retrai.agent.routers import (
     route_after_evaluate,
     route_after_human_check,
@@ -86,3 +88,40 @@ def test_route_after_human_check_continues():
 def test_route_after_human_check_max_iter():
     state = _state(iteration=10, max_iterations=10)
     assert route_after_human_check(state) == "end"
+
+
+def test_route_after_human_check_aborted():
+    state = _state(iteration=3, max_iterations=10, aborted=True)
+    assert route_after_human_check(state) == "end"
+
+
+# ── human_check_node ──────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("decision", "aborted"),
+    [(True, False), ("approve", False), ("abort", True), (False, True), ({"x": 1}, True)],
+)
+async def test_human_check_node_decision(decision, aborted):
+    from unittest.mock import patch
+
+    from retrai.agent.nodes.human_check import human_check_node
+
+    with patch("retrai.agent.nodes.human_check.interrupt", return_value=decision):
+        out = await human_check_node(_state(), {"configurable": {}})
+    assert out.get("aborted", False) is aborted
+
+
+# ── wiring ────────────────────────────────────────────────────────────────────
+
+
+def test_graph_binds_canonical_routers():
+    from pathlib import Path
+
+    import retrai.agent.graph as graph_module
+    import retrai.agent.routers as routers_module
+
+    assert Path(routers_module.__file__).parent == Path(graph_module.__file__).parent
+    for name in ("should_call_tools", "route_after_evaluate", "route_after_human_check"):
+        assert getattr(graph_module, name) is getattr(routers_module, name)
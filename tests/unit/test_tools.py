@@ -182,3 +182,15 @@ def test_pytest_runner_timed_out(tmp_path: Path, monkeypatch):
     result = run_pytest(str(tmp_path))
     assert result.timed_out is True
     assert result.exit_code == -1
+
+
+def test_pytest_runner_caps_output_and_failures(failing_project: Path):
+    (failing_project / "tests" / "test_more.py").write_text(
+        "def test_a():\n    assert False\n\ndef test_b():\n    assert False\n"
+    )
+    full = run_pytest(str(failing_project))
+    capped = run_pytest(str(failing_project), stdout_cap=50, max_failures=1)
+
+    assert capped.stdout == full.stdout[:50]
+    assert len(capped.failures) == 1
+    assert capped.failed == full.failed